@@ -0,0 +1,16 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Benchmarks
+    ==========
+
+    Performance measurement scripts, to be run from repository root
+    as modules, for instance :
+
+    .. code-block:: bash
+
+        python -m benchmarks.bench_idle_loop
+"""
+
+__author__ = "Felix Voituret"
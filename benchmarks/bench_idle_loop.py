@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Idle loop benchmark
+    ===================
+
+    Measures the CPU time consumed by the ScreenFlow main loop for each
+    second spent displaying a static MessageScreen, comparing the legacy
+    busy loop (``IDLE_POLL`` without frame rate cap) with the event driven
+    ``IDLE_WAIT`` mode.
+
+    .. code-block:: bash
+
+        python -m benchmarks.bench_idle_loop --duration 5
+
+    Rendering uses a headless screenflow, backed by SDL dummy video driver.
+"""
+
+import os
+import argparse
+import threading
+
+import pygame
+from pygame.constants import QUIT
+from pygame.event import Event, post
+from screenflow.screenflow import ScreenFlow
+from screenflow.screens.message_screen import MessageScreen
+from benchmarks.common import create_flow
+
+# Resolution used for benchmark surface.
+RESOLUTION = (800, 480)
+
+# Benchmarked configurations as (label, idle mode, max fps) tuples.
+CONFIGURATIONS = (
+    ('poll (uncapped)', ScreenFlow.IDLE_POLL, 0),
+    ('poll (60 fps)', ScreenFlow.IDLE_POLL, 60),
+    ('wait', ScreenFlow.IDLE_WAIT, 60))
+
+
+def cpu_time():
+    """Returns CPU time (user and system) consumed by current process.
+
+    :returns: Consumed CPU time in seconds.
+    """
+    times = os.times()
+    return times[0] + times[1]
+
+
+def measure(idle_mode, max_fps, duration):
+    """Runs a screenflow displaying a static message during the given
+    duration and measures consumed CPU time.
+
+    :param idle_mode: Idle mode to use.
+    :param max_fps: Frame rate cap to use.
+    :param duration: Duration of the measure in seconds.
+    :returns: CPU seconds consumed per idle second.
+    """
+    screenflow = create_flow(RESOLUTION, max_fps=max_fps, idle_mode=idle_mode)
+    screen = MessageScreen('idle', 'Nothing happens here')
+    screenflow.add_screen(screen)
+    timer = threading.Timer(duration, lambda: post(Event(QUIT)))
+    timer.start()
+    start_cpu = cpu_time()
+    start = pygame.time.get_ticks()
+    screenflow.run(screen)
+    elapsed = (pygame.time.get_ticks() - start) / 1000.0
+    consumed = cpu_time() - start_cpu
+    return consumed / elapsed
+
+
+def main():
+    """ Benchmark entry point. """
+    parser = argparse.ArgumentParser(description='Idle loop benchmark')
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=3.0,
+        help='Duration in seconds of each measure')
+    arguments = parser.parse_args()
+    for label, idle_mode, max_fps in CONFIGURATIONS:
+        ratio = measure(idle_mode, max_fps, arguments.duration)
+        print('%-16s %8.3f CPU s / idle s' % (label, ratio))
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
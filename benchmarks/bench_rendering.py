@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Rendering benchmark
+    ===================
+
+    Measures rendering throughput (frames per second and milliseconds per
+    frame) of builtin screens, transitions and navigation at several
+    resolutions, using a headless screenflow. Benchmarked scenarios are :
+
+    - *message* : MessageScreen redraw with cached layout.
+    - *message_layout* : MessageScreen redraw including text layout.
+    - *select* : SelectScreen redraw.
+    - *list_scroll* : ListScreen scrolling over 100k items.
+    - *transition* : transition frame between two screen previews.
+    - *navigation* : forward then backward navigation setup.
+
+    .. code-block:: bash
+
+        python -m benchmarks.bench_rendering --output results.json
+
+    Written report can be compared across releases.
+"""
+
+import argparse
+
+from screenflow.screenflow import ScreenTransition
+from screenflow.screens.message_screen import MessageScreen
+from screenflow.screens.select_screen import SelectScreen
+from screenflow.screens.list_screen import ListScreen
+from benchmarks.common import RESOLUTIONS, create_flow, measure
+from benchmarks.common import create_result, write_report, print_results
+
+# Message used by benchmarked screens.
+MESSAGE = 'Welcome! Please select the network you want to connect to.'
+
+# Options used by benchmarked select screen.
+OPTIONS = ['Yes', 'No', 'Maybe', 'Back']
+
+# Number of items of benchmarked list screen.
+LIST_LENGTH = 100000
+
+# Scrolled pixels per frame of benchmarked list screen.
+LIST_SCROLL_STEP = 7
+
+
+def create_screens(screenflow):
+    """Creates and registers benchmarked screens into the given flow.
+
+    :param screenflow: Screenflow to register screens into.
+    :returns: Tuple of created message and select screens.
+    """
+    message = MessageScreen('message', MESSAGE)
+    select = SelectScreen('select', MESSAGE, OPTIONS)
+    screenflow.add_screen(message)
+    screenflow.add_screen(select)
+    return message, select
+
+
+def bench_message(screenflow, message, select):
+    """
+    :returns: Frame function for message scenario.
+    """
+    surface = screenflow.surface
+    return lambda: message.draw(surface)
+
+
+def bench_message_layout(screenflow, message, select):
+    """
+    :returns: Frame function for message layout scenario.
+    """
+    surface = screenflow.surface
+
+    def frame():
+        message.message = MESSAGE
+        message.draw(surface)
+    return frame
+
+
+def bench_select(screenflow, message, select):
+    """
+    :returns: Frame function for select scenario.
+    """
+    surface = screenflow.surface
+    return lambda: select.draw(surface)
+
+
+def bench_list_scroll(screenflow, message, select):
+    """
+    :returns: Frame function for list scrolling scenario.
+    """
+    surface = screenflow.surface
+    screen = ListScreen('list')
+    screenflow.add_screen(screen)
+
+    @screen.provider
+    def provide(offset, limit):
+        return ['Item %d' % i for i in range(
+            offset,
+            min(offset + limit, LIST_LENGTH))]
+
+    def frame():
+        if screen.offset >= screen.get_max_offset():
+            screen.scroll_to(0)
+        screen.scroll(LIST_SCROLL_STEP)
+        screen.draw(surface)
+    screen.draw(surface)
+    screen.scroll_to(LIST_LENGTH)
+    screen.draw(surface)
+    screen.scroll_to(0)
+    return frame
+
+
+class FrameClock(object):
+    """ Clock that moves forward of one millisecond at each call. """
+
+    def __init__(self):
+        """ Default constructor. """
+        self.time = 0
+
+    def __call__(self):
+        """
+        :returns: Current time.
+        """
+        self.time += 1
+        return self.time
+
+
+def bench_transition(screenflow, message, select):
+    """
+    :returns: Frame function for transition scenario.
+    """
+    surface = screenflow.surface
+    size = surface.get_size()
+    previews = (message.generate_preview(size), select.generate_preview(size))
+    clock = FrameClock()
+    state = {}
+
+    def frame():
+        transition = state.get('transition')
+        if transition is None or not transition.update(surface):
+            state['transition'] = ScreenTransition(
+                previews,
+                ScreenTransition.FORWARD,
+                duration=1000,
+                clock=clock)
+    return frame
+
+
+def bench_navigation(screenflow, message, select):
+    """
+    :returns: Frame function for navigation scenario.
+    """
+    screenflow._stack.append(message)
+    screenflow.draw()
+
+    def frame():
+        screenflow.navigate_to(select)
+        screenflow.navigate_back()
+    return frame
+
+# Benchmarked scenarios.
+SCENARIOS = (
+    ('message', bench_message),
+    ('message_layout', bench_message_layout),
+    ('select', bench_select),
+    ('list_scroll', bench_list_scroll),
+    ('transition', bench_transition),
+    ('navigation', bench_navigation))
+
+
+def main():
+    """ Benchmark entry point. """
+    parser = argparse.ArgumentParser(description='Rendering benchmark')
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=1.0,
+        help='Duration in seconds of each measure')
+    parser.add_argument(
+        '--output',
+        default='bench_rendering.json',
+        help='Path of the JSON report to write')
+    parser.add_argument(
+        '--scenario',
+        action='append',
+        help='Scenario to run (default to all)')
+    arguments = parser.parse_args()
+    results = []
+    for resolution in RESOLUTIONS:
+        screenflow = create_flow(resolution)
+        message, select = create_screens(screenflow)
+        for name, factory in SCENARIOS:
+            if arguments.scenario and name not in arguments.scenario:
+                continue
+            frame = factory(screenflow, message, select)
+            count, elapsed = measure(frame, arguments.duration)
+            results.append(create_result(name, resolution, count, elapsed))
+    print_results(results)
+    write_report(arguments.output, 'rendering', results)
+
+
+if __name__ == '__main__':
+    main()
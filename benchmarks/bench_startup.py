@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Startup benchmark
+    =================
+
+    Measures cold start costs, each in a fresh interpreter :
+
+    - *import* : time spent importing screenflow own modules, measured with
+      ``-X importtime`` when available, or by timing the import once pygame
+      is imported otherwise.
+    - *first_frame* : time from interpreter start to the first presented
+      frame of a message screen, with warm compiled caches.
+
+    .. code-block:: bash
+
+        python -m benchmarks.bench_startup --check
+
+    With *--check*, the benchmark exits with an error status if a measure
+    exceeds its budget.
+"""
+
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from benchmarks.common import write_report
+
+# Root directory of the repository.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Maximum time in microseconds spent importing screenflow own modules.
+IMPORT_BUDGET = 100000
+
+# Maximum time in microseconds from interpreter start to first frame.
+FIRST_FRAME_BUDGET = 2000000
+
+# Script that times screenflow import, pygame being imported first, used
+# when -X importtime is not available.
+IMPORT_SCRIPT = """
+import pygame
+from timeit import default_timer as timer
+start = timer()
+import screenflow.screenflow
+print(int((timer() - start) * 1000000))
+"""
+
+# Script that loads a screen and presents its first frame.
+FIRST_FRAME_SCRIPT = """
+import time
+start = time.time()
+from screenflow.screenflow import ScreenFlow
+screenflow = ScreenFlow(headless=True)
+screenflow.add_screen(screenflow.create_screen({
+    '@name': 'foo', '@type': 'message', 'message': 'Foo'}))
+screenflow._stack.append(screenflow.foo)
+screenflow.draw()
+screenflow.present()
+print(int((time.time() - start) * 1000000))
+"""
+
+
+def run(arguments, environment=None):
+    """Runs a python interpreter with the given arguments from repository root.
+
+    :param arguments: Interpreter arguments.
+    :param environment: Additional environment variables.
+    :returns: Tuple of standard output and error.
+    """
+    env = dict(os.environ)
+    env.update(environment or {})
+    process = subprocess.Popen(
+        [sys.executable] + arguments,
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True)
+    out, err = process.communicate()
+    if process.returncode != 0:
+        raise RuntimeError(err)
+    return out, err
+
+
+def measure_import():
+    """Measures time spent importing screenflow own modules.
+
+    :returns: Import time in microseconds.
+    """
+    if sys.version_info < (3, 7):
+        out, _ = run(['-c', IMPORT_SCRIPT])
+        return int(out.strip().split('\n')[-1])
+    _, err = run(['-X', 'importtime', '-c', 'import screenflow.screenflow'])
+    total = 0
+    for line in err.split('\n'):
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        fields = [field.strip() for field in line[12:].split('|')]
+        if fields[2].startswith('screenflow'):
+            total += int(fields[0])
+    return total
+
+
+def measure_first_frame():
+    """Measures time to first frame, caches being warmed by a first run.
+
+    :returns: Time to first frame in microseconds.
+    """
+    directory = tempfile.mkdtemp()
+    environment = {
+        'SCREENFLOW_CACHE_DIR': directory,
+        'SDL_VIDEODRIVER': 'dummy'}
+    try:
+        run(['-c', FIRST_FRAME_SCRIPT], environment)
+        out, _ = run(['-c', FIRST_FRAME_SCRIPT], environment)
+    finally:
+        shutil.rmtree(directory)
+    return int(out.strip().split('\n')[-1])
+
+
+def main():
+    """ Benchmark entry point. """
+    parser = argparse.ArgumentParser(description='Startup benchmark')
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Fail if a measure exceeds its budget')
+    parser.add_argument(
+        '--output',
+        default='bench_startup.json',
+        help='Path of the JSON report to write')
+    arguments = parser.parse_args()
+    results = [
+        {'scenario': 'import', 'us': measure_import(),
+            'budget': IMPORT_BUDGET},
+        {'scenario': 'first_frame', 'us': measure_first_frame(),
+            'budget': FIRST_FRAME_BUDGET}]
+    exceeded = False
+    for result in results:
+        sys.stdout.write('%-12s %10d us (budget %d us)\n' % (
+            result['scenario'],
+            result['us'],
+            result['budget']))
+        exceeded = exceeded or result['us'] >= result['budget']
+    write_report(arguments.output, 'startup', results)
+    if arguments.check and exceeded:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
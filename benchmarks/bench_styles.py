@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Styles benchmark
+    ================
+
+    Measures the cost of reading the style properties a screen uses for
+    a single draw (background color, padding and both font styles), for a
+    screen styled by name, type and screenflow selectors. Benchmarked
+    scenarios are :
+
+    - *chained* : properties read from styles, resolved through parents.
+    - *computed* : properties read from computed styles.
+
+    .. code-block:: bash
+
+        python -m benchmarks.bench_styles --output results.json
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+
+from screenflow.css.style_factory import StyleFactory
+from benchmarks.common import measure, write_report
+
+# Stylesheet defining properties at each selector level.
+STYLESHEET = """
+screenflow {
+    background-color: black;
+}
+
+.message_screen primary {
+    font-size: 30;
+}
+
+#foo {
+    transition-duration: 300ms;
+}
+"""
+
+# Number of simulated draws per measured call.
+DRAWS = 1000
+
+
+class BenchScreen(object):
+    """ Screen stand-in styled by benchmarked factory. """
+
+    def __init__(self):
+        """ Default constructor. """
+        self.name = 'foo'
+        self.type = 'message_screen'
+
+
+def create_factory():
+    """
+    :returns: Style factory loaded with benchmarked stylesheet.
+    """
+    descriptor, path = tempfile.mkstemp(suffix='.css')
+    try:
+        with os.fdopen(descriptor, 'w') as stream:
+            stream.write(STYLESHEET)
+        factory = StyleFactory()
+        factory.load(path)
+    finally:
+        os.remove(path)
+    return factory
+
+
+def bench_draws(style, primary, secondary):
+    """
+    :param style: Screen style to read properties from.
+    :param primary: Primary font style to read properties from.
+    :param secondary: Secondary font style to read properties from.
+    :returns: Function reading properties used by DRAWS draws.
+    """
+    def function():
+        for _ in range(DRAWS):
+            style.background_color
+            style.padding
+            style.padding
+            primary.name
+            primary.size
+            primary.color
+            secondary.name
+            secondary.size
+            secondary.color
+    return function
+
+
+def main():
+    """ Benchmark entry point. """
+    parser = argparse.ArgumentParser(description='Styles benchmark')
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=1.0,
+        help='Duration in seconds of each measure')
+    parser.add_argument(
+        '--output',
+        default='bench_styles.json',
+        help='Path of the JSON report to write')
+    arguments = parser.parse_args()
+    factory = create_factory()
+    screen = BenchScreen()
+    chained = (factory.get_style(screen),) + factory.get_font_styles(screen)
+    scenarios = (
+        ('chained', chained),
+        ('computed', factory.get_computed_styles(screen)))
+    results = []
+    for name, styles in scenarios:
+        count, elapsed = measure(bench_draws(*styles), arguments.duration)
+        results.append({
+            'scenario': name,
+            'draws': count * DRAWS,
+            'seconds': elapsed,
+            'us_per_draw': elapsed * 1000000.0 / (count * DRAWS)})
+    for result in results:
+        sys.stdout.write('%-10s %9.3f us/draw\n' % (
+            result['scenario'],
+            result['us_per_draw']))
+    write_report(arguments.output, 'styles', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Wrapping benchmark
+    ==================
+
+    Measures line wrapping time of multi kilobyte messages, for each
+    wrapping mode. Messages mix words, long URLs and text without spaces,
+    and are wrapped at a different width for each call so line layout is
+    actually recomputed. Benchmarked scenarios are :
+
+    - *greedy* : greedy wrapping with a warm text measurer.
+    - *balanced* : minimum raggedness wrapping with a warm text measurer.
+    - *greedy_cold* : greedy wrapping with a new text measurer for each call.
+
+    .. code-block:: bash
+
+        python -m benchmarks.bench_wrapping --output results.json
+"""
+
+import sys
+import argparse
+
+from screenflow.css.font_manager import FontManager, TextMeasurer
+from screenflow.utils.headless import init_headless
+from screenflow.utils.wrapping import wrap, GREEDY, BALANCED
+from benchmarks.common import measure, write_report
+
+# Benchmarked message sizes in bytes.
+SIZES = (2048, 8192, 32768)
+
+# Widths messages are wrapped at, cycled over calls.
+WIDTHS = (320, 400, 480, 560, 640, 720, 800)
+
+# Font used for measuring text.
+FONT = ('arial', 20)
+
+# Text fragments messages are built from.
+FRAGMENTS = (
+    'Please select the network you want to connect to.',
+    'See http://example.com/documentation/networks/configuration.html',
+    'Thisisaverylongtokenwithoutanyspacewhichrequirescharacterbreaking',
+    'Connection established.')
+
+
+def create_message(size):
+    """Creates a message of the given size from text fragments.
+
+    :param size: Size of the message in bytes.
+    :returns: Created message.
+    """
+    fragments = []
+    length = 0
+    i = 0
+    while length < size:
+        fragment = FRAGMENTS[i % len(FRAGMENTS)]
+        fragments.append(fragment)
+        length += len(fragment) + 1
+        i += 1
+    return ' '.join(fragments)[:size]
+
+
+def bench_wrap(font, message, mode, cold=False):
+    """
+    :param font: Font to measure text with.
+    :param message: Message to wrap.
+    :param mode: Wrapping mode.
+    :param cold: True to use a new text measurer for each call.
+    :returns: Wrap function for the given scenario.
+    """
+    state = {'measurer': TextMeasurer(font), 'calls': 0}
+
+    def function():
+        if cold:
+            state['measurer'] = TextMeasurer(font)
+        width = WIDTHS[state['calls'] % len(WIDTHS)]
+        state['calls'] += 1
+        wrap(message, state['measurer'], width, mode)
+    return function
+
+# Benchmarked scenarios as (name, mode, cold) tuples.
+SCENARIOS = (
+    ('greedy', GREEDY, False),
+    ('balanced', BALANCED, False),
+    ('greedy_cold', GREEDY, True))
+
+
+def main():
+    """ Benchmark entry point. """
+    parser = argparse.ArgumentParser(description='Wrapping benchmark')
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=1.0,
+        help='Duration in seconds of each measure')
+    parser.add_argument(
+        '--output',
+        default='bench_wrapping.json',
+        help='Path of the JSON report to write')
+    arguments = parser.parse_args()
+    init_headless()
+    font = FontManager().get(*FONT)
+    results = []
+    for size in SIZES:
+        message = create_message(size)
+        for name, mode, cold in SCENARIOS:
+            function = bench_wrap(font, message, mode, cold)
+            count, elapsed = measure(function, arguments.duration)
+            results.append({
+                'scenario': name,
+                'bytes': size,
+                'calls': count,
+                'seconds': elapsed,
+                'ms_per_wrap': elapsed * 1000.0 / count})
+    for result in results:
+        sys.stdout.write('%-12s %6d bytes %9.3f ms/wrap\n' % (
+            result['scenario'],
+            result['bytes'],
+            result['ms_per_wrap']))
+    write_report(arguments.output, 'wrapping', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Benchmark helpers
+    =================
+
+    Shared utilities for benchmark scripts : headless screenflow creation,
+    timing loops and machine readable result reports.
+"""
+
+import sys
+import json
+import time
+import platform
+from timeit import default_timer as timer
+
+import pygame
+from screenflow import __version__
+from screenflow.screenflow import ScreenFlow
+
+# Resolutions benchmarked by default.
+RESOLUTIONS = ((320, 240), (800, 480), (1280, 720), (1920, 1080))
+
+
+def create_flow(resolution, **kwargs):
+    """Creates a headless screenflow with the given resolution.
+
+    :param resolution: Resolution of the screenflow surface.
+    :param kwargs: Additional screenflow constructor parameters.
+    :returns: Created screenflow.
+    """
+    screenflow = ScreenFlow(headless=True, resolution=resolution, **kwargs)
+    screenflow.surface
+    return screenflow
+
+
+def measure(function, duration, minimum=10):
+    """Calls repeatedly the given function during at least the given
+    duration and minimum number of calls.
+
+    :param function: Function to benchmark, called without parameter.
+    :param duration: Minimum duration of the measure in seconds.
+    :param minimum: Minimum number of calls.
+    :returns: Tuple of number of calls and elapsed time in seconds.
+    """
+    count = 0
+    start = timer()
+    elapsed = 0.0
+    while elapsed < duration or count < minimum:
+        function()
+        count += 1
+        elapsed = timer() - start
+    return count, elapsed
+
+
+def create_result(scenario, resolution, count, elapsed):
+    """Creates a result entry for a frame based measure.
+
+    :param scenario: Name of the benchmarked scenario.
+    :param resolution: Benchmarked resolution.
+    :param count: Number of frames rendered.
+    :param elapsed: Time elapsed in seconds.
+    :returns: Result dictionary.
+    """
+    return {
+        'scenario': scenario,
+        'resolution': list(resolution),
+        'frames': count,
+        'seconds': elapsed,
+        'fps': count / elapsed,
+        'ms_per_frame': elapsed * 1000.0 / count}
+
+
+def write_report(path, benchmark, results):
+    """Writes the given results into a JSON report, along with
+    environment information required for comparing releases.
+
+    :param path: Path of the report file to write.
+    :param benchmark: Name of the benchmark suite.
+    :param results: List of result dictionaries.
+    """
+    report = {
+        'benchmark': benchmark,
+        'screenflow': __version__,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'timestamp': int(time.time()),
+        'results': results}
+    with open(path, 'w') as stream:
+        json.dump(report, stream, indent=2, sort_keys=True)
+
+
+def print_results(results, stream=sys.stdout):
+    """Prints the given results as a table.
+
+    :param results: List of result dictionaries.
+    :param stream: Stream to print table into.
+    """
+    for result in results:
+        stream.write('%-20s %5dx%-5d %10.1f fps %9.3f ms/frame\n' % (
+            result['scenario'],
+            result['resolution'][0],
+            result['resolution'][1],
+            result['fps'],
+            result['ms_per_frame']))
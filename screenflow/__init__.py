@@ -1,6 +1,17 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-""" To document package """
+"""
+    To document package
+
+    Library modules do not configure logging : applications should call
+    logging.basicConfig() or add their own handlers to display messages.
+"""
+
+import logging
 
 __author__ = "Felix Voituret"
+__version__ = "1.0"
+
+# Configure logger.
+logging.getLogger(__name__).addHandler(logging.NullHandler())
@@ -0,0 +1,306 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Compositor
+    ==========
+
+    A **Compositor** hosts several screenflows on a single display, such as
+    the panels of a split screen kiosk. Each flow renders into a subsurface
+    of the display, and all flows are driven by a single main loop :
+
+    .. code-block:: python
+
+        compositor = Compositor()
+        menu = compositor.create_flow(Rect(0, 0, 300, 480))
+        content = compositor.create_flow(Rect(300, 0, 500, 480))
+        menu.load_from_file('menu.xml')
+        content.load_from_file('content.xml')
+        compositor.start(menu, menu.main)
+        compositor.start(content, content.home)
+        compositor.run()
+
+    Hosted flows share the compositor **FontManager**, so fonts and rendered
+    texts are cached once for the whole display, as well as its
+    **SurfacePool** and **EventPipeline**. Styles remain loaded per flow.
+
+    Events are routed to flows : positioned events go to the flow under
+    their position, translated into its coordinates, other events go to the
+    flow that was last clicked, and *QUIT* goes to all flows. A frame is only
+    processed for flows that received events, are in transition or have
+    something to redraw, so idle flows cost nothing per frame. Areas modified
+    by flows are then merged and the display is updated once.
+
+    The compositor loop stops once all flows are stopped.
+"""
+
+from __future__ import absolute_import
+
+import logging
+from pygame import time, Rect, NOEVENT
+from pygame.constants import QUIT, MOUSEBUTTONDOWN
+from pygame.display import flip, update
+from pygame.event import Event, get as events, wait as wait_event
+from screenflow.screenflow import ScreenFlow, create_display
+from screenflow.screenflow import DEFAULT_MAX_FPS, DEFAULT_IDLE_TIMEOUT
+from screenflow.css.font_manager import FontManager
+from screenflow.event_pipeline import EventPipeline
+from screenflow.utils.rects import merge_rects
+from screenflow.utils.surface_pool import SurfacePool
+
+# Configure logger.
+logger = logging.getLogger(__name__)
+
+
+def translate(event, offset):
+    """Translates position of the given event into a flow coordinates.
+
+    :param event: Event to translate.
+    :param offset: Position of the flow into the display.
+    :returns: Translated event.
+    """
+    x, y = event.pos
+    attributes = dict(event.__dict__)
+    attributes['pos'] = (x - offset[0], y - offset[1])
+    return Event(event.type, attributes)
+
+
+class Compositor(object):
+    """ Hosts several screenflows into regions of a single display. """
+
+    def __init__(
+            self,
+            surface=None,
+            max_fps=DEFAULT_MAX_FPS,
+            idle_mode=ScreenFlow.IDLE_WAIT,
+            headless=False,
+            resolution=None):
+        """Default constructor.
+
+        :param surface: Optional display surface flows will be rendered into.
+        :param max_fps: Frame rate cap for animation (0 means uncapped).
+        :param idle_mode: Main loop behavior while idle
+            (IDLE_WAIT or IDLE_POLL).
+        :param headless: True to render offscreen using SDL dummy video driver.
+        :param resolution: Resolution of the created surface if not given.
+        """
+        self.font_manager = FontManager()
+        self.surface_pool = SurfacePool()
+        self.event_pipeline = EventPipeline()
+        self._surface = surface
+        self._flows = []
+        self._regions = {}
+        self._deferred = {}
+        self._focus = None
+        self._damages = []
+        self._clock = None
+        self._running = False
+        self.max_fps = max_fps
+        self.idle_mode = idle_mode
+        self.headless = headless
+        self.resolution = resolution
+        self.idle_timeout = DEFAULT_IDLE_TIMEOUT
+
+    @property
+    def surface(self):
+        """Surface property getter. If current surface is None,
+        it creates a fullscreen surface.
+
+        :returns: Display surface.
+        """
+        if self._surface is None:
+            self._surface = create_display(self.headless, self.resolution)
+        return self._surface
+
+    def create_flow(self, rect):
+        """Creates a flow rendered into the given region of the display.
+
+        :param rect: Region of the display the flow is rendered into.
+        :returns: Created flow.
+        """
+        rect = Rect(rect)
+        if not self.surface.get_rect().contains(rect):
+            raise ValueError('Region %s is out of display bounds' % rect)
+        for other in self._regions.values():
+            if other.colliderect(rect):
+                raise ValueError('Region %s overlaps another flow' % rect)
+        flow = ScreenFlow(
+            self.surface.subsurface(rect),
+            max_fps=self.max_fps,
+            compositor=self)
+        self._flows.append(flow)
+        self._regions[flow] = rect
+        self._deferred[flow] = []
+        return flow
+
+    def start(self, flow, start_screen):
+        """Displays the given screen as first screen of the given flow.
+
+        :param flow: Flow to start.
+        :param start_screen: Screen to start the flow with.
+        """
+        if flow not in self._regions:
+            raise ValueError('Flow is not hosted by this compositor')
+        flow.start(start_screen)
+        if self._focus is None:
+            self._focus = flow
+        self.present()
+
+    def add_damages(self, flow, rects):
+        """Collects the given areas modified by the given flow, to be
+        updated on next display update.
+
+        :param flow: Flow that modified the given areas.
+        :param rects: Modified areas, in flow coordinates.
+        """
+        offset = self._regions[flow].topleft
+        for rect in rects:
+            self._damages.append(Rect(rect).move(offset))
+
+    def present(self):
+        """Updates display areas modified by flows since last call.
+
+        :returns: True if display has been updated, False otherwise.
+        """
+        if len(self._damages) == 0:
+            return False
+        bounds = self.surface.get_rect()
+        rects = merge_rects(self._damages, bounds)
+        del self._damages[:]
+        if len(rects) == 1 and rects[0] == bounds:
+            flip()
+        elif len(rects) > 0:
+            update(rects)
+        return True
+
+    def get_flow_at(self, position):
+        """
+        :param position: Position into the display.
+        :returns: Flow rendered at the given position, None if any.
+        """
+        for flow in self._flows:
+            if self._regions[flow].collidepoint(position):
+                return flow
+        return None
+
+    def route(self, pending):
+        """Distributes the given events to flows. Events targeting a flow
+        in transition are deferred until it is over.
+
+        :param pending: Events polled from pygame queue.
+        :returns: Dictionary of events to process per flow.
+        """
+        routed = dict((flow, []) for flow in self._flows)
+        for event in pending:
+            if event.type == QUIT:
+                for flow in self._flows:
+                    routed[flow].append(event)
+                continue
+            if hasattr(event, 'pos'):
+                flow = self.get_flow_at(event.pos)
+                if flow is None:
+                    continue
+                if event.type == MOUSEBUTTONDOWN:
+                    self._focus = flow
+                event = translate(event, self._regions[flow].topleft)
+            else:
+                flow = self._focus
+            if flow is not None:
+                routed[flow].append(event)
+        for flow in self._flows:
+            if flow.is_animating():
+                self._deferred[flow].extend(routed.pop(flow))
+            elif len(self._deferred[flow]) > 0:
+                routed[flow] = self._deferred[flow] + routed[flow]
+                self._deferred[flow] = []
+        return routed
+
+    def is_idle(self):
+        """
+        :returns: True if no running flow needs a frame, False otherwise.
+        """
+        for flow in self._flows:
+            if flow.is_running() and not flow.is_idle():
+                return False
+        return True
+
+    def run_idle_tasks(self):
+        """Runs one step of idle task for each flow having some pending.
+
+        :returns: True if idle work remains, False otherwise.
+        """
+        remaining = False
+        for flow in self._flows:
+            if flow.is_running() and flow.run_idle_task():
+                remaining = True
+        return remaining
+
+    def wait_events(self):
+        """Retrieves the events to process for the next loop iteration,
+        following ScreenFlow.wait_events() behavior over all flows : the
+        loop is paced to max_fps while a flow needs frames, and otherwise
+        blocks on event queue unless some idle tasks are pending.
+
+        :returns: List of events to process.
+        """
+        if self.idle_mode == ScreenFlow.IDLE_POLL or not self.is_idle():
+            self._clock.tick(self.max_fps)
+            pending = events()
+        elif any(flow.has_idle_tasks() for flow in self._flows):
+            pending = events()
+        else:
+            event = wait_event(self.idle_timeout)
+            if event.type == NOEVENT:
+                return []
+            return [event] + events()
+        if len(pending) == 0:
+            self.run_idle_tasks()
+        return pending
+
+    def process_frame(self, pending):
+        """Processes a frame of each flow that received events or is not
+        idle, then updates display once.
+
+        :param pending: Events to process.
+        :returns: True if display has been updated, False otherwise.
+        """
+        routed = self.route(pending)
+        for flow in self._flows:
+            if not flow.is_running():
+                continue
+            flow_events = routed.get(flow, [])
+            if len(flow_events) == 0 and flow.is_idle():
+                continue
+            flow.process_frame(flow_events)
+        self._running = any(flow.is_running() for flow in self._flows)
+        return self.present()
+
+    def run(self):
+        """Maintains a main loop over started flows until all of them
+        are stopped.
+        """
+        self._clock = time.Clock()
+        self._running = any(flow.is_running() for flow in self._flows)
+        while self._running:
+            self.process_frame(self.wait_events())
+        self.event_pipeline.release()
+
+    def quit(self):
+        """ Stops all flows hosted by this compositor. """
+        for flow in self._flows:
+            flow.quit()
+        self._running = False
+
+    def text_stats(self):
+        """Retrieves statistics of the rendered text cache shared by all flows.
+
+        :returns: Dictionary of cache usage and hit rate.
+        """
+        return self.font_manager.text_stats()
+
+    def pool_stats(self):
+        """Retrieves statistics of the surface pool shared by all flows.
+
+        :returns: Dictionary of allocation and reuse counters.
+        """
+        return self.surface_pool.stats()
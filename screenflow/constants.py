@@ -8,6 +8,7 @@ XML_SCREENFLOW = 'screenflow'
 XML_SCREEN = 'screen'
 XML_TYPE = '@type'
 XML_NAME = '@name'
+XML_NEXT = 'next'
 
 # Common color.
 WHITE = (255, 255, 255)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    A FontIndex maps font family names to font file paths, so fonts
+    can be loaded directly with pygame.font.Font instead of scanning
+    system fonts as pygame.font.SysFont does on first call.
+
+    Index is built by scanning system font directories and reading family
+    names from each font file. It is persisted as JSON into the screenflow
+    cache directory, along with modification time of every scanned
+    directory : it is reused as long as none of those changed.
+
+    Family names are normalized (lower case, alphanumeric characters only),
+    so *DejaVu Sans* and *dejavusans* are equivalent. Looked up names can
+    be a comma separated list of families, the first indexed one is used.
+"""
+
+import os
+import sys
+import json
+import struct
+import logging
+from screenflow.utils.cache import get_cache_path, write_file
+
+# Configure logger.
+logger = logging.getLogger(__name__)
+
+# Name of the font index cache file.
+INDEX_FILE = 'fonts.json'
+
+# Version of the index format, bumped when format changes.
+INDEX_VERSION = 1
+
+# Extensions of indexed font files.
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
+# Subfamily names denoting a regular font variant.
+REGULAR_SUBFAMILIES = ('regular', 'book', 'normal', 'roman', 'medium')
+
+# Name table identifiers of family and subfamily names.
+FAMILY_NAME_ID = 1
+SUBFAMILY_NAME_ID = 2
+
+
+def get_font_directories():
+    """
+    :returns: List of system font directories for current platform.
+    """
+    home = os.path.expanduser('~')
+    if sys.platform.startswith('win'):
+        windows = os.environ.get('WINDIR', 'C:\\Windows')
+        return [os.path.join(windows, 'Fonts')]
+    if sys.platform == 'darwin':
+        return [
+            '/System/Library/Fonts',
+            '/Library/Fonts',
+            os.path.join(home, 'Library', 'Fonts')]
+    return [
+        '/usr/share/fonts',
+        '/usr/local/share/fonts',
+        os.path.join(home, '.fonts'),
+        os.path.join(home, '.local', 'share', 'fonts')]
+
+
+def normalize(name):
+    """
+    :param name: Font family name.
+    :returns: Normalized name used as index key.
+    """
+    return ''.join(c for c in name.lower() if c.isalnum())
+
+
+def decode_name(data, platform):
+    """
+    :param data: Raw name record data.
+    :param platform: Name record platform identifier.
+    :returns: Decoded name.
+    """
+    if platform in (0, 3):
+        return data.decode('utf-16-be', 'ignore')
+    return data.decode('latin-1')
+
+
+def read_at(stream, offset, size):
+    """Reads the given number of bytes at the given offset of a stream.
+
+    :param stream: Stream to read from.
+    :param offset: Offset to read at.
+    :param size: Number of bytes to read.
+    :returns: Read bytes.
+    """
+    stream.seek(offset)
+    data = stream.read(size)
+    if len(data) < size:
+        raise struct.error('Unexpected end of font file')
+    return data
+
+
+def read_font_names(path):
+    """Reads family and subfamily names from the name table of the given
+    TrueType or OpenType font file (first font of collections). Only the
+    offset table, table directory and name table are read, so large
+    collections are not loaded.
+
+    :param path: Path of the font file.
+    :returns: Tuple of family and subfamily names, None if not readable.
+    """
+    with open(path, 'rb') as stream:
+        offset = 0
+        if read_at(stream, 0, 4) == b'ttcf':
+            offset = struct.unpack('>I', read_at(stream, 12, 4))[0]
+        count = struct.unpack('>H', read_at(stream, offset + 4, 2))[0]
+        records = read_at(stream, offset + 12, count * 16)
+        for i in range(count):
+            record = i * 16
+            if records[record:record + 4] == b'name':
+                table, size = struct.unpack(
+                    '>II',
+                    records[record + 8:record + 16])
+                break
+        else:
+            return None
+        data = read_at(stream, table, size)
+    _, names, strings = struct.unpack('>HHH', data[:6])
+    found = {}
+    for i in range(names):
+        record = 6 + i * 12
+        platform, _, language, name_id, length, start = struct.unpack(
+            '>HHHHHH',
+            data[record:record + 12])
+        if name_id not in (FAMILY_NAME_ID, SUBFAMILY_NAME_ID):
+            continue
+        # Prefer english Windows names.
+        priority = 0 if platform == 3 and language == 0x409 else 1
+        if name_id in found and found[name_id][0] <= priority:
+            continue
+        position = strings + start
+        value = decode_name(data[position:position + length], platform)
+        found[name_id] = (priority, value)
+    if FAMILY_NAME_ID not in found:
+        return None
+    subfamily = found.get(SUBFAMILY_NAME_ID, (0, u''))[1]
+    return found[FAMILY_NAME_ID][1], subfamily
+
+
+class FontIndex(object):
+    """ Persistent index of font family to font file path. """
+
+    def __init__(self, directories=None, path=None):
+        """Default constructor.
+
+        :param directories: Font directories to index, default to system ones.
+        :param path: Path of the index file, default to cache directory one.
+        """
+        if directories is None:
+            directories = get_font_directories()
+        if path is None:
+            path = get_cache_path(INDEX_FILE)
+        self.directories = directories
+        self.path = path
+        self._fonts = None
+        self._mtimes = None
+
+    def get_mtime(self, directory):
+        """
+        :param directory: Directory to get modification time for.
+        :returns: Directory modification time, None if not exists.
+        """
+        try:
+            return os.stat(directory).st_mtime
+        except OSError:
+            return None
+
+    def is_valid(self, mtimes):
+        """Indicates if an index built with the given directory modification
+        times is still valid.
+
+        :param mtimes: Dictionary of scanned directory modification times.
+        :returns: True if no directory changed, False otherwise.
+        """
+        for directory in self.directories:
+            if directory not in mtimes:
+                return False
+        for directory, mtime in mtimes.items():
+            if self.get_mtime(directory) != mtime:
+                return False
+        return True
+
+    def load(self):
+        """Loads persisted index if still valid.
+
+        :returns: True if index has been loaded, False otherwise.
+        """
+        try:
+            with open(self.path, 'r') as stream:
+                index = json.load(stream)
+        except (IOError, OSError, ValueError):
+            return False
+        if index.get('version') != INDEX_VERSION:
+            return False
+        if not self.is_valid(index.get('directories', {})):
+            logger.info('Font directories changed, rebuilding font index')
+            return False
+        self._mtimes = index['directories']
+        self._fonts = index['fonts']
+        return True
+
+    def save(self):
+        """ Persists this index into its file. """
+        index = {
+            'version': INDEX_VERSION,
+            'directories': self._mtimes,
+            'fonts': self._fonts}
+        write_file(self.path, json.dumps(index).encode('utf-8'))
+
+    def add(self, path, regulars):
+        """Indexes the given font file under its family names and file name.
+
+        :param path: Path of the font file.
+        :param regulars: Set of keys already indexed with a regular font.
+        """
+        stem = normalize(os.path.splitext(os.path.basename(path))[0])
+        self._fonts.setdefault(stem, path)
+        try:
+            names = read_font_names(path)
+        except (IOError, OSError, struct.error) as e:
+            logger.debug('Unable to read font %s : %s', path, e)
+            return
+        if names is None:
+            return
+        family, subfamily = names
+        key = normalize(family)
+        self._fonts.setdefault(key + normalize(subfamily), path)
+        if normalize(subfamily) in REGULAR_SUBFAMILIES:
+            if key not in regulars:
+                self._fonts[key] = path
+                regulars.add(key)
+        else:
+            self._fonts.setdefault(key, path)
+
+    def scan(self):
+        """ Builds this index by scanning font directories. """
+        self._fonts = {}
+        self._mtimes = {}
+        regulars = set()
+        for root in self.directories:
+            self._mtimes[root] = self.get_mtime(root)
+            for directory, _, files in os.walk(root):
+                self._mtimes[directory] = self.get_mtime(directory)
+                for name in sorted(files):
+                    if name.lower().endswith(FONT_EXTENSIONS):
+                        self.add(os.path.join(directory, name), regulars)
+        logger.info('Indexed %d font names', len(self._fonts))
+
+    def ensure(self):
+        """ Loads this index, or builds and persists it if not valid. """
+        if self._fonts is None and not self.load():
+            self.scan()
+            self.save()
+
+    def find(self, name):
+        """Retrieves path of the font file for the given family name.
+
+        :param name: Family name, or comma separated list of family names.
+        :returns: Path of the font file, None if not indexed.
+        """
+        self.ensure()
+        for family in name.split(','):
+            path = self._fonts.get(normalize(family.strip().strip('"\'')))
+            if path is not None:
+                return path
+        return None
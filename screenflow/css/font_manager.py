@@ -3,20 +3,182 @@
 
 """
     A FontManager is responsible for creating and caching font
-    instance. It uses by default pygame.font.SysFont function
-    as default font factory.
+    instance. By default, font files are located using a persistent
+    **FontIndex** and loaded with pygame.font.Font, falling back to
+    pygame default font if the family is not indexed. Fonts can be
+    created ahead of time, for instance while idle, using *preload()*.
+
+    Rendered text surfaces are cached as well, using a least recently used
+    cache bounded in bytes, so a text rendered with the same font, size,
+    color and antialiasing is rasterized only once for all screens sharing
+    the font manager. As cached surfaces are shared, they should not be
+    modified. Cache efficiency is available through *text_stats()*.
+
+    Text measurement goes through a **TextMeasurer** for each font and size,
+    available through *get_measurer()*. It keeps a table of glyph advances,
+    so string widths can be estimated in pure Python without calling into
+    SDL_ttf, while exact string sizes are memoized. As estimations ignore
+    kerning, *fits()* falls back to exact size when the estimated width is
+    close to the available one.
 """
 
-from pygame.font import SysFont
+import logging
+from pygame.font import Font
+from screenflow.css.font_index import FontIndex
+from screenflow.utils.lru import LRUCache
+
+# Configure logger.
+logger = logging.getLogger(__name__)
+
+# Default maximum number of bytes of cached text surfaces.
+DEFAULT_TEXT_CACHE_LIMIT = 4 * 1024 * 1024
+
+# Estimated number of bytes per text surface pixel.
+PIXEL_BYTES = 4
+
+# Default maximum number of memoized string sizes and widths per measurer.
+DEFAULT_MEASURE_CACHE_SIZE = 2048
+
+# Maximum width difference in pixels per character, between estimated and
+# exact string width, due to kerning.
+KERNING_TOLERANCE = 1
+
+
+class TextMeasurer(object):
+    """ Measures text rendered with a given font. """
+
+    def __init__(self, font, cache_size=DEFAULT_MEASURE_CACHE_SIZE):
+        """Default constructor.
+
+        :param font: Font to measure text with.
+        :param cache_size: Maximum number of memoized string sizes.
+        """
+        self.font = font
+        self.height = font.get_height()
+        self.cache_size = cache_size
+        self._advances = {}
+        self._widths = {}
+        self._sizes = LRUCache(cache_size)
+
+    def __call__(self, text):
+        """ Sizer interface, see size(). """
+        return self.size(text)
+
+    def advance(self, character):
+        """
+        :param character: Character to get advance for.
+        :returns: Horizontal advance in pixels of the given character glyph.
+        """
+        advance = self._advances.get(character)
+        if advance is None:
+            metrics = self.font.metrics(character)
+            if metrics and None not in metrics:
+                advance = sum(metric[4] for metric in metrics)
+            else:
+                advance = self.font.size(character)[0]
+            self._advances[character] = advance
+        return advance
+
+    def width(self, text):
+        """Estimates width of the given text from glyph advances,
+        without kerning. Estimations are memoized until cache is full.
+
+        :param text: Text to measure.
+        :returns: Estimated width in pixels.
+        """
+        width = self._widths.get(text)
+        if width is None:
+            advances = self._advances
+            width = 0
+            for character in text:
+                advance = advances.get(character)
+                if advance is None:
+                    advance = self.advance(character)
+                width += advance
+            if len(self._widths) >= self.cache_size:
+                self._widths.clear()
+            self._widths[text] = width
+        return width
+
+    def size(self, text):
+        """Computes exact size of the given text, memoized.
+
+        :param text: Text to measure.
+        :returns: Tuple of text width and height in pixels.
+        """
+        size = self._sizes.get(text)
+        if size is None:
+            size = self.font.size(text)
+            self._sizes.put(text, size, 1)
+        return size
+
+    def fits(self, text, width):
+        """Indicates if the given text fits into the given width, using
+        exact size only when estimated width is not conclusive.
+
+        :param text: Text to measure.
+        :param width: Available width in pixels.
+        :returns: True if text width is lower than the given width.
+        """
+        estimated = self.width(text)
+        tolerance = KERNING_TOLERANCE * len(text)
+        if estimated + tolerance < width:
+            return True
+        if estimated - tolerance >= width:
+            return False
+        return self.size(text)[0] < width
 
 
 class FontManager(object):
     """ FontManager is a simple font caching factory. """
 
-    def __init__(self):
-        """ Default constructor. """
+    def __init__(
+            self,
+            text_cache_limit=DEFAULT_TEXT_CACHE_LIMIT,
+            font_index=None):
+        """ Default constructor.
+
+        :param text_cache_limit: Maximum number of bytes of cached text
+            surfaces.
+        :param font_index: Font index to use, default to system fonts one.
+        """
         self._fonts = {}
+        self._measurers = {}
         self._font_factory = None
+        self._font_index = font_index
+        self._texts = LRUCache(text_cache_limit)
+        self._preloads = []
+
+    @property
+    def font_index(self):
+        """Font index property getter. Default index is created
+        on first access, and loaded on first lookup.
+
+        :returns: Font index instance to use.
+        """
+        if self._font_index is None:
+            self._font_index = FontIndex()
+        return self._font_index
+
+    def index_font_factory(self, name, size):
+        """Default font factory, which loads font file found in font index,
+        or pygame default font if not found.
+
+        :param name: Font family name.
+        :param size: Font size.
+        :returns: Created font.
+        """
+        path = None
+        if name:
+            path = self.font_index.find(name)
+            if path is None:
+                logger.warning('Font %s not found, using default font', name)
+        if path is not None:
+            try:
+                return Font(path, size)
+            except (IOError, RuntimeError) as e:
+                logger.warning('Unable to load font %s : %s', path, e)
+        return Font(None, size)
 
     @property
     def font_factory(self):
@@ -25,7 +187,7 @@ class FontManager(object):
         :returns: Font factory instance to use.
         """
         if self._font_factory is None:
-            self._font_factory = SysFont
+            self._font_factory = self.index_font_factory
         return self._font_factory
 
     @font_factory.setter
@@ -48,3 +210,61 @@ class FontManager(object):
         if size not in self._fonts[name].keys():
             self._fonts[name][size] = self.font_factory(name, size)
         return self._fonts[name][size]
+
+    def preload(self, fonts):
+        """Schedules creation of the given fonts, performed by preload_step().
+
+        :param fonts: Collection of (name, size) tuples to create.
+        """
+        for font in fonts:
+            if font not in self._preloads:
+                self._preloads.append(font)
+
+    def preload_step(self):
+        """Creates the next scheduled font if any. Can be used as idle task.
+
+        :returns: True if some fonts remain to be created.
+        """
+        if len(self._preloads) > 0:
+            name, size = self._preloads.pop(0)
+            self.get(name, size)
+        return len(self._preloads) > 0
+
+    def get_measurer(self, name, size):
+        """Text measurer access method. Creates the measurer if not exists.
+
+        :param name: Name of the font to measure text with.
+        :param size: Size of the font to measure text with.
+        :returns: Required text measurer.
+        """
+        key = (name, size)
+        measurer = self._measurers.get(key)
+        if measurer is None:
+            measurer = TextMeasurer(self.get(name, size))
+            self._measurers[key] = measurer
+        return measurer
+
+    def render(self, text, name, size, color, antialias=False):
+        """Text rendering method. Renders the given text if not cached yet.
+
+        :param text: Text to render.
+        :param name: Name of the font to use.
+        :param size: Size of the font to use.
+        :param color: Color of the text.
+        :param antialias: True to render antialiased text.
+        :returns: Rendered text surface, which should not be modified.
+        """
+        key = (text, name, size, tuple(color), bool(antialias))
+        surface = self._texts.get(key)
+        if surface is None:
+            font = self.get(name, size)
+            surface = font.render(text, antialias, color)
+            width, height = surface.get_size()
+            self._texts.put(key, surface, width * height * PIXEL_BYTES)
+        return surface
+
+    def text_stats(self):
+        """
+        :returns: Dictionary of rendered text cache usage and hit rate.
+        """
+        return self._texts.stats()
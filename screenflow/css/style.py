@@ -31,8 +31,15 @@
         tls {
             background-color: white;
             padding: 20;
+            transition-duration: 400ms;
+            transition-timing-function: ease-in-out;
         }
 
+    Transition properties apply to transition toward the target screen(s),
+    and to the reverse transition when navigating back from them. Duration
+    can be expressed in milliseconds (*ms*) or seconds (*s*), and timing
+    function is one of *linear*, *ease-in*, *ease-out* or *ease-in-out*.
+
     Component font selector
     ~~~~~~~~~~~~~~~~~~~~~~~
 
@@ -63,17 +70,27 @@
             font-size: 20;
             font-familiy: Arial;
         }
+
+    Computed styles
+    ---------------
+
+    Screens do not read properties from styles above, which resolve each
+    undefined property through their parent chain. They use computed styles
+    instead : immutable objects with ``__slots__``, where every property is
+    resolved once and stored as a plain attribute. Computed styles hold the
+    version of the style factory they were computed with, which changes each
+    time a CSS file is loaded.
 """
 
 
 class Styles(object):
     """
+        Set of styles defined for a top level selector, one for each
+        component (screen itself, primary and secondary font).
     """
 
     def __init__(self):
-        """
-        :param parent:
-        """
+        """ Default constructor. """
         self._parent = None
         self._style = None
         self._primary = None
@@ -89,22 +106,40 @@ class Styles(object):
 
     @parent.setter
     def parent(self, parent):
-        """
-        :param parent:
+        """Property setter for parent attribute, which also links
+        each defined component style to the parent one.
+
+        :param parent: Parent styles to inherit undefined properties from.
         """
         self._parent = parent
         if self._style is not None:
-            self._style.parent = self._parent._style
+            self._style.parent = self._parent.style
         if self._primary is not None:
-            self._primary.parent = self._parent._primary
+            self._primary.parent = self._parent.primary
         if self._secondary is not None:
             self._secondary.parent = self._parent.secondary
         # TODO : Process other ?
 
+    @property
+    def style(self):
+        """
+        :returns: Screen style, inherited from parent if not defined.
+        """
+        if self._style is None:
+            return self._parent.style
+        return self._style
+
+    @style.setter
+    def style(self, value):
+        """
+        :param value:
+        """
+        self._style = value
+
     @property
     def primary(self):
         """
-        :returns:
+        :returns: Primary font style, inherited from parent if not defined.
         """
         if self._primary is None:
             return self._parent.primary
@@ -120,8 +155,10 @@ class Styles(object):
     @property
     def secondary(self):
         """
-        :returns:
+        :returns: Secondary font style, inherited from parent if not defined.
         """
+        if self._secondary is None:
+            return self._parent.secondary
         return self._secondary
 
     @secondary.setter
@@ -131,6 +168,36 @@ class Styles(object):
         """
         self._secondary = value
 
+    def get_style(self, path):
+        """Retrieves the component style denoted by the given selector path,
+        creating it if not defined yet.
+
+        :param path: Selector path following the top level selector.
+        :returns: Component style.
+        """
+        if len(path) == 0:
+            if self._style is None:
+                self._style = BasicStyle()
+                if self._parent is not None:
+                    self._style.parent = self._parent.style
+            return self._style
+        component = path[0]
+        if component == 'primary':
+            if self._primary is None:
+                self._primary = FontStyle()
+                if self._parent is not None:
+                    self._primary.parent = self._parent.primary
+            return self._primary
+        elif component == 'secondary':
+            if self._secondary is None:
+                self._secondary = FontStyle()
+                if self._parent is not None:
+                    self._secondary.parent = self._parent.secondary
+            return self._secondary
+        if component not in self._other:
+            self._other[component] = ButtonStyle()
+        return self._other[component]
+
 
 class Style(object):
     """
@@ -143,6 +210,21 @@ class Style(object):
         :param supported: Collection of CSS property supported by this style.
         """
         self._supported = supported
+        self._parent = None
+
+    @property
+    def parent(self):
+        """
+        :returns: Style undefined properties are inherited from.
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        """
+        :param parent: Style to inherit undefined properties from.
+        """
+        self._parent = parent
 
     def support(self, property):
         """Indicates if the given property is supported by this style instance.
@@ -161,10 +243,15 @@ class BasicStyle(Style):
 
     def __init__(self):
         """ Default constructor. """
-        Style.__init__(self, ('background-color', 'padding'))
-        self._parent = None
+        Style.__init__(self, (
+            'background-color',
+            'padding',
+            'transition-duration',
+            'transition-timing-function'))
         self._background_color = None
         self._padding = None
+        self._transition_duration = None
+        self._transition_easing = None
 
     @property
     def background_color(self):
@@ -202,6 +289,42 @@ class BasicStyle(Style):
         """
         self._padding = padding
 
+    @property
+    def transition_duration(self):
+        """Property getter for transition duration attribute.
+
+        :returns: Transition duration in milliseconds.
+        """
+        if self._transition_duration is None:
+            return self._parent.transition_duration
+        return self._transition_duration
+
+    @transition_duration.setter
+    def transition_duration(self, transition_duration):
+        """Property setter for transition duration attribute.
+
+        :param transition_duration: Transition duration in milliseconds.
+        """
+        self._transition_duration = transition_duration
+
+    @property
+    def transition_easing(self):
+        """Property getter for transition easing attribute.
+
+        :returns: Name of the transition easing function.
+        """
+        if self._transition_easing is None:
+            return self._parent.transition_easing
+        return self._transition_easing
+
+    @transition_easing.setter
+    def transition_easing(self, transition_easing):
+        """Property setter for transition easing attribute.
+
+        :param transition_easing: Name of the transition easing function.
+        """
+        self._transition_easing = transition_easing
+
 
 class FontStyle(Style):
     """
@@ -211,7 +334,6 @@ class FontStyle(Style):
     def __init__(self):
         """ Default constructor. """
         Style.__init__(self, ('color', 'font-size', 'font-family'))
-        self._parent = None
         self._size = None
         self._name = None
         self._color = None
@@ -278,4 +400,84 @@ class ButtonStyle(FontStyle, BasicStyle):
     def __init__(self):
         """ Default constructor """
         BasicStyle.__init__(self)
+        supported = self._supported
         FontStyle.__init__(self)
+        self._supported = supported + self._supported
+
+
+class ComputedStyle(object):
+    """
+        Base class for immutable computed styles, where each property
+        listed in PROPERTIES is resolved once from a style.
+    """
+
+    __slots__ = ('version',)
+
+    # Names of the properties resolved from style.
+    PROPERTIES = ()
+
+    def __init__(self, style, version):
+        """Default constructor.
+
+        :param style: Style to resolve properties from.
+        :param version: Version of the style factory style is computed with.
+        """
+        for name in self.PROPERTIES:
+            object.__setattr__(self, name, getattr(style, name))
+        object.__setattr__(self, 'version', version)
+
+    def __setattr__(self, name, value):
+        """
+        :param name: Name of the attribute to set.
+        :param value: Attribute value.
+        """
+        raise AttributeError('Computed style is immutable')
+
+    def __eq__(self, other):
+        """
+        :param other: Object to compare with.
+        :returns: True if other is a computed style with same properties.
+        """
+        if type(other) is not type(self):
+            return False
+        for name in self.PROPERTIES:
+            if getattr(self, name) != getattr(other, name):
+                return False
+        return True
+
+    def __ne__(self, other):
+        """
+        :param other: Object to compare with.
+        :returns: True if other is not a computed style with same properties.
+        """
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        """
+        :returns: Hash of the properties of this style.
+        """
+        return hash(tuple(getattr(self, name) for name in self.PROPERTIES))
+
+
+class ComputedBasicStyle(ComputedStyle):
+    """
+        Computed counterpart of BasicStyle.
+    """
+
+    __slots__ = (
+        'background_color',
+        'padding',
+        'transition_duration',
+        'transition_easing')
+
+    PROPERTIES = __slots__
+
+
+class ComputedFontStyle(ComputedStyle):
+    """
+        Computed counterpart of FontStyle.
+    """
+
+    __slots__ = ('name', 'size', 'color')
+
+    PROPERTIES = __slots__
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Style cache
+    ===========
+
+    Parsing a CSS file requires tinycss, and resolving its declarations
+    requires property parsers (and webcolors for colors). Both are done once :
+    resolved style tables are then written into a compiled cache file, using
+    marshal format, into the screenflow cache directory. Cache file is keyed
+    by the hash of CSS content, screenflow version, Python version and
+    supported declarations along with their parser versions, so later loads
+    of an unchanged file read style tables directly, without importing
+    tinycss nor webcolors.
+
+    Compiled data is a tuple of :
+
+    - style tables, as a list of (tls, path, attributes) tuples, where
+      *attributes* maps style attribute names to resolved values.
+    - declarations, mapping each top level selector to its raw declaration
+      values, used to detect changed selectors on reloading.
+"""
+
+import sys
+from screenflow import __version__
+from screenflow.utils.cache import get_cache_path
+from screenflow.utils.cache import get_digest as get_file_digest
+from screenflow.utils.cache import read_compiled, write_compiled
+
+# Version of the compiled cache format, bumped when format changes.
+CACHE_FORMAT = 1
+
+
+def get_digest(css_file, declarations):
+    """Computes the cache key of the given CSS file.
+
+    :param css_file: CSS file to compute key for.
+    :param declarations: Dictionary of supported declaration names to
+        their parser version.
+    :returns: Hexadecimal digest of file content and versions.
+    """
+    return get_file_digest(css_file, '%s:%d:%d.%d:%s:' % (
+        __version__,
+        CACHE_FORMAT,
+        sys.version_info[0],
+        sys.version_info[1],
+        ','.join(
+            '%s=%s' % (name, declarations[name])
+            for name in sorted(declarations))))
+
+
+def get_cache_file(digest):
+    """
+    :param digest: Cache key of a CSS file.
+    :returns: Path of the compiled cache file for the given key.
+    """
+    return get_cache_path('style-%s.marshal' % digest)
+
+
+def read_cache(digest):
+    """Reads compiled styles for the given key if any.
+
+    :param digest: Cache key of a CSS file.
+    :returns: Tuple of style tables and declarations, None if not cached.
+    """
+    return read_compiled(get_cache_file(digest), digest)
+
+
+def write_cache(digest, compiled):
+    """Writes compiled styles for the given key.
+
+    :param digest: Cache key of a CSS file.
+    :param compiled: Tuple of style tables and declarations.
+    """
+    write_compiled(get_cache_file(digest), digest, compiled)
@@ -25,16 +25,43 @@
     associated Style instance to set declaration value in. The @css_property_parser
     ensure that the target property is supported by the given style object.
 
+    CSS parsing dependencies (tinycss and webcolors) are only imported when
+    a CSS file is parsed, so default styles do not require them. Resolved
+    style tables of a parsed file are stored into a compiled cache, so later
+    loads of the same file do not require them either. See **style_cache**
+    documentation for details. Custom declaration parsers should be registered
+    with a *version*, bumped when parser changes, which is part of the cache
+    key : compiled cache is not used while a parser without version is
+    registered.
+
+    Computed styles
+    ---------------
+
+    Styles used by a screen are resolved into computed styles through
+    *get_computed_styles()*. They are computed once per screen for a given
+    factory *version*, which is incremented each time a CSS file is loaded.
+
+    Reloading
+    ---------
+
+    Loaded CSS files can be parsed again using *reload()*, for instance once
+    modified. Declarations of each top level selector are compared with the
+    previous ones, and only computed styles of screens matching a changed
+    selector are dropped : other screens keep their computed styles, and
+    thus their cached renderings.
+
 """
 
+from __future__ import absolute_import
+
 import logging
-import tinycss
-from webcolors import hex_to_rgb, name_to_rgb
-from style import Styles, BasicStyle, FontStyle
+from screenflow.css.style import Styles, BasicStyle, FontStyle
+from screenflow.css.style import ComputedBasicStyle, ComputedFontStyle
+from screenflow.css.style_cache import get_digest, read_cache, write_cache
 from screenflow.constants import BLACK, WHITE, GRAY
+from screenflow.easing import EASINGS
 
 # Configure logger.
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 
@@ -45,9 +72,24 @@ def get_color(value):
     :param value: CSS color value.
     :returns: Associated RGB color tuple.
     """
+    from webcolors import hex_to_rgb, name_to_rgb
     if value[0] == '#':
-        return hex_to_rgb(value)
-    return name_to_rgb(value)
+        return tuple(hex_to_rgb(value))
+    return tuple(name_to_rgb(value))
+
+
+def get_duration(value):
+    """Simple factory method that takes a CSS time definition
+    and transforms it into a duration in milliseconds.
+
+    :param value: CSS time value, in milliseconds (ms) or seconds (s).
+    :returns: Associated duration in milliseconds.
+    """
+    if value.endswith('ms'):
+        return int(float(value[:-2]))
+    elif value.endswith('s'):
+        return int(float(value[:-1]) * 1000)
+    return int(float(value))
 
 
 def get_styles(map, selector):
@@ -105,6 +147,29 @@ def padding_parser(value, style):
     style.padding = int(value)
 
 
+@css_property_parser('transition-duration')
+def transition_duration_parser(value, style):
+    """Parser function for CSS transition-duration property.
+
+    :param value: Transition duration value read.
+    :param style: Target style to set transition duration attribute to.
+    """
+    style.transition_duration = get_duration(value)
+
+
+@css_property_parser('transition-timing-function')
+def transition_timing_function_parser(value, style):
+    """Parser function for CSS transition-timing-function property. Only
+    timing function names with an associated easing function are supported.
+
+    :param value: Transition timing function value read.
+    :param style: Target style to set transition easing attribute to.
+    """
+    if value not in EASINGS:
+        raise ValueError('Unsupported timing function %s' % value)
+    style.transition_easing = value
+
+
 @css_property_parser('font-size')
 def font_size_parser(value, style):
     """Parser function for CSS font-size property. If the given value is not a
@@ -140,6 +205,11 @@ DEFAULT_FONT = 'arial'
 DEFAULT_PRIMARY_SIZE = 15
 DEFAULT_SECONDARY_SIZE = 10
 DEFAULT_PADDING = 20
+DEFAULT_TRANSITION_DURATION = 400
+DEFAULT_TRANSITION_EASING = 'ease-in-out'
+
+# Version of built-in declaration parsers, part of compiled cache key.
+PARSER_VERSION = 1
 
 
 def create_default_styles():
@@ -151,6 +221,8 @@ def create_default_styles():
     styles.style = BasicStyle()
     styles.style.background_color = WHITE
     styles.style.padding = DEFAULT_PADDING
+    styles.style.transition_duration = DEFAULT_TRANSITION_DURATION
+    styles.style.transition_easing = DEFAULT_TRANSITION_EASING
     styles.primary = FontStyle()
     styles.primary.name = DEFAULT_FONT
     styles.primary.size = DEFAULT_PRIMARY_SIZE
@@ -162,6 +234,23 @@ def create_default_styles():
     return styles
 
 
+def is_affected(name, type, selectors):
+    """Indicates if a screen with the given name and type is styled
+    by any of the given top level selectors.
+
+    :param name: Name of the screen.
+    :param type: Type of the screen.
+    :param selectors: Collection of top level selectors.
+    :returns: True if screen is affected, False otherwise.
+    """
+    for tls in selectors:
+        if tls == '#' + name or tls == '.' + type:
+            return True
+        if not tls.startswith('#') and not tls.startswith('.'):
+            return True
+    return False
+
+
 class StyleFactory(object):
     """To document.
     """
@@ -169,24 +258,36 @@ class StyleFactory(object):
     def __init__(self):
         """ Default constructor. """
         self._declaration_parser = {}
+        self._parser_versions = {}
         self._name_styles = {}
         self._type_styles = {}
         self._screenflow_styles = create_default_styles()
-        self.register_declaration_parser(
-            'background-color',
-            background_color_parser)
-        self.register_declaration_parser('padding', padding_parser)
-        self.register_declaration_parser('font-size', font_size_parser)
-        self.register_declaration_parser('font-family', font_family_parser)
-        self.register_declaration_parser('color', color_parser)
-
-    def register_declaration_parser(self, name, parser):
+        self._computed = {}
+        self._files = []
+        self._declarations = {}
+        self.version = 0
+        for name, parser in (
+                ('background-color', background_color_parser),
+                ('padding', padding_parser),
+                ('transition-duration', transition_duration_parser),
+                ('transition-timing-function',
+                    transition_timing_function_parser),
+                ('font-size', font_size_parser),
+                ('font-family', font_family_parser),
+                ('color', color_parser)):
+            self.register_declaration_parser(name, parser, PARSER_VERSION)
+
+    def register_declaration_parser(self, name, parser, version=None):
         """
         :param name:
         :param parser:
+        :param version: Version of the parser, part of compiled style cache
+            key. Compiled cache is not used while a parser without version
+            is registered.
         """
         # TODO : Check for conflict.
         self._declaration_parser[name] = parser
+        self._parser_versions[name] = version
 
     def _get_selector_styles(self, tls):
         """
@@ -201,51 +302,163 @@ class StyleFactory(object):
             return styles
         return self._screenflow_styles
 
-    def load(self, file):
+    def load(self, file, cache=True):
         """Loads and parses the given CSS file.
 
         :param file: CSS file to load.
+        :param cache: True to use compiled style cache.
         """
+        compiled = self._compile(file, cache)
+        self._files.append((file, cache))
+        self._apply(compiled)
+        self.version += 1
+        self._computed.clear()
+
+    def reload(self):
+        """Parses again all loaded CSS files, dropping computed styles
+        of screens affected by changed selectors. Current styles are kept
+        if a file cannot be read.
+
+        :returns: Set of top level selectors which declarations changed.
+        """
+        compiled = []
+        for file, cache in self._files:
+            compiled.append(self._compile(file, cache))
+        previous = self._declarations
+        self._declarations = {}
+        self._name_styles = {}
+        self._type_styles = {}
+        self._screenflow_styles = create_default_styles()
+        for tables in compiled:
+            self._apply(tables)
+        changed = set()
+        for tls in set(previous) | set(self._declarations):
+            if previous.get(tls) != self._declarations.get(tls):
+                changed.add(tls)
+        if len(changed) > 0:
+            self.version += 1
+            for key in list(self._computed.keys()):
+                if is_affected(key[0], key[1], changed):
+                    del self._computed[key]
+        return changed
+
+    def _read(self, file):
+        """Parses the given CSS file into rules.
+
+        :param file: CSS file to parse.
+        :returns: List of (tls, path, declarations) rules, where declarations
+            are (name, value, line, column) tuples.
+        """
+        import tinycss
         parser = tinycss.make_parser('fonts3')
         stylesheet = parser.parse_stylesheet_file(file)
+        rules = []
         for ruleset in stylesheet.rules:
             selector = ruleset.selector.as_css()
             path = selector.split()
             tls = path.pop(0)
-            styles = self._get_selector_styles(selector)
-            style = styles.get_style(path)
+            declarations = []
             for declaration in ruleset.declarations:
-                self._parse_declaration(declaration, style)
+                declarations.append((
+                    declaration.name,
+                    declaration.value.as_css(),
+                    declaration.line,
+                    declaration.column))
+            rules.append((tls, path, declarations))
+        return rules
+
+    def _compile(self, file, cache=True):
+        """Resolves the given CSS file into style tables, from compiled
+        cache if available, parsing CSS and writing cache otherwise.
+
+        :param file: CSS file to compile.
+        :param cache: True to use compiled style cache.
+        :returns: Tuple of style tables and declarations.
+        """
+        digest = None
+        if cache and None in self._parser_versions.values():
+            logger.debug('Unversioned declaration parser, skipping cache')
+            cache = False
+        if cache:
+            digest = get_digest(file, self._parser_versions)
+            compiled = read_cache(digest)
+            if compiled is not None:
+                logger.debug('Loaded %s from compiled cache' % file)
+                return compiled
+        tables = []
+        declarations = {}
+        for tls, path, rule_declarations in self._read(file):
+            tables.append((tls, path, self._resolve(path, rule_declarations)))
+            values = declarations.setdefault(tls, {})
+            for declaration in rule_declarations:
+                values[(tuple(path), declaration[0])] = declaration[1]
+        compiled = (tables, declarations)
+        if cache:
+            write_cache(digest, compiled)
+        return compiled
+
+    def _resolve(self, path, declarations):
+        """Resolves the given declarations into style attributes.
+
+        :param path: Selector path following the top level selector.
+        :param declarations: List of (name, value, line, column) declarations.
+        :returns: Dictionary of style attribute names and resolved values.
+        """
+        style = Styles().get_style(path)
+        for declaration in declarations:
+            self._parse_declaration(declaration, style)
+        attributes = {}
+        for name, value in vars(style).items():
+            if name in ('_supported', '_parent') or value is None:
+                continue
+            if isinstance(value, tuple):
+                value = tuple(value)
+            attributes[name] = value
+        return attributes
+
+    def _apply(self, compiled):
+        """Sets the given style tables into selector styles.
+
+        :param compiled: Tuple of style tables and declarations.
+        """
+        tables, declarations = compiled
+        for tls, path, attributes in tables:
+            styles = self._get_selector_styles(tls)
+            style = styles.get_style(path)
+            for name, value in attributes.items():
+                setattr(style, name, value)
+        for tls, values in declarations.items():
+            self._declarations.setdefault(tls, {}).update(values)
 
     def _parse_declaration(self, declaration, style):
         """
-        :param declaration:
+        :param declaration: Declaration as (name, value, line, column) tuple.
         :param style:
         """
-        name = declaration.name
+        name, value, line, column = declaration
         if name not in self._declaration_parser.keys():
             # TODO : Log error.
             return
         parser = self._declaration_parser[name]
         try:
-            parser(declaration.value.as_css(), style)
+            parser(value, style)
         except Exception as e:
-            logging.warn(
-                '[%s:%s] %s' % (
-                    declaration.line,
-                    declaration.column,
-                    str(e)))
+            logger.warning('[%s:%s] %s' % (line, column, str(e)))
 
     def _get_name_styles(self, screen):
-        """
+        """Retrieves styles defined for the given screen name if any, linked
+        to styles defined for the screen type.
+
+        :param screen: Screen to retrieve styles for.
+        :returns: Associated styles, None if no style defined for this name.
         """
         if screen.name in self._name_styles.keys():
             styles = self._name_styles[screen.name]
-            if styles.parent is None:
-                if screen.type in self._type_styles.keys():
-                    styles.parent = self._type_styles[screen.type]
-                else:
-                    styles.parent = self._screenflow_styles
+            if screen.type in self._type_styles.keys():
+                styles.parent = self._type_styles[screen.type]
+            else:
+                styles.parent = self._screenflow_styles
+            return styles
         return None
 
     def _get_screen_styles(self, screen):
@@ -277,3 +490,21 @@ class StyleFactory(object):
         styles = self._get_screen_styles(screen)
         # TODO : Check parent.
         return (styles.primary, styles.secondary)
+
+    def get_computed_styles(self, screen):
+        """Retrieves computed styles for the given screen, resolving
+        them if not computed yet for current version.
+
+        :param screen: Screen to retrieve computed styles for.
+        :returns: Tuple of computed screen, primary and secondary styles.
+        """
+        key = (screen.name, screen.type)
+        computed = self._computed.get(key)
+        if computed is None:
+            styles = self._get_screen_styles(screen)
+            computed = (
+                ComputedBasicStyle(styles.style, self.version),
+                ComputedFontStyle(styles.primary, self.version),
+                ComputedFontStyle(styles.secondary, self.version))
+            self._computed[key] = computed
+        return computed
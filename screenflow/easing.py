@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Easing
+    ======
+
+    Easing functions used by screen transitions. An easing function maps
+    a linear progress value between 0 and 1 to an eased one within the same
+    range. Available functions are registered using their CSS timing
+    function name :
+
+    - linear
+    - ease-in
+    - ease-out
+    - ease-in-out
+
+    Custom easing can be provided as any callable matching the following
+    signature :
+
+    .. code-block:: python
+
+        def my_easing(progress):
+            return progress ** 3
+"""
+
+
+def linear(progress):
+    """Linear easing.
+
+    :param progress: Linear progress between 0 and 1.
+    :returns: Eased progress.
+    """
+    return progress
+
+
+def ease_in(progress):
+    """Quadratic easing that accelerates from zero velocity.
+
+    :param progress: Linear progress between 0 and 1.
+    :returns: Eased progress.
+    """
+    return progress * progress
+
+
+def ease_out(progress):
+    """Quadratic easing that decelerates to zero velocity.
+
+    :param progress: Linear progress between 0 and 1.
+    :returns: Eased progress.
+    """
+    return progress * (2 - progress)
+
+
+def ease_in_out(progress):
+    """Cubic easing that accelerates until halfway, then decelerates.
+
+    :param progress: Linear progress between 0 and 1.
+    :returns: Eased progress.
+    """
+    if progress < 0.5:
+        return 4 * progress * progress * progress
+    progress = 2 * progress - 2
+    return 1 + progress * progress * progress / 2
+
+# Easing functions indexed by CSS timing function name.
+EASINGS = {
+    'linear': linear,
+    'ease-in': ease_in,
+    'ease-out': ease_out,
+    'ease-in-out': ease_in_out
+}
+
+
+def get_easing(easing):
+    """Retrieves the easing function denoted by the given value.
+
+    :param easing: Easing function or registered easing name.
+    :returns: Easing function.
+    """
+    if callable(easing):
+        return easing
+    if easing not in EASINGS:
+        raise ValueError('Unknown easing %s' % easing)
+    return EASINGS[easing]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    EventPipeline
+    =============
+
+    An **EventPipeline** prepares events polled from pygame queue before
+    they are processed by the current screen :
+
+    - pygame queue is restricted, using *set_allowed()*, to the event types
+      screens subscribe to, so other events never reach the main loop.
+    - events of other types that are still polled are dropped.
+    - runs of consecutive *MOUSEMOTION* events are merged into a single one,
+      holding the last position and the cumulated relative motion.
+
+    Screens subscribe to event types through their *EVENT_TYPES* attribute.
+    Counters of events received, dropped and dispatched are available
+    through screenflow *event_stats()* method.
+"""
+
+from pygame import display
+from pygame.event import Event, set_allowed, set_blocked
+from pygame.constants import QUIT, MOUSEMOTION
+
+# Event types always allowed.
+DEFAULT_TYPES = (QUIT,)
+
+
+def merge_motions(motions):
+    """Merges the given motion events into a single one.
+
+    :param motions: Consecutive motion events to merge.
+    :returns: Merged motion event.
+    """
+    last = motions[-1]
+    if len(motions) == 1:
+        return last
+    rel = [0, 0]
+    for motion in motions:
+        motion_rel = getattr(motion, 'rel', (0, 0))
+        rel[0] += motion_rel[0]
+        rel[1] += motion_rel[1]
+    attributes = dict(last.__dict__)
+    attributes['rel'] = tuple(rel)
+    return Event(MOUSEMOTION, attributes)
+
+
+class EventPipeline(object):
+    """ Filters and coalesces events before dispatching them. """
+
+    def __init__(self):
+        """ Default constructor. """
+        self.types = set(DEFAULT_TYPES)
+        self.received = 0
+        self.dropped = 0
+        self.dispatched = 0
+        self._applied = False
+
+    def subscribe(self, types):
+        """Allows the given event types, updating pygame queue
+        restriction if already applied.
+
+        :param types: Collection of event types to allow.
+        """
+        added = set(types) - self.types
+        if len(added) == 0:
+            return
+        self.types |= added
+        if self._applied:
+            self.apply()
+
+    def apply(self):
+        """Restricts pygame queue to subscribed event types.
+
+        :returns: True if restriction has been applied, False if display
+            is not initialized.
+        """
+        if not display.get_init():
+            return False
+        set_blocked(None)
+        set_allowed(sorted(self.types))
+        self._applied = True
+        return True
+
+    def release(self):
+        """ Allows again all event types into pygame queue. """
+        if self._applied and display.get_init():
+            set_allowed(None)
+        self._applied = False
+
+    def process(self, pending):
+        """Filters and coalesces the given events.
+
+        :param pending: Events polled from pygame queue.
+        :returns: List of events to dispatch.
+        """
+        self.received += len(pending)
+        dispatched = []
+        motions = []
+        for event in pending:
+            if event.type not in self.types:
+                continue
+            if event.type == MOUSEMOTION:
+                motions.append(event)
+                continue
+            if len(motions) > 0:
+                dispatched.append(merge_motions(motions))
+                motions = []
+            dispatched.append(event)
+        if len(motions) > 0:
+            dispatched.append(merge_motions(motions))
+        self.dropped += len(pending) - len(dispatched)
+        self.dispatched += len(dispatched)
+        return dispatched
+
+    def stats(self):
+        """
+        :returns: Dictionary of event counters.
+        """
+        return {
+            'received': self.received,
+            'dropped': self.dropped,
+            'dispatched': self.dispatched}
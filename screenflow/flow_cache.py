@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Flow cache
+    ==========
+
+    Parsing a XML flow definition file is done once : normalized screen
+    definitions are then written into a compiled cache file, using marshal
+    format, into the screenflow cache directory. Cache file is keyed by the
+    hash of XML content, screenflow version and Python version, so later
+    loads of an unchanged file read compiled definitions directly, without
+    parsing XML.
+
+    Definitions are plain dictionaries following xmltodict conventions :
+    attributes are prefixed with *@*, repeated elements are lists, and text
+    of elements with attributes is stored under *#text*.
+
+    Large flow files can be parsed in streaming mode, using ElementTree
+    iterparse : each screen element is converted then dropped, so the whole
+    document never sits in memory.
+
+    .. code-block:: python
+
+        screenflow.load_from_file('flow.xml', streaming=True)
+"""
+
+from __future__ import absolute_import
+
+import sys
+import logging
+from screenflow import __version__
+from screenflow.constants import XML_SCREENFLOW, XML_SCREEN
+from screenflow.utils.cache import get_cache_path
+from screenflow.utils.cache import get_digest as get_file_digest
+from screenflow.utils.cache import read_compiled, write_compiled
+
+# Configure logger.
+logger = logging.getLogger(__name__)
+
+# Version of the compiled cache format, bumped when format changes.
+CACHE_FORMAT = 1
+
+
+def normalize(value):
+    """Converts the given xmltodict value into plain builtin types.
+
+    :param value: Value to convert.
+    :returns: Converted value.
+    """
+    if isinstance(value, dict):
+        return dict((key, normalize(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return [normalize(item) for item in value]
+    return value
+
+
+def parse_definitions(content):
+    """Extracts screen definitions from the given parsed XML document.
+
+    :param content: Document as a dictionary from xmltodict parsing.
+    :returns: List of screen definitions.
+    """
+    if XML_SCREENFLOW not in content.keys():
+        raise AttributeError('No screenflow root element found')
+    screenflow_def = content[XML_SCREENFLOW]
+    if not screenflow_def or XML_SCREEN not in screenflow_def.keys():
+        raise AttributeError('No screen definition found')
+    screens = screenflow_def[XML_SCREEN]
+    if not isinstance(screens, list):
+        screens = [screens]
+    return [normalize(screen_def) for screen_def in screens]
+
+
+def parse_file(flow_file):
+    """Parses the given XML flow file as a whole document.
+
+    :param flow_file: XML flow file to parse.
+    :returns: List of screen definitions.
+    """
+    import xmltodict
+    with open(flow_file, 'rb') as stream:
+        return parse_definitions(xmltodict.parse(stream.read()))
+
+
+def element_to_definition(element):
+    """Converts the given element into a definition, following
+    xmltodict conventions.
+
+    :param element: ElementTree element to convert.
+    :returns: Converted definition.
+    """
+    definition = {}
+    for key, value in element.attrib.items():
+        definition['@' + key] = value
+    for child in element:
+        value = element_to_definition(child)
+        if child.tag not in definition:
+            definition[child.tag] = value
+        elif isinstance(definition[child.tag], list):
+            definition[child.tag].append(value)
+        else:
+            definition[child.tag] = [definition[child.tag], value]
+    text = (element.text or '').strip()
+    if text:
+        if not definition:
+            return text
+        definition['#text'] = text
+    elif not definition:
+        return None
+    return definition
+
+
+def iterparse_file(flow_file):
+    """Parses the given XML flow file in streaming mode, dropping each
+    screen element once converted.
+
+    :param flow_file: XML flow file to parse.
+    :returns: Generator of screen definitions.
+    """
+    from xml.etree.ElementTree import iterparse
+    root = None
+    depth = 0
+    found = False
+    for event, element in iterparse(flow_file, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+                if root.tag != XML_SCREENFLOW:
+                    raise AttributeError('No screenflow root element found')
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 1 and element.tag == XML_SCREEN:
+            found = True
+            yield element_to_definition(element)
+            root.clear()
+    if not found:
+        raise AttributeError('No screen definition found')
+
+
+def get_digest(flow_file):
+    """Computes the cache key of the given flow file.
+
+    :param flow_file: XML flow file to compute key for.
+    :returns: Hexadecimal digest of file content and versions.
+    """
+    return get_file_digest(flow_file, '%s:%d:%d.%d:' % (
+        __version__,
+        CACHE_FORMAT,
+        sys.version_info[0],
+        sys.version_info[1]))
+
+
+def get_cache_file(digest):
+    """
+    :param digest: Cache key of a flow file.
+    :returns: Path of the compiled cache file for the given key.
+    """
+    return get_cache_path('flow-%s.marshal' % digest)
+
+
+def read_cache(digest):
+    """Reads compiled definitions for the given key if any.
+
+    :param digest: Cache key of a flow file.
+    :returns: List of screen definitions, None if not cached.
+    """
+    return read_compiled(get_cache_file(digest), digest)
+
+
+def write_cache(digest, definitions):
+    """Writes compiled definitions for the given key.
+
+    :param digest: Cache key of a flow file.
+    :param definitions: List of screen definitions.
+    """
+    write_compiled(get_cache_file(digest), digest, definitions)
+
+
+def load_definitions(flow_file, cache=True, streaming=False):
+    """Loads screen definitions of the given flow file, from compiled
+    cache if available, parsing XML and writing cache otherwise.
+
+    :param flow_file: XML flow file to load.
+    :param cache: True to use compiled cache.
+    :param streaming: True to parse XML in streaming mode.
+    :returns: List of screen definitions.
+    """
+    digest = None
+    if cache:
+        digest = get_digest(flow_file)
+        definitions = read_cache(digest)
+        if definitions is not None:
+            logger.debug('Loaded %s from compiled cache', flow_file)
+            return definitions
+    if streaming:
+        definitions = list(iterparse_file(flow_file))
+    else:
+        definitions = parse_file(flow_file)
+    if cache:
+        write_cache(digest, definitions)
+    return definitions
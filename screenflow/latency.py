@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    LatencyTracer
+    =============
+
+    A **LatencyTracer** measures input to photon latency : time from an
+    input event being dequeued by the screenflow, to the first frame which
+    shows its effect being presented. Each input is followed through the
+    following steps, timestamped when reached :
+
+    - *callback* : a screen callback is dispatched.
+    - *navigate* : a navigation toward another screen is requested.
+    - *preview* : previews used by the transition are generated.
+    - *present* : first transition frame is presented, or for an input that
+      does not navigate, first frame presented after it.
+
+    A tap is traced from its *MOUSEBUTTONDOWN* : the trace is kept open when
+    the matching *MOUSEBUTTONUP* is dequeued. Any other trace left unfinished
+    is dropped when a new input is dequeued. Tracing
+    is disabled by default and can be enabled on a screenflow instance :
+
+    .. code-block:: python
+
+        screenflow.enable_latency_tracing()
+        ...
+        stats = screenflow.latency_stats()
+        print(stats['screens']['foo']['p95'])
+
+    Latencies are aggregated into histograms, globally, for each screen
+    input occurred on, and for each dispatched callback (inputs without
+    callback are aggregated under *NO_CALLBACK*). Each histogram reports
+    the number of latencies per bucket along with percentiles, expressed
+    in milliseconds. Global statistics also hold a breakdown of latency
+    by step, each step measured from the previous one reached.
+"""
+
+from timeit import default_timer as timer
+from pygame.constants import MOUSEBUTTONDOWN, MOUSEBUTTONUP
+from screenflow.profiler import RingBuffer, summarize, DEFAULT_CAPACITY
+
+# Event types considered as inputs.
+INPUT_TYPES = (MOUSEBUTTONDOWN, MOUSEBUTTONUP)
+
+# Trace steps, ordered.
+CALLBACK = 'callback'
+NAVIGATE = 'navigate'
+PREVIEW = 'preview'
+PRESENT = 'present'
+STEPS = (CALLBACK, NAVIGATE, PREVIEW, PRESENT)
+
+# Name used for inputs that did not dispatch any callback.
+NO_CALLBACK = '-'
+
+# Upper bounds in milliseconds of histogram buckets.
+BUCKETS = (8, 16, 33, 50, 100, 200, 500, 1000)
+
+
+class LatencyHistogram(object):
+    """ Bucketed latency histogram, with percentiles over recent values. """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """Default constructor.
+
+        :param capacity: Number of latencies kept for percentiles.
+        """
+        self._counts = [0] * (len(BUCKETS) + 1)
+        self._recent = RingBuffer(capacity)
+        self.count = 0
+
+    def record(self, latency):
+        """Records the given latency.
+
+        :param latency: Latency in seconds.
+        """
+        milliseconds = latency * 1000.0
+        index = 0
+        while index < len(BUCKETS) and milliseconds > BUCKETS[index]:
+            index += 1
+        self._counts[index] += 1
+        self._recent.append(latency)
+        self.count += 1
+
+    def stats(self):
+        """
+        :returns: Dictionary of count, percentiles and bucket counts.
+        """
+        stats = summarize(self._recent)
+        stats['count'] = self.count
+        buckets = []
+        for bound, count in zip(BUCKETS, self._counts):
+            buckets.append((bound, count))
+        buckets.append((None, self._counts[-1]))
+        stats['buckets'] = buckets
+        return stats
+
+
+class Trace(object):
+    """ Timestamps of a single input followed through steps. """
+
+    def __init__(self, screen, pressed=False):
+        """Default constructor.
+
+        :param screen: Name of the screen input occurred on.
+        :param pressed: True if input is a button press awaiting its release.
+        """
+        self.screen = screen
+        self.pressed = pressed
+        self.callback = None
+        self.start = timer()
+        self.steps = []
+
+    @property
+    def navigated(self):
+        """
+        :returns: True if a navigation has been requested for this input.
+        """
+        return any(step == NAVIGATE for step, _ in self.steps)
+
+    def mark(self, step):
+        """Timestamps the given step, if not reached yet.
+
+        :param step: Reached step.
+        """
+        for reached, _ in self.steps:
+            if reached == step:
+                return
+        self.steps.append((step, timer()))
+
+
+class LatencyTracer(object):
+    """ Follows inputs through screenflow until presented. """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        """Default constructor.
+
+        :param capacity: Number of latencies kept by each histogram.
+        """
+        self.capacity = capacity
+        self._trace = None
+        self._total = LatencyHistogram(capacity)
+        self._steps = dict(
+            (step, LatencyHistogram(capacity)) for step in STEPS)
+        self._screens = {}
+        self._callbacks = {}
+        self.dropped = 0
+
+    def begin(self, pending, screen):
+        """Starts a trace if the given dequeued events hold an input. A button
+        release following the press current trace started from continues
+        such trace.
+
+        :param pending: Dequeued events.
+        :param screen: Name of the screen processing the events.
+        """
+        for event in pending:
+            if event.type not in INPUT_TYPES:
+                continue
+            trace = self._trace
+            if trace is not None and trace.pressed \
+                    and event.type == MOUSEBUTTONUP:
+                trace.pressed = False
+                continue
+            if trace is not None:
+                self.dropped += 1
+            self._trace = Trace(screen, event.type == MOUSEBUTTONDOWN)
+
+    def dispatched(self, callback):
+        """Notifies that the given callback is dispatched for current input.
+
+        :param callback: Dispatched callback.
+        """
+        if self._trace is None or self._trace.callback is not None:
+            return
+        self._trace.callback = getattr(callback, '__name__', repr(callback))
+        self._trace.mark(CALLBACK)
+
+    def mark(self, step):
+        """Notifies that the given step is reached for current input.
+
+        :param step: Reached step.
+        """
+        if self._trace is not None:
+            self._trace.mark(step)
+
+    def presented(self, transition):
+        """Notifies that a frame has been presented, ending current trace
+        unless it navigated and the frame is not a transition one.
+
+        :param transition: True if presented frame is a transition frame.
+        """
+        trace = self._trace
+        if trace is None or (trace.navigated and not transition):
+            return
+        trace.mark(PRESENT)
+        self._trace = None
+        previous = trace.start
+        for step, time in trace.steps:
+            self._steps[step].record(time - previous)
+            previous = time
+        latency = previous - trace.start
+        self._total.record(latency)
+        callback = trace.callback or NO_CALLBACK
+        for histograms, key in (
+                (self._screens, trace.screen),
+                (self._callbacks, callback)):
+            if key not in histograms:
+                histograms[key] = LatencyHistogram(self.capacity)
+            histograms[key].record(latency)
+
+    def stats(self):
+        """Computes latency statistics over recorded inputs.
+
+        :returns: Dictionary of statistics, with per step, per screen
+            and per callback breakdown.
+        """
+        stats = self._total.stats()
+        stats['dropped'] = self.dropped
+        stats['steps'] = {}
+        for step, histogram in self._steps.items():
+            stats['steps'][step] = histogram.stats()
+        stats['screens'] = {}
+        for name, histogram in self._screens.items():
+            stats['screens'][name] = histogram.stats()
+        stats['callbacks'] = {}
+        for name, histogram in self._callbacks.items():
+            stats['callbacks'][name] = histogram.stats()
+        return stats
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Prefetcher
+    ==========
+
+    A **Prefetcher** renders previews of the screens that are likely to be
+    displayed next, using screenflow idle time, so a navigation toward them
+    starts with a ready preview.
+
+    Screens likely to come next after a given screen are :
+
+    - screens declared as successors, either in XML definition :
+
+    .. code-block:: xml
+
+        <screen name="foo" type="message">
+            <message>Foo</message>
+            <next>bar</next>
+        </screen>
+
+    or using *link()* method of screenflow :
+
+    .. code-block:: python
+
+        screenflow.link('foo', 'bar')
+
+    - screens previously navigated to from this screen, most frequent first.
+    - screen below in the navigation stack, as target of a back navigation.
+
+    Previews are rendered one per idle iteration, until all likely screens
+    are rendered or the memory budget is reached. Previews prefetched for a
+    previous screen but not likely anymore are released.
+"""
+
+import logging
+
+# Configure logger.
+logger = logging.getLogger(__name__)
+
+# Default memory budget in bytes for prefetched previews.
+DEFAULT_BUDGET = 32 * 1024 * 1024
+
+# Estimated number of bytes per preview pixel.
+PIXEL_BYTES = 4
+
+
+class Prefetcher(object):
+    """ Renders previews of likely next screens within a memory budget. """
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        """Default constructor.
+
+        :param budget: Memory budget in bytes for prefetched previews.
+        """
+        self.budget = budget
+        self._queue = []
+        self._prefetched = []
+        self._size = None
+        self.rendered = 0
+
+    @property
+    def pending(self):
+        """
+        :returns: True if some previews remain to be rendered.
+        """
+        return len(self._queue) > 0
+
+    def get_cost(self, size):
+        """Estimates memory cost of a preview of the given size.
+
+        :param size: Preview size.
+        :returns: Estimated number of bytes.
+        """
+        return size[0] * size[1] * PIXEL_BYTES
+
+    def schedule(self, screens, size):
+        """Schedules rendering of the given screens previews, releasing
+        previously prefetched previews which are not required anymore.
+
+        :param screens: Screens to prefetch, most likely first.
+        :param size: Size of previews to render.
+        """
+        for screen in self._prefetched:
+            if screen not in screens or size != self._size:
+                screen.drop_preview(self._size)
+        self._prefetched = [s for s in self._prefetched if s in screens]
+        if size != self._size:
+            self._prefetched = []
+        self._size = size
+        count = self.budget // self.get_cost(size)
+        self._queue = list(screens[:count])
+
+    def step(self):
+        """Renders the next scheduled preview if any.
+
+        :returns: True if some previews remain to be rendered.
+        """
+        if len(self._queue) == 0:
+            return False
+        screen = self._queue.pop(0)
+        if not screen.has_preview(self._size):
+            logger.debug('Prefetching %s preview', screen.name)
+            screen.generate_preview(self._size)
+            self.rendered += 1
+        if screen not in self._prefetched:
+            self._prefetched.append(screen)
+        return len(self._queue) > 0
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    FrameProfiler
+    =============
+
+    A **FrameProfiler** records how long each phase of a screenflow frame
+    takes. Recorded phases are :
+
+    - *events* : event processing, including screen callbacks.
+    - *update* : transition update and screen activation.
+    - *draw* : screen rendering.
+    - *present* : display update.
+
+    Durations are kept in fixed size ring buffers, globally and for each
+    screen, so memory usage does not grow with running time. Profiling is
+    disabled by default and can be enabled on a screenflow instance :
+
+    .. code-block:: python
+
+        screenflow.enable_profiler()
+        ...
+        stats = screenflow.stats()
+        print(stats['phases']['draw']['p95'])
+
+    Statistics are expressed in milliseconds. A frame is considered as
+    dropped when its total duration exceeds the frame budget (derived from
+    screenflow *max_fps* option).
+"""
+
+from math import ceil
+from timeit import default_timer as timer
+
+# Phase indexes.
+EVENTS = 0
+UPDATE = 1
+DRAW = 2
+PRESENT = 3
+
+# Phase names, ordered by index.
+PHASES = ('events', 'update', 'draw', 'present')
+
+# Name used for total frame duration statistics.
+FRAME = 'frame'
+
+# Default number of frames kept by a profiler.
+DEFAULT_CAPACITY = 512
+
+# Percentiles exposed by statistics.
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values, rank):
+    """Computes the given percentile of the given sorted values
+    using nearest rank method.
+
+    :param values: Sorted values to compute percentile for.
+    :param rank: Percentile rank to compute, between 0 and 100.
+    :returns: Computed percentile, 0 if values are empty.
+    """
+    if len(values) == 0:
+        return 0.0
+    index = int(ceil(rank / 100.0 * len(values))) - 1
+    return values[min(max(index, 0), len(values) - 1)]
+
+
+def summarize(buffer):
+    """Computes percentiles and maximum of the given buffer values.
+
+    :param buffer: Ring buffer of durations in seconds.
+    :returns: Dictionary of statistics in milliseconds.
+    """
+    values = sorted(buffer.values())
+    summary = {}
+    for rank in PERCENTILES:
+        summary['p%d' % rank] = percentile(values, rank) * 1000.0
+    summary['max'] = values[-1] * 1000.0 if len(values) > 0 else 0.0
+    return summary
+
+
+class RingBuffer(object):
+    """ Fixed size buffer that overwrites oldest values once full. """
+
+    def __init__(self, capacity):
+        """Default constructor.
+
+        :param capacity: Maximum number of values kept.
+        """
+        self._values = [0.0] * capacity
+        self._capacity = capacity
+        self._index = 0
+        self._size = 0
+
+    def __len__(self):
+        """
+        :returns: Number of values kept.
+        """
+        return self._size
+
+    def append(self, value):
+        """Adds the given value, overwriting the oldest one if full.
+
+        :param value: Value to add.
+        """
+        self._values[self._index] = value
+        self._index = (self._index + 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+
+    def values(self):
+        """
+        :returns: List of kept values.
+        """
+        return self._values[:self._size]
+
+
+class FrameTimings(object):
+    """ Collection of frame phase durations. """
+
+    def __init__(self, capacity):
+        """Default constructor.
+
+        :param capacity: Maximum number of frames kept.
+        """
+        self._phases = [RingBuffer(capacity) for _ in PHASES]
+        self._totals = RingBuffer(capacity)
+        self.frames = 0
+        self.dropped = 0
+
+    def record(self, durations, total, dropped):
+        """Records a frame.
+
+        :param durations: Duration of each phase, indexed by phase.
+        :param total: Total duration of the frame.
+        :param dropped: True if the frame exceeded its budget.
+        """
+        for buffer, duration in zip(self._phases, durations):
+            buffer.append(duration)
+        self._totals.append(total)
+        self.frames += 1
+        if dropped:
+            self.dropped += 1
+
+    def stats(self):
+        """Computes statistics over recorded frames.
+
+        :returns: Dictionary of statistics in milliseconds.
+        """
+        phases = {}
+        for name, buffer in zip(PHASES, self._phases):
+            phases[name] = summarize(buffer)
+        phases[FRAME] = summarize(self._totals)
+        return {
+            'frames': self.frames,
+            'dropped': self.dropped,
+            'phases': phases}
+
+
+class FrameProfiler(object):
+    """ Records frame phase durations globally and per screen. """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, budget=None):
+        """Default constructor.
+
+        :param capacity: Number of frames kept by each ring buffer.
+        :param budget: Optional frame budget in seconds.
+        """
+        self.capacity = capacity
+        self.budget = budget
+        self._timings = FrameTimings(capacity)
+        self._screens = {}
+        self._screen = None
+        self._durations = [0.0] * len(PHASES)
+        self._start = 0.0
+        self._last = 0.0
+
+    def begin_frame(self, screen):
+        """Starts recording a frame.
+
+        :param screen: Name of the screen the frame is rendered for.
+        """
+        self._screen = screen
+        for i in range(len(self._durations)):
+            self._durations[i] = 0.0
+        self._start = self._last = timer()
+
+    def mark(self, phase):
+        """Accounts time elapsed since previous mark to the given phase.
+
+        :param phase: Index of the phase that just ended.
+        """
+        now = timer()
+        self._durations[phase] += now - self._last
+        self._last = now
+
+    def end_frame(self, record=True):
+        """Ends current frame.
+
+        :param record: False if frame should be discarded (nothing happened).
+        """
+        if not record:
+            return
+        total = self._last - self._start
+        dropped = self.budget is not None and total > self.budget
+        self._timings.record(self._durations, total, dropped)
+        if self._screen not in self._screens:
+            self._screens[self._screen] = FrameTimings(self.capacity)
+        self._screens[self._screen].record(self._durations, total, dropped)
+
+    def stats(self):
+        """Computes statistics over recorded frames.
+
+        :returns: Dictionary of statistics, with per screen breakdown.
+        """
+        stats = self._timings.stats()
+        stats['screens'] = {}
+        for name, timings in self._screens.items():
+            stats['screens'][name] = timings.stats()
+        return stats
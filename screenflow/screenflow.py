@@ -43,6 +43,27 @@
     The *name* attribute will be used for attribute binding. Checkout
     available screens documentation to know what parameter can be settled.
 
+    Parsed screen definitions are stored into a compiled cache, so later
+    loads of the same file do not parse XML again. See **flow_cache**
+    documentation for details, including streaming parsing of large files.
+
+    Lazy loading
+    ------------
+
+    Loading a flow file with the *lazy* flag only indexes screen definitions
+    by name : each screen is then created and styled on first access, either
+    through attribute binding or when its preview is prefetched as a likely
+    successor.
+
+    .. code-block:: python
+
+        screenflow.load_from_file('flow.xml', lazy=True)
+
+    Whatever the loading mode, screens that left the navigation stack for
+    more than *release_after* navigations release their cached surfaces,
+    unless they are likely to be displayed next. Memory thus grows with
+    screens recently visited rather than with flow size.
+
     Custom screen
     -------------
 
@@ -58,29 +79,221 @@
             my_screen = ... // Create your screen instance here.
             return my_screen
 
-    Where *screen_def* parameter is a dictionary from xmltodict parsing
-    library. Then registering such function is as easy as following :
+    Where *screen_def* parameter is a dictionary following xmltodict parsing
+    conventions. Then registering such function is as easy as following :
 
     .. code-block:: python
 
         screenflow = ScreenFlow()
         screenflow.register_factory('type_name', my_factory)
 
+    Asynchronous mode
+    -----------------
+
+    On Python 3, a screenflow can run on an asyncio event loop using
+    *run_async()* method, which returns a future resolved once the flow
+    is stopped. Frames are then scheduled on the loop, and screen callbacks
+    can be coroutine functions : they are scheduled as tasks, so input and
+    transitions keep running while they wait, and can call *navigate_to()*
+    once they are done.
+
+    .. code-block:: python
+
+        @screenflow.scan.on_touch
+        async def on_scan_touch():
+            networks = await scan_networks()
+            screenflow.navigate_to(screenflow.networks)
+
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(screenflow.run_async(screenflow.scan))
+
+    An exception raised by a callback task stops the flow and is propagated
+    through the returned future. Coroutine callbacks used with the blocking
+    *run()* method are run to completion before the loop continues.
+
+    Headless mode
+    -------------
+
+    A screenflow can render without any physical display, using SDL dummy
+    video driver, by passing the *headless* flag to the constructor along
+    with the desired *resolution*. This is mostly useful for testing and
+    benchmarking, as rendering happens into a real offscreen surface.
+
+    Main loop
+    ---------
+
+    Once started using *run()* method, a screenflow maintains a main loop
+    which behavior is driven by two options, that can be given to constructor
+    or settled as attribute at any moment :
+
+    - *idle_mode* : either ``ScreenFlow.IDLE_WAIT`` (default) where loop
+      blocks on event queue while current screen is displayed and nothing is
+      animating, or ``ScreenFlow.IDLE_POLL`` where event queue is continuously
+      polled.
+    - *max_fps* : maximum frame rate used for pacing transition frames, and
+      polling iteration in ``IDLE_POLL`` mode. A value of 0 disables capping.
+
+    In ``IDLE_WAIT`` mode, event waiting is bounded by *idle_timeout*
+    (in milliseconds) so *quit()* calls are honored even if no event occurs.
+
+    Transitions
+    -----------
+
+    Navigating between screens performs a slide transition, which duration
+    and easing are defined by the *transition-duration* and
+    *transition-timing-function* CSS properties of the screen navigated to
+    (or navigated back from). Transition can also be triggered manually
+    using *set_transition()* method with explicit duration and easing.
+
+    Idle tasks and prefetching
+    --------------------------
+
+    Work that is not required for the current frame can be scheduled with
+    *schedule_idle()* : such task is run step by step, only when no event
+    is pending, pending tasks taking turns. While idle tasks are pending,
+    the loop is paced to *max_fps* in both idle modes. Enabling prefetching
+    through *enable_prefetch()* uses this facility for rendering previews of
+    the screens likely to be displayed next, see **Prefetcher** documentation
+    for details.
+
+    Event pipeline
+    --------------
+
+    Events polled from pygame queue go through an **EventPipeline** before
+    being processed by current screen : pygame queue is restricted to event
+    types screens handle, and runs of mouse motion events are merged. Event
+    counters are available through *event_stats()* method.
+
+    Display update
+    --------------
+
+    Rather than flipping the whole display at each iteration, a screenflow
+    collects areas modified during the frame (returned by screen *draw()*
+    method, or requested by screen through *damage()*), merges them and only
+    updates those areas. A frame without any modification is not presented.
+
+    Styles reloading
+    ----------------
+
+    A CSS file loaded with the *watch* flag is checked for modification
+    at most every *watch_interval* milliseconds while the flow runs. Once
+    modified, loaded styles are parsed again and only screens matching a
+    changed selector are restyled and redrawn.
+
+    .. code-block:: python
+
+        screenflow.load_style('kiosk.css', watch=True)
+
+    Fonts
+    -----
+
+    Fonts are located through a font index persisted into screenflow cache
+    directory, see **FontIndex** documentation for details. Once the start
+    screen is displayed, fonts used by other screens according to loaded
+    styles are created while idle.
+
+    Surface allocation
+    ------------------
+
+    All screens of a screenflow share a **SurfacePool** as surface factory,
+    so intermediate surfaces released on re-layout are reused instead of
+    allocated again. Allocation and reuse counters are available through
+    *pool_stats()* method.
+
+    Compositing
+    -----------
+
+    Several screenflows can share a single display, each one rendering into
+    a region of it, using a **Compositor** which drives all of them from a
+    single main loop, see **Compositor** documentation for details.
+
+    Latency tracing
+    ---------------
+
+    Input to photon latency, from an input event being dequeued to the first
+    transition frame it leads to being presented, can be traced by enabling
+    latency tracing through *enable_latency_tracing()*. Histograms are then
+    available through *latency_stats()* method, see **LatencyTracer**
+    documentation for details.
+
+    Profiling
+    ---------
+
+    A frame profiler can be enabled through *enable_profiler()* in order
+    to record time spent in each frame phase. Collected statistics are then
+    available through *stats()* method, see **FrameProfiler** documentation
+    for details.
+
 """
 
+from __future__ import absolute_import
+
 import logging
-import xmltodict
-from pygame import time, FULLSCREEN, HWSURFACE, DOUBLEBUF
-from pygame.display import set_mode, flip, Info
-from screens import configure_screenflow
-from constants import XML_SCREENFLOW, XML_SCREEN, XML_TYPE
-from css.font_manager import FontManager
-from css.style_factory import StyleFactory
+from collections import namedtuple
+from os.path import getmtime
+from pygame import time, Rect, FULLSCREEN, HWSURFACE, DOUBLEBUF, NOEVENT
+from pygame.display import set_mode, flip, update, Info
+from pygame.event import get as events, wait as wait_event
+from pygame.time import get_ticks
+from screenflow.screens import configure_screenflow
+from screenflow.constants import XML_TYPE, XML_NAME, XML_NEXT
+from screenflow.css.font_manager import FontManager
+from screenflow.css.style_factory import StyleFactory
+from screenflow.css.style_factory import DEFAULT_TRANSITION_DURATION
+from screenflow.css.style_factory import DEFAULT_TRANSITION_EASING
+from screenflow.easing import get_easing
+from screenflow.prefetcher import Prefetcher, DEFAULT_BUDGET
+from screenflow.event_pipeline import EventPipeline
+from screenflow.flow_cache import load_definitions
+from screenflow.utils.rects import merge_rects
+from screenflow.utils.headless import create_headless_surface
+from screenflow.utils.headless import DEFAULT_RESOLUTION
+from screenflow.utils.async_support import get_asyncio, is_awaitable
+from screenflow.utils.surface_pool import SurfacePool
+from screenflow.profiler import FrameProfiler, DEFAULT_CAPACITY
+from screenflow.latency import LatencyTracer, NAVIGATE, PREVIEW
+from screenflow.profiler import EVENTS, UPDATE, DRAW, PRESENT
 
 # Configure logger.
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
+# Name and type of a screen, used to resolve styles of screen definitions.
+ScreenKey = namedtuple('ScreenKey', ('name', 'type'))
+
+# Default frame rate cap used for animation.
+DEFAULT_MAX_FPS = 60
+
+# Default maximum time in milliseconds the main loop blocks while idle.
+DEFAULT_IDLE_TIMEOUT = 250
+
+# Default number of navigations after which an inactive screen releases
+# its caches.
+DEFAULT_RELEASE_AFTER = 3
+
+# Default minimum time in milliseconds between two checks of watched styles.
+DEFAULT_WATCH_INTERVAL = 1000
+
+
+def create_display(headless=False, resolution=None):
+    """Creates the display surface, either fullscreen or headless.
+
+    :param headless: True to render offscreen using SDL dummy video driver.
+    :param resolution: Resolution of the created surface, default to the
+        current display one, or to DEFAULT_RESOLUTION if headless.
+    :returns: Created surface.
+    """
+    if headless:
+        resolution = tuple(resolution or DEFAULT_RESOLUTION)
+        logger.info('Creating headless surface (%s, %s)' % resolution)
+        return create_headless_surface(resolution)
+    logger.info('Creating surface')
+    if resolution is None:
+        info = Info()
+        resolution = (info.current_w, info.current_h)
+    flags = FULLSCREEN | HWSURFACE | DOUBLEBUF
+    logger.info('Creating surface (%s, %s)' % tuple(resolution))
+    return set_mode(resolution, flags)
+
 
 class NavigationException(Exception):
     """ Custom exception for navigation issues. """
@@ -88,7 +301,12 @@ class NavigationException(Exception):
 
 
 class ScreenTransition(object):
-    """ Simple class for managing transition between two given screens. """
+    """Simple class for managing transition between two given screens.
+
+    Transition progress is driven by elapsed time rather than by iteration
+    count, so a transition always lasts for its given duration whatever the
+    frame rate is, skipping intermediate positions if rendering lags behind.
+    """
 
     # Constant for forward transition.
     FORWARD = -1
@@ -96,30 +314,54 @@ class ScreenTransition(object):
     # Constant for backward transition.
     BACKWARD = 1
 
-    def __init__(self, previews, side, speed=5):
+    def __init__(
+            self,
+            previews,
+            side,
+            duration=DEFAULT_TRANSITION_DURATION,
+            easing=DEFAULT_TRANSITION_EASING,
+            clock=get_ticks):
         """Default constructor.
 
         :param previews: Preview of screen to perform transition between.
         :param side: Side of the transition (FORWARD, or BACKWARD)
-        :param speed: Option speed in pixel of the performed transition.
+        :param duration: Duration of the transition in milliseconds.
+        :param easing: Easing function, or name of a registered one.
+        :param clock: Function that returns current time in milliseconds.
         """
         self._previews = previews
         self._side = side
-        self._speed = side * speed
+        self._duration = max(duration, 1)
+        self._easing = get_easing(easing)
+        self._clock = clock
+        self._start = clock()
         self._position = 0
         if side == ScreenTransition.FORWARD:
             self._position = previews[0].get_size()[0]
 
+    def get_progress(self):
+        """Computes eased progress of this transition.
+
+        :returns: Eased progress, or None if this transition is finished.
+        """
+        elapsed = self._clock() - self._start
+        if elapsed >= self._duration:
+            return None
+        return self._easing(float(elapsed) / self._duration)
+
     def update(self, surface):
         """Performs a transition iteration over internal screen previews.
 
         :param surface: Surface to draw transition in.
         :returns: True is the transition worked, False if already finished.
         """
-        self._position += self._speed
-        size = surface.get_size()[0]
-        if self._position < 0 or self._position > size:
+        progress = self.get_progress()
+        if progress is None:
             return False
+        size = surface.get_size()[0]
+        if self._side == ScreenTransition.FORWARD:
+            progress = 1 - progress
+        self._position = int(round(progress * size))
         surface.blit(self._previews[0], (self._position - size, 0))
         surface.blit(self._previews[1], (self._position, 0))
         return True
@@ -137,24 +379,77 @@ class ScreenFlow(object):
     # Constant that indicates this flow is active and a screen is displayed.
     ACTIVE = 1
 
-    def __init__(self, surface=None):
+    # Idle mode where event queue is polled at each loop iteration.
+    IDLE_POLL = 0
+
+    # Idle mode where loop blocks on event queue while nothing is animating.
+    IDLE_WAIT = 1
+
+    def __init__(
+            self,
+            surface=None,
+            max_fps=DEFAULT_MAX_FPS,
+            idle_mode=IDLE_WAIT,
+            headless=False,
+            resolution=None,
+            compositor=None):
         """Default constructor.
 
         Using by default a fullscreen window instance if a target surface
-        is not given.
+        is not given. A flow hosted by a compositor shares its font manager,
+        surface pool and event pipeline.
 
         :param surface: Optional surface this flow will be rendered into.
+        :param max_fps: Frame rate cap for animation (0 means uncapped).
+        :param idle_mode: Main loop behavior while idle
+            (IDLE_WAIT or IDLE_POLL).
+        :param headless: True to render offscreen using SDL dummy video driver.
+        :param resolution: Resolution of the created surface if not given.
+        :param compositor: Optional compositor this flow is hosted by.
         """
         self._screens = {}
+        self._definitions = {}
         self._factories = {}
         self._style_factory = StyleFactory()
-        self._font_manager = FontManager()
+        self._compositor = compositor
+        if compositor is not None:
+            self._font_manager = compositor.font_manager
+            self._surface_pool = compositor.surface_pool
+            self._events = compositor.event_pipeline
+        else:
+            self._font_manager = FontManager()
+            self._surface_pool = SurfacePool()
+            self._events = EventPipeline()
         configure_screenflow(self)
         self._running = False
         self._stack = []
         self._state = ScreenFlow.CREATING
         self._surface = surface
         self._transition = None
+        self._clock = None
+        self._damages = []
+        self._profiler = None
+        self._tracer = None
+        self._prefetcher = None
+        self._idle_tasks = []
+        self._links = {}
+        self._history = {}
+        self._loop = None
+        self._sync_loop = None
+        self._finished = None
+        self._frame_handle = None
+        self._tasks = set()
+        self._navigations = 0
+        self._inactive = {}
+        self._watched = {}
+        self._last_watch = None
+        self.max_fps = max_fps
+        self.idle_mode = idle_mode
+        self.headless = headless
+        self.resolution = resolution
+        self.idle_timeout = DEFAULT_IDLE_TIMEOUT
+        self.release_after = DEFAULT_RELEASE_AFTER
+        self.watch_interval = DEFAULT_WATCH_INTERVAL
 
     @property
     def surface(self):
@@ -165,12 +460,7 @@ class ScreenFlow(object):
         """
         if self._surface is None:
             logger.info('Target surface not specified')
-            logger.info('Creating surface')
-            info = Info()
-            resolution = (info.current_w, info.current_h)
-            flags = FULLSCREEN | HWSURFACE | DOUBLEBUF
-            logger.info('Creating surface (%s, %s)' % resolution)
-            self._surface = set_mode(resolution, flags)
+            self._surface = create_display(self.headless, self.resolution)
         return self._surface
 
     def add_screen(self, screen):
@@ -179,8 +469,36 @@ class ScreenFlow(object):
         :param screen: Screen to add to this flow.
         """
         self._screens[screen.name] = screen
+        self._definitions.pop(screen.name, None)
+        self._inactive[screen.name] = self._navigations
         screen.font_manager = self._font_manager
+        screen.surface_factory = self._surface_pool
+        screen.dispatcher = self.dispatch
         screen.configure_styles(self._style_factory)
+        self._events.subscribe(getattr(screen, 'EVENT_TYPES', ()))
+
+    def has_screen(self, name):
+        """
+        :param name: Name of the screen to check.
+        :returns: True if such screen is created or defined, False otherwise.
+        """
+        return name in self._screens or name in self._definitions
+
+    def get_screen(self, name):
+        """Retrieves the screen denoted by the given name, creating it
+        from its definition on first access if lazily loaded.
+
+        :param name: Name of the screen to retrieve.
+        :returns: Screen instance denoted by the given name.
+        """
+        if name in self._screens:
+            return self._screens[name]
+        if name not in self._definitions:
+            raise AttributeError('Unknown screen %s' % name)
+        logger.debug('Creating screen %s from definition' % name)
+        screen = self.create_screen(self._definitions[name])
+        self.add_screen(screen)
+        return screen
 
     def __getattr__(self, name):
         """Attribute access overloading, allow to access
@@ -189,19 +507,253 @@ class ScreenFlow(object):
         :param name: Name of the attribute to retrieve.
         :returns: Screen instance denoted by the given name.
         """
-        if name in self._screens.keys():
-            return self._screens[name]
-        raise AttributeError('Unknown screen %s' % name)
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self.get_screen(name)
+
+    def enable_profiler(self, capacity=DEFAULT_CAPACITY):
+        """Enables frame profiling, dropping any previously recorded frame.
+
+        :param capacity: Number of frames kept for computing statistics.
+        """
+        budget = None
+        if self.max_fps:
+            budget = 1.0 / self.max_fps
+        self._profiler = FrameProfiler(capacity, budget)
+
+    def disable_profiler(self):
+        """ Disables frame profiling. """
+        self._profiler = None
+
+    def stats(self):
+        """Frame statistics access method.
+
+        :returns: Statistics computed by the frame profiler.
+        """
+        if self._profiler is None:
+            raise AttributeError('Profiler not enabled')
+        return self._profiler.stats()
+
+    def enable_latency_tracing(self, capacity=DEFAULT_CAPACITY):
+        """Enables input latency tracing, dropping any previously traced input.
+
+        :param capacity: Number of latencies kept for computing percentiles.
+        """
+        self._tracer = LatencyTracer(capacity)
+
+    def disable_latency_tracing(self):
+        """ Disables input latency tracing. """
+        self._tracer = None
+
+    def latency_stats(self):
+        """Input latency statistics access method.
+
+        :returns: Statistics computed by the latency tracer.
+        """
+        if self._tracer is None:
+            raise AttributeError('Latency tracing not enabled')
+        return self._tracer.stats()
+
+    def _trace(self, step):
+        """Notifies latency tracer, if any, that the given step is reached.
+
+        :param step: Reached step.
+        """
+        if self._tracer is not None:
+            self._tracer.mark(step)
+
+    def enable_prefetch(self, budget=DEFAULT_BUDGET):
+        """Enables prefetching of likely next screen previews.
+
+        :param budget: Memory budget in bytes for prefetched previews.
+        """
+        self._prefetcher = Prefetcher(budget)
+
+    def disable_prefetch(self):
+        """ Disables prefetching of likely next screen previews. """
+        self._prefetcher = None
 
-    def set_transition(self, previews, side):
+    def link(self, source, target):
+        """Declares the screen denoted by target name as a likely successor
+        of the screen denoted by source name.
+
+        :param source: Name of the screen navigation starts from.
+        :param target: Name of the screen navigation goes to.
+        """
+        targets = self._links.setdefault(source, [])
+        if target not in targets:
+            targets.append(target)
+
+    def predict(self, screen):
+        """Computes names of screens likely to be displayed after the given
+        one. Lazily defined screens are not created.
+
+        :param screen: Screen to compute successors for.
+        :returns: List of likely screen names, most likely first.
+        """
+        candidates = list(self._links.get(screen.name, []))
+        history = self._history.get(screen.name, {})
+        for name in sorted(history, key=history.get, reverse=True):
+            if name not in candidates:
+                candidates.append(name)
+        names = []
+        for name in candidates:
+            if self.has_screen(name) and name != screen.name:
+                names.append(name)
+        if len(self._stack) > 1 and self._stack[-1] is screen:
+            if self._stack[-2].name not in names:
+                names.append(self._stack[-2].name)
+        return names
+
+    def schedule_idle(self, task):
+        """Schedules the given task to be run while this flow is idle. A task
+        is a callable that performs a small unit of work and returns True if
+        it has more work to do.
+
+        :param task: Task to schedule.
+        """
+        if task not in self._idle_tasks:
+            self._idle_tasks.append(task)
+
+    def run_idle_task(self):
+        """Runs one step of the first pending idle task if any. A task
+        that has more work to do is moved to the end of the queue, so
+        pending tasks take turns.
+
+        :returns: True if idle work remains, False otherwise.
+        """
+        if len(self._idle_tasks) == 0:
+            return False
+        task = self._idle_tasks.pop(0)
+        if task():
+            self._idle_tasks.append(task)
+        return len(self._idle_tasks) > 0
+
+    def dispatch(self, callback, *args):
+        """Calls the given screen callback. If such callback is asynchronous,
+        it is scheduled as a task on the event loop this flow is running on,
+        or run to completion if running synchronously.
+
+        :param callback: Callback to call.
+        :param args: Callback arguments.
+        :returns: Callback result, or created task for asynchronous callback.
+        """
+        if self._tracer is not None:
+            self._tracer.dispatched(callback)
+        result = callback(*args)
+        if not is_awaitable(result):
+            return result
+        asyncio = get_asyncio()
+        if self._loop is None:
+            logger.warning('Asynchronous callback used outside of run_async()')
+            if self._sync_loop is None:
+                self._sync_loop = asyncio.new_event_loop()
+            return self._sync_loop.run_until_complete(result)
+        task = asyncio.ensure_future(result, loop=self._loop)
+        self._tasks.add(task)
+        task.add_done_callback(self._on_task_done)
+        return task
+
+    def _on_task_done(self, task):
+        """Callback for asynchronous callback task completion, which stops
+        this flow if the task failed.
+
+        :param task: Completed task.
+        """
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            self._finish_async(error)
+
+    def activate(self, screen):
+        """Notifies the given screen it is now displayed, and schedules
+        prefetching of its likely successors if enabled.
+
+        :param screen: Activated screen.
+        """
+        screen.on_screen_activated()
+        if self._prefetcher is not None:
+            successors = [self.get_screen(n) for n in self.predict(screen)]
+            self._prefetcher.schedule(successors, self.surface.get_size())
+            self.schedule_idle(self._prefetcher.step)
+        self.schedule_idle(self.release_screens)
+
+    def release_screens(self):
+        """Releases cached surfaces of screens that left the navigation
+        stack for more than release_after navigations, excepted the ones
+        likely to be displayed next.
+
+        :returns: False as releasing is done in a single step.
+        """
+        kept = set(screen.name for screen in self._stack)
+        if len(self._stack) > 0:
+            kept.update(self.predict(self._stack[-1]))
+        for name, navigation in list(self._inactive.items()):
+            if name in kept or name not in self._screens:
+                continue
+            if self._navigations - navigation >= self.release_after:
+                logger.debug('Releasing caches of inactive screen %s' % name)
+                self._screens[name].clear_caches()
+                del self._inactive[name]
+        return False
+
+    def _begin_frame(self, screen):
+        """Notifies profiler, if any, that a frame starts for the given screen.
+
+        :param screen: Screen the frame is rendered for.
+        """
+        if self._profiler is not None:
+            self._profiler.begin_frame(screen.name)
+
+    def _mark(self, phase):
+        """Notifies profiler, if any, that the given phase ended.
+
+        :param phase: Phase that ended.
+        """
+        if self._profiler is not None:
+            self._profiler.mark(phase)
+
+    def _end_frame(self, record):
+        """Notifies profiler, if any, that current frame ended.
+
+        :param record: True if the frame should be recorded.
+        """
+        if self._profiler is not None:
+            self._profiler.end_frame(record)
+
+    def set_transition(
+            self,
+            previews,
+            side,
+            duration=DEFAULT_TRANSITION_DURATION,
+            easing=DEFAULT_TRANSITION_EASING):
         """Sets this flow as in transition using given previews and side.
 
         :param previews: Screen previews to use in built transition.
         :param side: Transition side.
+        :param duration: Transition duration in milliseconds.
+        :param easing: Transition easing function, or name of a registered one.
         """
-        self._transition = ScreenTransition(previews, side)
+        self._transition = ScreenTransition(previews, side, duration, easing)
         self._state = ScreenFlow.IN_TRANSITION
 
+    def set_screen_transition(self, previews, side, screen):
+        """Sets this flow as in transition using transition properties
+        defined by the given screen style.
+
+        :param previews: Screen previews to use in built transition.
+        :param side: Transition side.
+        :param screen: Screen which style defines the transition.
+        """
+        style = self._style_factory.get_computed_styles(screen)[0]
+        self.set_transition(
+            previews,
+            side,
+            style.transition_duration,
+            style.transition_easing)
+
     def quit(self):
         """Stops the execution of this screenflow. """
         self._running = False
@@ -215,12 +767,20 @@ class ScreenFlow(object):
         :param screen: Screen to navigate to.
         :returns: Created callback function.
         """
+        self._trace(NAVIGATE)
         size = self.surface.get_size()
         previews = (
             self.surface.copy(),
             screen.generate_preview(size))
+        self._trace(PREVIEW)
+        if len(self._stack) > 0:
+            source = self._stack[-1].name
+            history = self._history.setdefault(source, {})
+            history[screen.name] = history.get(screen.name, 0) + 1
         self._stack.append(screen)
-        self.set_transition(previews, ScreenTransition.FORWARD)
+        self._navigations += 1
+        self._inactive.pop(screen.name, None)
+        self.set_screen_transition(previews, ScreenTransition.FORWARD, screen)
 
     def navigate_back(self):
         """Creates and returns a transition callback function.
@@ -233,10 +793,99 @@ class ScreenFlow(object):
         size = self.surface.get_size()
         if len(self._stack) <= 1:
             raise NavigationException('Cannot navigate back, no more screen.')
-        self._stack.pop()
+        self._trace(NAVIGATE)
+        screen = self._stack.pop()
+        self._navigations += 1
+        if screen not in self._stack:
+            self._inactive[screen.name] = self._navigations
         previews = (self.get_current_screen().generate_preview(size),
                     self.surface.copy())
-        self.set_transition(previews, ScreenTransition.BACKWARD)
+        self._trace(PREVIEW)
+        self.set_screen_transition(previews, ScreenTransition.BACKWARD, screen)
+
+    def preview_stats(self):
+        """Computes preview cache statistics over all screens of this flow.
+
+        :returns: Dictionary with total cache hits and misses.
+        """
+        stats = {'hits': 0, 'misses': 0}
+        for screen in self._screens.values():
+            stats['hits'] += screen.preview_hits
+            stats['misses'] += screen.preview_misses
+        return stats
+
+    def render_stats(self):
+        """Computes render cache statistics over all screens of this flow.
+
+        :returns: Dictionary with total cache usage, and cost of each screen.
+        """
+        stats = {
+            'entries': 0,
+            'cost': 0,
+            'hits': 0,
+            'misses': 0,
+            'screens': {}}
+        for screen in self._screens.values():
+            screen_stats = screen.render_stats()
+            for key in ('entries', 'cost', 'hits', 'misses'):
+                stats[key] += screen_stats[key]
+            stats['screens'][screen.name] = screen_stats['cost']
+        return stats
+
+    def event_stats(self):
+        """Retrieves counters of the event pipeline of this flow.
+
+        :returns: Dictionary of received, dropped and dispatched event
+            counters.
+        """
+        return self._events.stats()
+
+    def pool_stats(self):
+        """Retrieves statistics of the surface pool shared by screens
+        of this flow.
+
+        :returns: Dictionary of allocation and reuse counters.
+        """
+        return self._surface_pool.stats()
+
+    def text_stats(self):
+        """Retrieves statistics of the rendered text cache shared by screens
+        of this flow.
+
+        :returns: Dictionary of cache usage and hit rate.
+        """
+        return self._font_manager.text_stats()
+
+    def is_running(self):
+        """
+        :returns: True if this flow is started and not stopped yet.
+        """
+        return self._running
+
+    def is_animating(self):
+        """
+        :returns: True if this flow is in transition between two screens.
+        """
+        return self._state == ScreenFlow.IN_TRANSITION
+
+    def is_idle(self):
+        """Indicates if a frame of this flow without any event would do
+        nothing, so it can be skipped : no transition is running, nothing
+        is damaged and watched styles are not due for a check.
+
+        :returns: True if this flow is idle, False otherwise.
+        """
+        if self._state != ScreenFlow.ACTIVE or len(self._damages) > 0:
+            return False
+        if self.get_current_screen().has_damages():
+            return False
+        return not self._watch_due()
+
+    def has_idle_tasks(self):
+        """
+        :returns: True if some idle tasks are pending, False otherwise.
+        """
+        return len(self._idle_tasks) > 0
 
     def get_current_screen(self):
         """Current screen access method.
@@ -247,30 +896,252 @@ class ScreenFlow(object):
             raise IndexError('Screen stack is empty')
         return self._stack[-1]
 
+    def add_damage(self, rect=None):
+        """Marks the given area of the surface as modified for current frame.
+
+        :param rect: Modified area, None for the whole surface.
+        """
+        if rect is None:
+            rect = self.surface.get_rect()
+        self._damages.append(rect)
+
     def draw(self):
         """ Draws the current screen into the delegate surface."""
-        self.get_current_screen().draw(self._surface)
+        screen = self.get_current_screen()
+        screen.pop_damages()
+        rects = screen.draw(self.surface)
+        if rects is None:
+            self.add_damage()
+        else:
+            self._damages.extend(rects)
+
+    def repair(self, screen):
+        """Redraws areas damaged by the given screen if it is still displayed.
+
+        :param screen: Screen to repair damaged areas for.
+        """
+        damages = screen.pop_damages()
+        if len(damages) == 0 or self._state != ScreenFlow.ACTIVE:
+            return
+        if screen is not self.get_current_screen():
+            return
+        if None in damages:
+            self.draw()
+            return
+        surface = self.surface
+        for clip in merge_rects(damages, surface.get_rect()):
+            surface.set_clip(clip)
+            rects = screen.draw(surface)
+            if rects is None:
+                rects = [clip]
+            for rect in rects:
+                rect = Rect(rect).clip(clip)
+                if rect.width > 0 and rect.height > 0:
+                    self._damages.append(rect)
+        surface.set_clip(None)
+
+    def present(self):
+        """Updates display areas modified since last call. A full surface
+        damage leads to a flip, and nothing is done if nothing changed.
+        A flow hosted by a compositor hands modified areas over to it.
+
+        :returns: True if display has been updated, False otherwise.
+        """
+        if len(self._damages) == 0:
+            return False
+        bounds = self.surface.get_rect()
+        rects = merge_rects(self._damages, bounds)
+        del self._damages[:]
+        if self._compositor is not None:
+            self._compositor.add_damages(self, rects)
+        elif len(rects) == 1 and rects[0] == bounds:
+            flip()
+        elif len(rects) > 0:
+            update(rects)
+        return True
 
-    def run(self, start_screen):
-        """Starts this screen flow and maintains
-        a main loop over it until application is killed
-        or quit() callback is reached.
+    def wait_events(self):
+        """Retrieves the events to process for the next loop iteration.
+
+        In IDLE_WAIT mode, blocks until an event occurs or idle_timeout
+        is reached, unless some idle tasks are pending. In IDLE_POLL mode,
+        or while idle tasks are pending, pending events are returned once
+        iteration has been paced to max_fps. If no event is pending, a step
+        of idle task is run.
+
+        :returns: List of events to process.
+        """
+        if self.idle_mode == ScreenFlow.IDLE_POLL:
+            self._clock.tick(self.max_fps)
+            pending = events()
+        elif len(self._idle_tasks) > 0:
+            self._clock.tick(self.max_fps)
+            pending = events()
+        else:
+            event = wait_event(self.idle_timeout)
+            if event.type == NOEVENT:
+                return []
+            return [event] + events()
+        if len(pending) == 0:
+            self.run_idle_task()
+        return pending
+
+    def start(self, start_screen):
+        """Displays the given screen as first screen of this flow.
+
+        :param start_screen: Screen to start this flow with.
         """
         self._stack.append(start_screen)
+        self._inactive.pop(start_screen.name, None)
+        self._events.apply()
         self.draw()
+        self.present()
+        self._clock = time.Clock()
         self._running = True
         self._state = ScreenFlow.ACTIVE
+        self._font_manager.preload(self.get_fonts())
+        self.schedule_idle(self._font_manager.preload_step)
+        self.activate(start_screen)
+
+    def get_fonts(self):
+        """Collects fonts used by screens of this flow according to loaded
+        styles, including lazily defined screens not created yet.
+
+        :returns: List of (name, size) tuples.
+        """
+        screens = list(self._screens.values())
+        for screen_def in self._definitions.values():
+            name, screen_type = screen_def[XML_NAME], screen_def[XML_TYPE]
+            screens.append(ScreenKey(name, screen_type))
+        fonts = []
+        for screen in screens:
+            for style in self._style_factory.get_computed_styles(screen)[1:]:
+                font = (style.name, style.size)
+                if font not in fonts:
+                    fonts.append(font)
+        return fonts
+
+    def run(self, start_screen):
+        """Starts this screen flow and maintains
+        a main loop over it until application is killed
+        or quit() callback is reached.
+        """
+        self.start(start_screen)
         while self._running:
-            flip()
-            current = self.get_current_screen()
-            if self._state == ScreenFlow.IN_TRANSITION:
-                if not self._transition.update(self._surface):
-                    self._transition = None
-                    self._state = ScreenFlow.ACTIVE
-                    self.draw()
-                    current.on_screen_activated()
-            elif self._state == ScreenFlow.ACTIVE:
-                self._running = current.process_event()
+            pending = []
+            if self._state == ScreenFlow.ACTIVE:
+                pending = self.wait_events()
+            else:
+                self._clock.tick(self.max_fps)
+            self.process_frame(pending)
+        self._events.release()
+
+    def run_async(self, start_screen, loop=None):
+        """Starts this screen flow on an asyncio event loop, where a frame
+        is scheduled at most max_fps times per second until quit() callback
+        is reached.
+
+        :param start_screen: Screen to start this flow with.
+        :param loop: Event loop to run on, default to current one.
+        :returns: Future resolved once this flow is stopped.
+        """
+        asyncio = get_asyncio()
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self._loop = loop
+        self._finished = loop.create_future()
+        self.start(start_screen)
+        self._frame_handle = loop.call_soon(self._async_frame)
+        return self._finished
+
+    def _async_frame(self):
+        """ Processes a frame then schedules the next one on event loop. """
+        try:
+            if self._running:
+                pending = []
+                if self._state == ScreenFlow.ACTIVE:
+                    pending = events()
+                    if len(pending) == 0:
+                        self.run_idle_task()
+                self.process_frame(pending)
+        except Exception as e:
+            self._finish_async(e)
+            return
+        if not self._running:
+            self._finish_async()
+            return
+        delay = 1.0 / self.max_fps if self.max_fps else 0
+        self._frame_handle = self._loop.call_later(delay, self._async_frame)
+
+    def _finish_async(self, error=None):
+        """Stops asynchronous execution of this flow, cancelling pending
+        callback tasks, and resolves the future returned by run_async().
+
+        :param error: Optional error that stopped this flow.
+        """
+        if self._loop is None:
+            return
+        self._running = False
+        if self._frame_handle is not None:
+            self._frame_handle.cancel()
+            self._frame_handle = None
+        for task in list(self._tasks):
+            task.cancel()
+        self._events.release()
+        finished = self._finished
+        self._finished = None
+        self._loop = None
+        if not finished.done():
+            if error is None:
+                finished.set_result(None)
+            else:
+                finished.set_exception(error)
+
+    def process_frame(self, pending):
+        """Processes a frame of this flow : given events are processed by
+        current screen, damaged areas are redrawn or transition is updated,
+        then display is updated.
+
+        :param pending: Events to process.
+        """
+        current = self.get_current_screen()
+        self._begin_frame(current)
+        transition = self._state == ScreenFlow.IN_TRANSITION
+        if transition:
+            self.update_transition(current)
+        elif self._state == ScreenFlow.ACTIVE:
+            pending = self._events.process(pending)
+            if self._tracer is not None:
+                self._tracer.begin(pending, current.name)
+            if not current.process_event(pending):
+                self._running = False
+            self._mark(EVENTS)
+            self.check_styles()
+            self.repair(current)
+            self._mark(DRAW)
+        presented = self.present()
+        self._mark(PRESENT)
+        self._end_frame(presented or len(pending) > 0)
+        if self._tracer is not None and presented:
+            self._tracer.presented(transition)
+
+    def update_transition(self, screen):
+        """Performs a transition iteration, activating the given screen once
+        transition is over.
+
+        :param screen: Screen transition is going to.
+        """
+        if self._transition.update(self.surface):
+            self.add_damage()
+            self._mark(UPDATE)
+            return
+        self._transition = None
+        self._state = ScreenFlow.ACTIVE
+        self._mark(UPDATE)
+        self.draw()
+        self._mark(DRAW)
+        self.activate(screen)
+        self._mark(UPDATE)
 
     def register_factory(self, type_name, factory):
         """Registers the given factory for the given type.
@@ -294,30 +1165,102 @@ class ScreenFlow(object):
             raise ValueError('Unknown screen type %s' % screen_type)
         return self._factories[screen_type](screen_def)
 
-    def load_style(self, css_file):
+    def load_style(self, css_file, watch=False):
         """Loads and configures this screenflow with the given CSS file.
+        Screens already created are configured again with computed styles.
 
         :param css_file: CSS file to load.
+        :param watch: True to reload styles when such file is modified.
         """
         self._style_factory.load(css_file)
+        if watch:
+            self._watched[css_file] = getmtime(css_file)
+        self.configure_screens()
+
+    def configure_screens(self):
+        """ Configures created screens with current styles. """
+        for screen in self._screens.values():
+            screen.configure_styles(self._style_factory)
+
+    def check_styles(self):
+        """Reloads styles if a watched CSS file has been modified since
+        last check, checking at most once per watch_interval. Only screens
+        matching changed selectors are restyled.
+
+        :returns: True if some selectors changed, False otherwise.
+        """
+        if not self._watch_due():
+            return False
+        self._last_watch = get_ticks()
+        modified = False
+        for css_file, mtime in list(self._watched.items()):
+            try:
+                current = getmtime(css_file)
+            except OSError:
+                continue
+            if current != mtime:
+                self._watched[css_file] = current
+                modified = True
+        if not modified:
+            return False
+        try:
+            selectors = self._style_factory.reload()
+        except Exception as e:
+            logger.warning('Unable to reload styles : %s' % e)
+            return False
+        logger.info(
+            'Styles reloaded, changed selectors : %s' % sorted(selectors))
+        self.configure_screens()
+        return len(selectors) > 0
 
-    def load_from_file(self, flow_file):
+    def _watch_due(self):
+        """
+        :returns: True if watched CSS files should be checked, False otherwise.
+        """
+        if len(self._watched) == 0:
+            return False
+        if self._last_watch is None:
+            return True
+        return get_ticks() - self._last_watch >= self.watch_interval
+
+    def load_from_file(
+            self,
+            flow_file,
+            cache=True,
+            streaming=False,
+            lazy=False):
         """Factory function that creates a ScreenFlow instance from
         the given XML file.
 
         :param file: Target XML file to load screens from.
+        :param cache: True to use compiled flow cache.
+        :param streaming: True to parse XML file in streaming mode.
+        :param lazy: True to create screens on first access only.
         """
-        with open(flow_file, 'r') as stream:
-            xml = stream.read()
-            content = xmltodict.parse(xml)
-            if XML_SCREENFLOW not in content.keys():
-                raise AttributeError('No screenflow root element found')
-            screenflow_def = content[XML_SCREENFLOW]
-            if XML_SCREEN not in screenflow_def.keys():
-                raise AttributeError('No screen definition found')
-            screens = screenflow_def[XML_SCREEN]
-            if isinstance(screens, list):
-                for screen in screens:
-                    self.add_screen(self.create_screen(screen))
+        for screen_def in load_definitions(flow_file, cache, streaming):
+            if lazy:
+                self.define_screen(screen_def)
             else:
-                self.add_screen(self.create_screen(screens))
+                self.add_screen(self.create_screen(screen_def))
+            self.link_definition(screen_def)
+
+    def define_screen(self, screen_def):
+        """Indexes the given screen definition, so such screen
+        is created on first access.
+
+        :param screen_def: Screen definition as a dictionary from XML parsing.
+        """
+        if XML_NAME not in screen_def.keys():
+            raise AttributeError('No screen name specified.')
+        self._definitions[screen_def[XML_NAME]] = screen_def
+
+    def link_definition(self, screen_def):
+        """Declares successors listed in the given screen definition.
+
+        :param screen_def: Screen definition as a dictionary from XML parsing.
+        """
+        successors = screen_def.get(XML_NEXT, [])
+        if not isinstance(successors, list):
+            successors = [successors]
+        for successor in successors:
+            self.link(screen_def[XML_NAME], successor)
@@ -1,21 +1,74 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-""" This package exposes all screens implementation available. """
+"""
+    This package exposes all screens implementation available.
 
-from screen import Screen
-from message_screen import MessageScreen, factory as message_screen_factory
-from select_screen import SelectScreen, factory as select_screen_factory
-from input_screen import InputScreen
+    Screen modules are imported lazily : a screen module factory is imported
+    on first creation of a screen of the associated type, so importing this
+    package does not import any screen implementation. Screen classes should
+    be imported from their modules, such as
+    ``screenflow.screens.message_screen``. On Python 3.7 and later, they are
+    also available as package attributes, imported on first access.
+"""
+
+from importlib import import_module
 
 __author__ = "Felix Voituret"
 
+# Lazily imported attributes, as (module, attribute) tuples.
+LAZY_ATTRIBUTES = {
+    'Screen': ('screen', 'Screen'),
+    'MessageScreen': ('message_screen', 'MessageScreen'),
+    'message_screen_factory': ('message_screen', 'factory'),
+    'SelectScreen': ('select_screen', 'SelectScreen'),
+    'select_screen_factory': ('select_screen', 'factory'),
+    'ListScreen': ('list_screen', 'ListScreen'),
+    'list_screen_factory': ('list_screen', 'factory'),
+    'InputScreen': ('input_screen', 'InputScreen')}
+
+
+def lazy_factory(module):
+    """Creates a screen factory which imports the given screen module
+    on first call, and delegates to its factory function.
+
+    :param module: Name of the screen module into this package.
+    :returns: Created factory function.
+    """
+    def factory(screen_def):
+        return import_module('%s.%s' % (__name__, module)).factory(screen_def)
+    return factory
+
 
 def configure_screenflow(screenflow):
-    """Registers all basic screen factory to the given screenflow instance.abs
+    """Registers all basic screen factory to the given screenflow instance.
 
     :param screenflow: Screenflow to register factory to.
     """
-    screenflow.register_factory('message', message_screen_factory)
-    screenflow.register_factory('select', select_screen_factory)
+    screenflow.register_factory('message', lazy_factory('message_screen'))
+    screenflow.register_factory('select', lazy_factory('select_screen'))
+    screenflow.register_factory('list', lazy_factory('list_screen'))
     screenflow.register_factory('input', None)
+
+
+def __getattr__(name):
+    """Imports lazy attributes on first access, used as module attribute
+    lookup fallback on Python 3.7 and later (PEP 562).
+
+    :param name: Name of the accessed attribute.
+    :returns: Lazily imported attribute value.
+    """
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name))
+    module, attribute = LAZY_ATTRIBUTES[name]
+    value = getattr(import_module('%s.%s' % (__name__, module)), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """
+    :returns: Module attributes including lazy ones.
+    """
+    return sorted(set(list(globals()) + list(LAZY_ATTRIBUTES)))
@@ -3,7 +3,7 @@
 
 """ To document """
 
-from screenflow.screens import Screen
+from screenflow.screens.screen import Screen
 
 
 class InputScreen(Screen):
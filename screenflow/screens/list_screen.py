@@ -5,57 +5,160 @@
     ListScreen
     ==========
 
-    XML Definition
+    *ListScreen* displays a scrollable list of items pulled from a data
+    provider, such as available wifi networks. The list is virtualized so
+    memory and drawing time do not depend on the number of items :
+
+    - items are pulled lazily from the provider by pages, and only a
+      bounded number of pages is kept in memory (least recently used pages
+      are dropped first).
+    - only rows in view are rendered, into a small pool of row surfaces
+      which are reused as the list scrolls.
+
+    XML definition
+    --------------
 
     .. code-block:: xml
 
-        <screen name="foo" type="list">
-            <label>displayed label</label>
-        </screen>
+        <screen name="foo" type="list"/>
+
+    Callback binding
+    ----------------
+
+    Given a *screenflow* instance, with registered *foo* list screen, data
+    provider is registered using ``provider`` decorator. Provider is called
+    with an offset and a maximum number of items, and should return a list of
+    at most *limit* items, a shorter list denoting the end of the data :
+
+    .. code-block:: python
+
+        @screenflow.foo.provider
+        def provide_foo(offset, limit):
+            return networks[offset:offset + limit]
+
+    When the screenflow runs on an asyncio event loop, provider can be a
+    coroutine function : rows of pages being loaded are drawn empty until
+    the page is received.
+
+    Rows rendering can be customized using ``renderer`` decorator, and
+    selection callback is registered using ``on_select`` decorator :
+
+    .. code-block:: python
+
+        @screenflow.foo.renderer
+        def render_foo(item, surface):
+            # TODO : Draw item into row surface here.
+
+        @screenflow.foo.on_select
+        def on_foo_select(item):
+            # TODO : Callback action here.
+
+    The list follows the pointer while dragged, or is scrolled programmatically
+    using *scroll()* and *scroll_to()* methods. When provider data changes,
+    *refresh()* drops loaded pages so they are pulled again.
 """
 
 import logging
-from math import floor
-from screenflow.screens import Screen
-from screenflow.constants import XML_NAME
+from collections import OrderedDict
+from functools import partial
+from pygame import Rect
+from pygame.constants import MOUSEMOTION
+from screenflow.screens.screen import Screen, Oriented
+from screenflow.utils.async_support import is_awaitable
+from screenflow.constants import XML_NAME, VERTICAL
 
 # Configure logger.
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
+# List screen type name.
+SCREEN_TYPE = 'list_screen'
 
-class ListScreen(Screen):
-    """To document.
+# Default number of items pulled from provider at once.
+DEFAULT_PAGE_SIZE = 50
+
+# Default maximum number of pages kept in memory.
+DEFAULT_CACHED_PAGES = 8
+
+# Minimum mouse move in pixels for a gesture to be handled as a drag.
+DRAG_THRESHOLD = 10
+
+
+class ListScreen(Screen, Oriented):
+    """ ListScreen displays a virtualized list of items
+    pulled by pages from a data provider.
     """
 
-    # 
-    HORIZONTAL = 0
+    # Marker for items of a page being loaded.
+    LOADING = object()
 
-    #
-    VERTICAL = 1
+    # Mouse motion is handled for drag scrolling.
+    EVENT_TYPES = Screen.EVENT_TYPES + (MOUSEMOTION,)
 
-    def __init__(self, name, orientation=ListScreen.VERTICAL):
+    def __init__(
+            self,
+            name,
+            orientation=VERTICAL,
+            page_size=DEFAULT_PAGE_SIZE,
+            cached_pages=DEFAULT_CACHED_PAGES,
+            item_size=None):
         """Default constructor.
 
-        :param name:
+        :param name: Name of this screen.
+        :param orientation: Scrolling orientation of the list.
+        :param page_size: Number of items pulled from provider at once.
+        :param cached_pages: Maximum number of pages kept in memory.
+        :param item_size: Row size along scrolling axis, computed from
+            primary font if not specified.
+        """
+        Screen.__init__(self, name, SCREEN_TYPE)
+        Oriented.__init__(self, orientation)
+        self.page_size = page_size
+        self.cached_pages = cached_pages
+        self.item_size = item_size
+        self._provider = None
+        self._renderer = None
+        self.callback = None
+        self._pages = OrderedDict()
+        self._length = None
+        self._bound = None
+        self._offset = 0
+        self._extent = None
+        self._viewport = None
+        self._rows = {}
+        self._free_rows = []
+        self._row_size = None
+        self._pressed = None
+        self._pressed_offset = 0
+        self._dragging = False
+        self.pages_loaded = 0
+        self.rows_rendered = 0
+        self.rows_allocated = 0
+
+    @property
+    def axis(self):
+        """
+        :returns: Index of the scrolling axis in positions and sizes.
         """
-        super(MessageScreen, self).__init__(name)
-        self.orientation = orientation
-        self.provider = None
-        self.renderer = None
-        self._data = None
-        self._surfaces = []
+        if self.isVertical():
+            return 1
+        return 0
 
     @property
-    def data(self):
+    def offset(self):
+        """Property getter for offset attribute.
+
+        :returns: Scrolling offset in pixels.
         """
-        :returns:
+        return self._offset
+
+    @property
+    def length(self):
+        """Property getter for length attribute.
+
+        :returns: Number of items if the end of data has been reached,
+            None otherwise.
         """
-        if self._data is None:
-            if self.provider is None:
-                raise AttributeError('Data provider not settled')
-            self._data = self.provider()
-        return self._data
+        return self._length
 
     def provider(self, function):
         """Decorator method that registers the given function as data provider.
@@ -63,38 +166,370 @@ class ListScreen(Screen):
         :param function: Decorated function to use as data provider.
         :returns: Given function to match decorator pattern.
         """
-        self.provider = function
+        self._provider = function
+        self.refresh()
         return function
 
     def renderer(self, function):
-        """Decorator method that registers the given function as data renderer.
+        """Decorator method that registers the given function as row renderer.
+        As row surfaces are reused, renderer should draw the whole row.
 
-        :param function: Decorated function to use as data renderer.
+        :param function: Decorated function to use as row renderer.
         :returns: Given function to match decorator pattern.
         """
-        self.renderer = function
+        self._renderer = function
+        self.invalidate()
         return function
 
-    def get_item_surface(self, i):
+    def on_select(self, function):
+        """Decorator method that registers the given function as selection
+        callback.
+
+        :param function: Decorated function to use as callback.
+        :returns: Given function to match decorator pattern.
+        """
+        self.callback = function
+        return function
+
+    def refresh(self):
+        """ Drops loaded pages, so data is pulled again from provider. """
+        self._pages.clear()
+        self._length = None
+        self._bound = None
+        self.invalidate()
+
+    def clear_caches(self):
+        """ Drops cached renderings, including row surfaces pool. """
+        Screen.clear_caches(self)
+        self.release_rows()
+        self._row_size = None
+
+    def release_rows(self):
+        """ Releases all row surfaces of the pool. """
+        for surface in list(self._rows.values()) + self._free_rows:
+            self.release_surface(surface)
+        self._rows.clear()
+        del self._free_rows[:]
+
+    def _store_page(self, page, items):
+        """Stores the given page items, evicting least recently used
+        pages if the maximum number of pages is exceeded.
+
+        :param page: Index of the page.
+        :param items: Items of the page.
+        """
+        items = list(items)
+        first = page * self.page_size
+        if len(items) == 0 and page > 0:
+            if self._bound is None or first < self._bound:
+                self._bound = first
+        elif len(items) < self.page_size:
+            self._length = first + len(items)
+        elif self._bound == first + self.page_size:
+            self._length = self._bound
+        self._pages.pop(page, None)
+        self._pages[page] = items
+        self.pages_loaded += 1
+        while len(self._pages) > self.cached_pages:
+            self._pages.popitem(last=False)
+
+    def _on_page_loaded(self, page, version, future):
+        """Callback for asynchronous page loading completion.
+
+        :param page: Index of the loaded page.
+        :param version: Content version the page was requested for.
+        :param future: Completed page loading future.
+        """
+        if future.cancelled() or version != self._content_version:
+            return
+        if self._pages.get(page, ListScreen.LOADING) is not ListScreen.LOADING:
+            return
+        self._pages.pop(page, None)
+        error = future.exception()
+        if error is not None:
+            logger.error(
+                'Unable to load page %d of %s : %s',
+                page,
+                self.name,
+                error)
+            return
+        self._store_page(page, future.result())
+        first = page * self.page_size
+        for index in list(self._rows):
+            if first <= index < first + self.page_size:
+                self._free_rows.append(self._rows.pop(index))
+        self.damage()
+
+    def get_page(self, page):
+        """Retrieves items of the given page, pulling them from provider
+        if not loaded yet.
+
+        :param page: Index of the page to retrieve.
+        :returns: Page items, or LOADING if the page is being loaded.
+        """
+        if page in self._pages:
+            items = self._pages.pop(page)
+            self._pages[page] = items
+            return items
+        if self._provider is None:
+            raise AttributeError('Data provider not settled')
+        result = self.dispatch(
+            self._provider,
+            page * self.page_size,
+            self.page_size)
+        if is_awaitable(result):
+            self._pages[page] = ListScreen.LOADING
+            callback = partial(
+                self._on_page_loaded,
+                page,
+                self._content_version)
+            result.add_done_callback(callback)
+            return ListScreen.LOADING
+        self._store_page(page, result)
+        return self._pages[page]
+
+    def get_item(self, index):
+        """Retrieves the item at the given index.
+
+        :param index: Index of the item to retrieve.
+        :returns: Item, LOADING if being loaded, or None if out of data.
+        """
+        if index < 0 or index >= self.get_limit():
+            return None
+        items = self.get_page(index // self.page_size)
+        if items is ListScreen.LOADING:
+            return items
+        position = index % self.page_size
+        if position >= len(items):
+            return None
+        return items[position]
+
+    def get_item_extent(self):
+        """
+        :returns: Row size along scrolling axis.
+        """
+        if self.item_size is not None:
+            return self.item_size
+        font = self._get_font(self._primary_style)
+        return font.get_linesize() + self._style.padding
+
+    def get_limit(self):
         """
+        :returns: Number of items if known, otherwise an upper bound if the
+            provider already returned an empty page, or infinity.
         """
-        if len(self._surfaces) < i:
-            self._surfaces[i] = None
-        if self._surfaces[i] is None:
-            self._surfaces[i] = None
-        return self._surfaces[i]
+        if self._length is not None:
+            return self._length
+        if self._bound is not None:
+            return self._bound
+        return float('inf')
+
+    def get_max_offset(self):
+        """
+        :returns: Maximum scrolling offset, None if data end is unknown.
+        """
+        limit = self.get_limit()
+        if limit == float('inf') or self._extent is None:
+            return None
+        viewport = max(1, self._viewport.size[self.axis])
+        return max(0, limit * self._extent - viewport)
+
+    def scroll(self, delta):
+        """Scrolls this list of the given number of pixels.
+
+        :param delta: Number of pixels to scroll, negative to scroll back.
+        """
+        self.scroll_to_offset(self._offset + delta)
+
+    def get_bounded_offset(self, offset):
+        """
+        :param offset: Scrolling offset in pixels.
+        :returns: Given offset bounded to list content.
+        """
+        maximum = self.get_max_offset()
+        if maximum is not None:
+            offset = min(offset, maximum)
+        return max(0, int(offset))
+
+    def scroll_to_offset(self, offset):
+        """Scrolls this list to the given offset, bounded to list content.
+
+        :param offset: Offset in pixels to scroll to.
+        """
+        offset = self.get_bounded_offset(offset)
+        if offset != self._offset:
+            self._offset = offset
+            self.damage()
+
+    def scroll_to(self, index):
+        """Scrolls this list so the given item is the first one displayed.
+
+        :param index: Index of the item to scroll to.
+        """
+        self.scroll_to_offset(index * self.get_item_extent())
+
+    def get_index_at(self, position):
+        """
+        :param position: Position into the screen.
+        :returns: Index of the item displayed at the given position if any.
+        """
+        if self._viewport is None or not self._viewport.collidepoint(position):
+            return None
+        axis = self.axis
+        local = position[axis] - self._viewport.topleft[axis] + self._offset
+        return local // self._extent
+
+    def on_mouse_down(self, position):
+        """Mouse down event processing, which starts a drag gesture.
+
+        :param position: Position of the mouse down event.
+        """
+        self._pressed = position
+        self._pressed_offset = self._offset
+        self._dragging = False
+
+    def drag(self, position):
+        """Scrolls the list so it follows the pointer since the mouse has
+        been pressed, once moved beyond drag threshold.
+
+        :param position: Current pointer position.
+        """
+        delta = self._pressed[self.axis] - position[self.axis]
+        if abs(delta) >= DRAG_THRESHOLD:
+            self._dragging = True
+        if self._dragging:
+            self.scroll_to_offset(self._pressed_offset + delta)
+
+    def on_mouse_move(self, position):
+        """Mouse motion event processing, which scrolls the list while
+        the mouse is pressed.
+
+        :param position: Position of the mouse motion event.
+        """
+        if self._pressed is not None:
+            self.drag(position)
+
+    def on_mouse_up(self, position):
+        """Mouse up event processing. Ends the drag gesture if the mouse has
+        been dragged, triggers callback with the item hit otherwise.
+
+        :param position: Position of the mouse up event.
+        """
+        if self._pressed is None:
+            return
+        self.drag(position)
+        self._pressed = None
+        if self._dragging:
+            self._dragging = False
+            return
+        index = self.get_index_at(position)
+        if index is None or self.callback is None:
+            return
+        item = self.get_item(index)
+        if item is not None and item is not ListScreen.LOADING:
+            self.dispatch(self.callback, item)
+
+    def draw_row(self, item, surface):
+        """Default row renderer, draws item text with primary font style.
+
+        :param item: Item to render.
+        :param surface: Row surface to render item into.
+        """
+        self.draw_background(surface)
+        text = self.draw_primary_text(u'%s' % (item,))
+        y = (surface.get_size()[1] - text.get_size()[1]) / 2
+        surface.blit(text, (0, y))
+
+    def render_row(self, index, surface):
+        """Renders the item at the given index into the given row surface.
+
+        :param index: Index of the item to render.
+        :param surface: Row surface to render item into.
+        """
+        self.rows_rendered += 1
+        item = self.get_item(index)
+        if item is None or item is ListScreen.LOADING:
+            self.draw_background(surface)
+        elif self._renderer is not None:
+            self._renderer(item, surface)
+        else:
+            self.draw_row(item, surface)
+
+    def get_row(self, index):
+        """Retrieves the rendered row surface for the given item index,
+        reusing a released row surface if any.
+
+        :param index: Index of the item.
+        :returns: Row surface.
+        """
+        if index not in self._rows:
+            if len(self._free_rows) > 0:
+                surface = self._free_rows.pop()
+            else:
+                surface = self.create_surface(self._row_size)
+                self.rows_allocated += 1
+            self.render_row(index, surface)
+            self._rows[index] = surface
+        return self._rows[index]
+
+    def layout(self, surface):
+        """Computes viewport and rows size for the given surface, dropping
+        row surfaces pool if rows size changed.
+
+        :param surface: Surface this screen is drawn into.
+        """
+        padding = self._style.padding
+        width, height = self.get_surface_drawable_size(surface)
+        self._viewport = Rect(padding, padding, max(0, width), max(0, height))
+        self._extent = max(1, self.get_item_extent())
+        if self.isVertical():
+            row_size = (self._viewport.width, self._extent)
+        else:
+            row_size = (self._extent, self._viewport.height)
+        if row_size != self._row_size:
+            self.release_rows()
+            self._row_size = row_size
+        while True:
+            self._offset = self.get_bounded_offset(self._offset)
+            if self._length is not None:
+                break
+            if self.get_item(self._offset // self._extent) is not None:
+                break
 
     def draw(self, surface):
-        """Drawing method, display centered text.
+        """Drawing method, display rows in view.
 
         :param surface: Surface to draw this screen into.
+        :returns: List of modified areas.
         """
-        super(MessageScreen, self).draw(surface)
-        # TODO : Draw up scroller.
-        item_size = None
-        container_size = None
-        n = container_size[self.orientation] / item_size[self.orientation]
-        for i in range(n):
-            item_surface = get_item_surface(item_size)
-            self.renderer(None, item_surface)
-        # TODO : Drawp down scroller.
\ No newline at end of file
+        rects = Screen.draw(self, surface)
+        self.layout(surface)
+        axis = self.axis
+        extent = self._extent
+        first = self._offset // extent
+        last = (self._offset + self._viewport.size[axis] - 1) // extent
+        last = min(last, self.get_limit() - 1)
+        visible = range(first, last + 1)
+        for index in list(self._rows):
+            if index < first or index > last:
+                self._free_rows.append(self._rows.pop(index))
+        for index in visible:
+            row = self.get_row(index)
+            position = list(self._viewport.topleft)
+            position[axis] += index * extent - self._offset
+            bounds = Rect(position, self._row_size).clip(self._viewport)
+            if bounds.width == 0 or bounds.height == 0:
+                continue
+            area = bounds.move(-position[0], -position[1])
+            surface.blit(row, bounds.topleft, area)
+        return rects
+
+
+def factory(screen_def):
+    """Static factory function for creating a list screen
+    from a given XML screen definition.
+
+    :param screen_def: Screen definition as a dictionary from XML parsing.
+    :returns: Created list screen instance.
+    """
+    return ListScreen(screen_def[XML_NAME])
@@ -10,52 +10,35 @@
     layouting.
 
     Subclass should use get_message_surface() method to get a
-    surface that exposes text message.
+    surface that exposes text message. Message is wrapped to the available
+    width, see **wrapping** module for details.
 """
 
 import logging
-from math import floor
-from screenflow.screens import Screen
+from screenflow.screens.screen import Screen
 from screenflow.screens.screen import get_longest, get_highest
+from screenflow.screens.screen import cached_render, by_width
+from screenflow.utils.wrapping import wrap, GREEDY
 from screenflow.constants import XML_NAME
 
 # Configure logger.
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 # XML tag for message parameter.
 XML_MESSAGE = 'message'
 
 
-def split_line(line, sizer, surface_width):
+def split_line(line, sizer, surface_width, mode=GREEDY):
     """Splits the given line into chunks that matches the given surface_width
     regarding of the given font in order to avoid text overflow.
 
     :param line: Line to split.
     :param sizer: Function that computes rendering size for a given text.
     :param surface_width: Width of the surface line will be rendered.
-    :returns: List of chunks that matches the surface_width if possible.
+    :param mode: Wrapping mode, GREEDY or BALANCED.
+    :returns: List of chunks that matches the surface_width.
     """
-    splits = []
-    queue = [line]
-    while len(queue) > 0:
-        current = queue.pop(0)
-        line_width, _ = sizer(current)
-        if line_width >= surface_width:
-            tokens = current.split()
-            tokens_size = len(tokens)
-            if tokens_size == 1:
-                logging.warning('Cannot split "%s" to avoid overflow', line)
-                splits.append(current)
-            else:
-                middle = int(floor(len(tokens) / 2))
-                subqueue = []
-                subqueue.append(' '.join(tokens[:middle]))
-                subqueue.append(' '.join(tokens[middle:]))
-                queue = subqueue + queue
-        else:
-            splits.append(current)
-    return splits
+    return wrap(line, sizer, surface_width, mode)
 
 
 class Message(object):
@@ -63,26 +46,33 @@ class Message(object):
     to avoid text overflow in a standard surface rendering.
     """
 
-    def __init__(self, message):
+    def __init__(self, message, mode=GREEDY):
         """Default constructor.
 
         :param message: Raw message instance to use.
+        :param mode: Wrapping mode, GREEDY or BALANCED.
         """
         self.text = (' '.join(message.split())).split('\n')
+        self.mode = mode
         self._lines = []
         self._last_width = 0
+        self._last_sizer = None
 
-    def should_update(self, surface_width):
+    def should_update(self, surface_width, sizer=None):
         """Indicates if the normalization process should be done again.
-        Such predicate return True if any of those two case match :
+        Such predicate return True if any of those three case match :
 
         - Internal line collection is empty.
         - Target surface width changed.
+        - Sizer changed, for instance following a font style change.
 
         :param surface_width: Width of the surface line will be rendered.
+        :param sizer: Function that computes rendering size for a given text.
         :returns: True if lines should be recomputed, False otherwise.
         """
-        return len(self._lines) == 0 or surface_width != self._last_width
+        if len(self._lines) == 0 or surface_width != self._last_width:
+            return True
+        return sizer is not None and sizer != self._last_sizer
 
     def lines(self, sizer, surface_width):
         """Property binding of _lines attributes that computes if required text
@@ -92,15 +82,16 @@ class Message(object):
         :param surface_width: Width of the surface line will be rendered.
         :returns: Lines to display.
         """
-        if self.should_update(surface_width):
+        if self.should_update(surface_width, sizer):
             del self._lines[:]
             for line in self.text:
-                line_width, _ = sizer(line)
-                if line_width >= surface_width:
-                    self._lines += split_line(line, sizer, surface_width)
-                else:
-                    self._lines.append(line)
+                self._lines += split_line(
+                    line,
+                    sizer,
+                    surface_width,
+                    self.mode)
             self._last_width = surface_width
+            self._last_sizer = sizer
         return self._lines
 
 
@@ -117,36 +108,50 @@ class MessageBasedScreen(Screen):
         :param message: Message displayed into the screen.
         """
         Screen.__init__(self, name, type)
-        self.message = Message(message)
-        self._last_width = 0
-        self._message_surface = None
+        self._message = Message(message)
+
+    @property
+    def message(self):
+        """Property getter for message attribute.
+
+        :returns: Message displayed into the screen.
+        """
+        return self._message
+
+    @message.setter
+    def message(self, message):
+        """Property setter for message attribute, which invalidates
+        this screen rendering.
+
+        :param message: Raw message to display into the screen.
+        """
+        self._message = Message(message)
+        self.invalidate()
 
+    @cached_render(by_width)
     def get_message_surface(self, parent_surface_size):
         """Factory method that creates a surface with this screen message.
-        Created surface is cached in order to avoid duplicate computation.
+        Created surface is cached until parent surface width or this screen
+        version changes.
 
-        :param parent_surface_width: Width of the target parent surface.
+        :param parent_surface_size: Size of the target parent surface.
         :returns: Created surface.
         """
-        size_updated = self._last_width != parent_surface_size[0]
-        if self._message_surface is None or size_updated:
-            self._last_width = parent_surface_size[0]
-            text_sizer = self.primary_size
-            lines = self.message.lines(text_sizer, parent_surface_size[0])
-            line_width = get_longest(lines, text_sizer)
-            line_height = get_highest(lines, text_sizer)
-            size = (line_width, len(lines) * line_height)
-            self._message_surface = self.create_surface(size)
-            # TODO : Valid until introduction custom background.
-            self.draw_background(self._message_surface)
-            y = 0
-            for line in lines:
-                text_surface_width, _ = text_sizer(line)
-                x = (line_width - text_surface_width) / 2
-                self.line_surface = self.draw_primary_text(line)
-                self._message_surface.blit(self.line_surface, (x, y))
-                y += line_height
-        return self._message_surface
+        text_sizer = self.primary_measurer
+        lines = self.message.lines(text_sizer, parent_surface_size[0])
+        line_width = get_longest(lines, text_sizer)
+        line_height = get_highest(lines, text_sizer)
+        size = (line_width, len(lines) * line_height)
+        surface = self.create_surface(size)
+        # TODO : Valid until introduction custom background.
+        self.draw_background(surface)
+        y = 0
+        for line in lines:
+            text_surface_width, _ = text_sizer(line)
+            x = (line_width - text_surface_width) / 2
+            surface.blit(self.draw_primary_text(line), (x, y))
+            y += line_height
+        return surface
 
     @staticmethod
     def get_message(screen_def):
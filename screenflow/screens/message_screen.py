@@ -39,7 +39,6 @@ from screenflow.screens.message_based_screen import MessageBasedScreen
 from screenflow.constants import XML_NAME
 
 # Configure logger.
-logging.basicConfig()
 logger = logging.getLogger(__name__)
 
 # Message screen type name.
@@ -74,17 +73,19 @@ class MessageScreen(MessageBasedScreen):
         :param position: Position of the mouse up event.
         """
         if self._callback is not None:
-            self._callback()
+            self.dispatch(self._callback)
 
     def draw(self, surface):
         """Drawing method, display centered text.
 
         :param surface: Surface to draw this screen into.
+        :returns: List of modified areas.
         """
-        MessageBasedScreen.draw(self, surface)
+        rects = MessageBasedScreen.draw(self, surface)
         surface_size = self.get_surface_drawable_size(surface)
         message_surface = self.get_message_surface(surface_size)
-        self.draw_centered(surface, message_surface)
+        rects.append(self.draw_centered(surface, message_surface))
+        return rects
 
 
 def factory(screen_def):
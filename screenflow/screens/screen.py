@@ -14,22 +14,163 @@
     Text rendering
     ~~~~~~~~~~~~~~
 
-    In order to draw text, a **Screen** use a **FontManager**, which manages.
+    In order to draw text, a **Screen** use a **FontManager**, which manages
+    fonts and caches rendered text surfaces shared by all screens.
+
+    Styles
+    ~~~~~~
+
+    Style properties are read from computed styles, resolved once by the
+    style factory when *configure_styles()* is called. Configuring a screen
+    again with the same computed styles keeps its cached renderings.
 
     Background
     ~~~~~~~~~~
 
+    Damage tracking
+    ~~~~~~~~~~~~~~~
+
+    The *draw()* method returns the list of rectangles it modified into
+    the target surface, so only those are presented to the display.
+    When a screen state changes outside of drawing, for instance from
+    an event handler, it should call *damage()* with the region to redraw
+    (or without argument for the whole screen) :
+
+    .. code-block:: python
+
+        def on_mouse_up(self, position):
+            self.highlighted = position
+            self.damage()
+
+    Surface allocation
+    ~~~~~~~~~~~~~~~~~~
+
+    Intermediate surfaces should be created using *create_surface()*,
+    and given back using *release_surface()* once not used anymore, for
+    instance when dropped by *clear_caches()*. When the surface factory is
+    a pool, such as the one shared by screenflow, released surfaces are
+    reused by later allocations.
+
+    Render cache
+    ~~~~~~~~~~~~
+
+    Intermediate surfaces a screen renders, such as its message or options,
+    can be cached by decorating the method that renders them with
+    *cached_render*. Rendered surface is then cached under the method name,
+    along with a key computed from method arguments, and reused as long
+    as such key and the screen version are unchanged :
+
+    .. code-block:: python
+
+        @cached_render(by_width)
+        def get_message_surface(self, parent_surface_size):
+            surface = self.create_surface(...)
+            # TODO : Draw message here.
+            return surface
+
+    Cached surfaces are released when outdated or when *clear_caches()* is
+    called. Their estimated memory cost, and cache efficiency, are available
+    through *render_stats()* method.
+
+    Preview cache
+    ~~~~~~~~~~~~~
+
+    Previews generated for screen transitions are cached for each requested
+    size, and tagged with the content and style version they were rendered
+    with. Screens which state changes in a way that affects rendering should
+    call *invalidate()*, which drops cached renderings, bumps content version
+    and damages the whole screen. Cache efficiency can be checked through the
+    *preview_hits* and *preview_misses* counters.
+
+    Hit testing
+    ~~~~~~~~~~~
+
+    Screens that compose touch targets, such as buttons, record the area
+    of each target while drawing, using *set_hit_regions()*. Regions are
+    stored into a spatial index, which is only rebuilt when the given layout
+    key changes. Target at a given position is then retrieved through
+    *hit_test()*, which only checks targets overlapping the grid cell under
+    the given position, see **HitIndex** documentation for details.
+
     Event handling
     --------------
 
+    Mouse events are dispatched to *on_mouse_down()*, *on_mouse_up()* and
+    *on_mouse_move()* handlers, with the position held by the event. Event
+    types a screen handles are declared by its *EVENT_TYPES* attribute : the
+    screenflow only lets those types into pygame queue, so screens handling
+    mouse motion should add *MOUSEMOTION* to it.
+
+    Callbacks registered by screen implementations should be called through
+    *dispatch()* method, which delegates to the screen dispatcher. Such
+    dispatcher is settled by the screenflow and supports asynchronous
+    callbacks (``async def`` functions) when the flow runs on an asyncio
+    event loop.
+
 """
 
 from screenflow.constants import VERTICAL, HORIZONTAL
 
-from pygame import Surface
+from pygame import Surface, Rect
 from pygame.mouse import get_pos as mouse_position
 from pygame.event import get as events
-from pygame.constants import QUIT, MOUSEBUTTONDOWN, MOUSEBUTTONUP
+from pygame.constants import QUIT, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION
+from screenflow.utils.surface_pool import PIXEL_BYTES
+from screenflow.utils.hit_index import HitIndex
+
+
+def by_width(size):
+    """Render key function for surfaces that only depend on width.
+
+    :param size: Size of the parent surface.
+    :returns: Width of the parent surface.
+    """
+    return size[0]
+
+
+def by_size(size):
+    """Render key function for surfaces that depend on size.
+
+    :param size: Size of the parent surface.
+    :returns: Size of the parent surface as a tuple.
+    """
+    return tuple(size)
+
+
+def unsized(size):
+    """Render key function for surfaces that do not depend on size.
+
+    :param size: Size of the parent surface.
+    :returns: None.
+    """
+    return None
+
+
+def cached_render(key=by_size):
+    """Method decorator that caches the surface rendered by the decorated
+    screen method, see Screen.get_render().
+
+    :param key: Function that computes cache key from method arguments.
+    :returns: Decorator.
+    """
+    def decorator(method):
+        def wrapper(self, *args):
+            return self.get_render(method.__name__, key(*args), method, *args)
+        wrapper.__name__ = method.__name__
+        wrapper.__doc__ = method.__doc__
+        return wrapper
+    return decorator
+
+
+def get_position(event):
+    """
+    :param event: Mouse event to get position for.
+    :returns: Position held by the event, current mouse position if none.
+    """
+    position = getattr(event, 'pos', None)
+    if position is None:
+        return mouse_position()
+    return position
 
 
 def find(collection, sizer, axis):
@@ -39,8 +180,7 @@ def find(collection, sizer, axis):
     :param axis:
     :returns:
     """
-    best = max(collection, key=lambda x: sizer(x)[axis])
-    return sizer(best)[axis]
+    return max(sizer(x)[axis] for x in collection)
 
 
 def get_longest(collection, sizer):
@@ -89,6 +229,9 @@ class Oriented(object):
 class Screen(object):
     """ Base class for screen object. """
 
+    # Event types handled by this screen.
+    EVENT_TYPES = (QUIT, MOUSEBUTTONDOWN, MOUSEBUTTONUP)
+
     def __init__(self, name, type):
         """Default constructor.
 
@@ -99,9 +242,22 @@ class Screen(object):
         self.type = type
         self._surface_factory = None
         self._font_manager = None
+        self._dispatcher = None
         self._style = None
         self._primary_style = None
         self._secondary_style = None
+        self._damages = []
+        self._content_version = 0
+        self._style_version = 0
+        self._previews = {}
+        self._renders = {}
+        self._hit_index = HitIndex()
+        self._hit_layout = None
+        self.preview_hits = 0
+        self.preview_misses = 0
+        self.render_hits = 0
+        self.render_misses = 0
+        self.render_cost = 0
 
     def configure_styles(self, style_factory):
         """Configures screen associated style attributes using the given style_factory.
@@ -109,10 +265,90 @@ class Screen(object):
 
         :param style_factory: Style factory instance to use for configuring.
         """
-        self._style = style_factory.get_style(self)
-        fonts = style_factory.get_font_styles(self)
-        self._primary_style = fonts[0]
-        self._secondary_style = fonts[1]
+        style, primary, secondary = style_factory.get_computed_styles(self)
+        if style is self._style:
+            return
+        self._style = style
+        self._primary_style = primary
+        self._secondary_style = secondary
+        self._style_version += 1
+        self.clear_caches()
+        self.damage()
+
+    @property
+    def version(self):
+        """Version of this screen rendering, which changes
+        each time its content or style changes.
+
+        :returns: Tuple of content and style version.
+        """
+        return (self._content_version, self._style_version)
+
+    def invalidate(self):
+        """Notifies that this screen content changed : cached renderings
+        are dropped and the whole screen is marked as damaged.
+        """
+        self._content_version += 1
+        self.clear_caches()
+        self.damage()
+
+    def clear_caches(self):
+        """Drops cached renderings of this screen. Subclasses that cache
+        surfaces should override this method to drop them as well.
+        """
+        self._previews.clear()
+        self.drop_renders()
+
+    def get_render(self, name, key, renderer, *args):
+        """Retrieves the surface cached under the given name if it has been
+        rendered for the given key and current version, rendering it again
+        otherwise. Outdated surface is released.
+
+        :param name: Name of the cached surface.
+        :param key: Key the surface depends on, in addition to version.
+        :param renderer: Method rendering the surface.
+        :param args: Renderer arguments.
+        :returns: Cached surface, which should not be modified nor released.
+        """
+        version = (key, self.version)
+        entry = self._renders.get(name)
+        if entry is not None:
+            if entry[0] == version:
+                self.render_hits += 1
+                return entry[1]
+            self.drop_render(name)
+        self.render_misses += 1
+        surface = renderer(self, *args)
+        width, height = surface.get_size()
+        cost = width * height * PIXEL_BYTES
+        self._renders[name] = (version, surface, cost)
+        self.render_cost += cost
+        return surface
+
+    def drop_render(self, name):
+        """Drops and releases the surface cached under the given name if any.
+
+        :param name: Name of the cached surface.
+        """
+        entry = self._renders.pop(name, None)
+        if entry is not None:
+            self.render_cost -= entry[2]
+            self.release_surface(entry[1])
+
+    def drop_renders(self):
+        """ Drops and releases all cached surfaces. """
+        for name in list(self._renders.keys()):
+            self.drop_render(name)
+
+    def render_stats(self):
+        """
+        :returns: Dictionary of render cache usage and efficiency counters.
+        """
+        return {
+            'entries': len(self._renders),
+            'cost': self.render_cost,
+            'hits': self.render_hits,
+            'misses': self.render_misses}
 
     @property
     def font_manager(self):
@@ -155,13 +391,68 @@ class Screen(object):
         """
         self._surface_factory = surface_factory
 
+    @property
+    def dispatcher(self):
+        """Property getter for dispatcher attribute. If such dispatcher is
+        not settled, a default one that calls callbacks directly is used.
+
+        :returns: Dispatcher function to use.
+        """
+        if self._dispatcher is None:
+            def direct_dispatcher(callback, *args):
+                return callback(*args)
+            self._dispatcher = direct_dispatcher
+        return self._dispatcher
+
+    @dispatcher.setter
+    def dispatcher(self, dispatcher):
+        """Property setter for dispatcher attribute.
+
+        :param dispatcher: Dispatcher function to use.
+        """
+        self._dispatcher = dispatcher
+
+    def dispatch(self, callback, *args):
+        """Calls the given callback with the given arguments
+        through this screen dispatcher.
+
+        :param callback: Callback to call.
+        :param args: Callback arguments.
+        :returns: Callback result, or a future for asynchronous callbacks.
+        """
+        return self.dispatcher(callback, *args)
+
+    def damage(self, rect=None):
+        """Marks the given region of this screen as requiring a redraw.
+
+        :param rect: Region to redraw, None for the whole screen.
+        """
+        if None not in self._damages:
+            self._damages.append(rect)
+
+    def has_damages(self):
+        """
+        :returns: True if some regions are marked as damaged, False otherwise.
+        """
+        return len(self._damages) > 0
+
+    def pop_damages(self):
+        """Retrieves and clears regions marked as damaged since last call.
+
+        :returns: List of damaged regions, where None denotes the whole screen.
+        """
+        damages = self._damages
+        self._damages = []
+        return damages
+
     def draw_background(self, surface):
         """Draw a background into the given surface.
 
         :param surface: Surface to draw background into.
+        :returns: Modified area.
         """
         # TODO : Consider using background image variant ?
-        surface.fill(self._style.background_color)
+        return surface.fill(self._style.background_color)
 
     def _get_font(self, style):
         """
@@ -171,28 +462,54 @@ class Screen(object):
         return self.font_manager.get(style.name, style.size)
 
     def _get_text(self, text, style):
-        """Creates a text surface for the given text with primary font style.
+        """Creates a text surface for the given text with the given font
+        style. Rendered surfaces are cached by font manager, and should not
+        be modified.
 
         :param text: Text to render.
         :param style: Font style to use for text rendering.
-        :returns: Created text surface.
+        :returns: Text surface.
+        """
+        return self.font_manager.render(
+            text,
+            style.name,
+            style.size,
+            style.color)
+
+    def _get_measurer(self, style):
+        """
+        :param style: Font style to measure text with.
+        :returns: Text measurer for the given style.
+        """
+        return self.font_manager.get_measurer(style.name, style.size)
+
+    @property
+    def primary_measurer(self):
+        """
+        :returns: Text measurer for primary font style, usable as sizer.
         """
-        font = self._get_font(style)
-        return font.render(text, 0, style.color)
+        return self._get_measurer(self._primary_style)
+
+    @property
+    def secondary_measurer(self):
+        """
+        :returns: Text measurer for secondary font style, usable as sizer.
+        """
+        return self._get_measurer(self._secondary_style)
 
     def primary_size(self, text):
         """
         :param text:
         :returns:
         """
-        return self._get_font(self._primary_style).size(text)
+        return self.primary_measurer.size(text)
 
     def secondary_size(self, text):
         """
         :param text:
         :returns:
         """
-        return self._get_font(self._secondary_style).size(text)
+        return self.secondary_measurer.size(text)
 
     def draw_primary_text(self, text):
         """Creates a text surface for the given text with primary font style.
@@ -217,25 +534,61 @@ class Screen(object):
         :returns:
         """
         surface = self.create_surface(size)
-        # surface.fill(self.__button_style.background_color)
-        # text = self.__get_text(self, label, self.__button_style)
+        # TODO : Use button style once supported.
+        self.draw_background(surface)
+        text = self.draw_primary_text(label)
         self.draw_centered(surface, text)
         return surface
 
+    def get_centered_position(self, surface_size, delegate_size):
+        """
+        :param surface_size: Size of the surface to draw into.
+        :param delegate_size: Size of the surface to draw.
+        :returns: Position of the drawn surface once centered.
+        """
+        x = (surface_size[0] - delegate_size[0]) / 2
+        y = (surface_size[1] - delegate_size[1]) / 2
+        return (x, y)
+
     def draw_centered(self, surface, delegate):
         """
+        :returns: Modified area.
+        """
+        position = self.get_centered_position(
+            surface.get_size(),
+            delegate.get_size())
+        return surface.blit(delegate, position)
+
+    def set_hit_regions(self, layout, regions, offset=(0, 0)):
+        """Indexes the given hit regions, unless already indexed for the
+        given layout.
+
+        :param layout: Key identifying the layout regions are computed for.
+        :param regions: List of (rect, target) regions.
+        :param offset: Offset of regions into the screen surface.
+        :returns: True if index has been rebuilt, False otherwise.
+        """
+        if layout == self._hit_layout:
+            return False
+        self._hit_index.clear()
+        for rect, target in regions:
+            self._hit_index.add(Rect(rect).move(offset), target)
+        self._hit_layout = layout
+        return True
+
+    def hit_test(self, position):
         """
-        surface_size = surface.get_size()
-        delegate_surface_size = delegate.get_size()
-        x = (surface_size[0] - delegate_surface_size[0]) / 2
-        y = (surface_size[1] - delegate_surface_size[1]) / 2
-        surface.blit(delegate, (x, y))
+        :param position: Position in the screen surface.
+        :returns: Target of the hit region at the given position, None if any.
+        """
+        return self._hit_index.find(position)
 
     def draw(self, surface):
         """
         :param surface: Surface to draw screen into.
+        :returns: List of modified areas.
         """
-        self.draw_background(surface)
+        return [self.draw_background(surface)]
 
     def get_surface_drawable_size(self, surface):
         """ Surface
@@ -255,25 +608,71 @@ class Screen(object):
         """
         return self.surface_factory(size)
 
-    def process_event(self):
-        """ To doc
+    def release_surface(self, surface):
+        """Gives back the given surface to the surface factory,
+        if such factory supports it.
+
+        :param surface: Surface created by create_surface() to release.
         """
-        for event in events():
+        release = getattr(self.surface_factory, 'release', None)
+        if release is not None and surface is not None:
+            release(surface)
+
+    def process_event(self, pending=None):
+        """Processes the given events, dispatching mouse events to associated
+        handlers. If no events are given, pygame event queue is drained.
+
+        :param pending: Optional collection of events to process.
+        :returns: False if a QUIT event has been received, True otherwise.
+        """
+        if pending is None:
+            pending = events()
+        for event in pending:
             if event.type == MOUSEBUTTONDOWN:
-                self.on_mouse_down(mouse_position())
+                self.on_mouse_down(get_position(event))
             elif event.type == MOUSEBUTTONUP:
-                self.on_mouse_up(mouse_position())
+                self.on_mouse_up(get_position(event))
+            elif event.type == MOUSEMOTION:
+                self.on_mouse_move(get_position(event))
             elif event.type == QUIT:
                 return False
         return True
 
-    def generate_preview(self, size):
+    def has_preview(self, size):
+        """Indicates if an up to date preview is cached for the given size.
+
+        :param size: Size of the preview.
+        :returns: True if a preview is cached, False otherwise.
         """
-        :param size:
-        :returns:
+        key = tuple(size)
+        return key in self._previews and self._previews[key][0] == self.version
+
+    def drop_preview(self, size):
+        """Drops cached preview for the given size if any.
+
+        :param size: Size of the preview to drop.
         """
+        self._previews.pop(tuple(size), None)
+
+    def generate_preview(self, size):
+        """Generates a preview of this screen for the given size. Previews are
+        cached until screen version changes, so returned surface should not be
+        modified.
+
+        :param size: Size of the preview to generate.
+        :returns: Preview surface.
+        """
+        key = tuple(size)
+        version = self.version
+        if key in self._previews:
+            cached_version, surface = self._previews[key]
+            if cached_version == version:
+                self.preview_hits += 1
+                return surface
+        self.preview_misses += 1
         surface = Surface(size)
         self.draw(surface)
+        self._previews[key] = (version, surface)
         return surface
 
     def on_screen_activated(self):
@@ -291,3 +690,11 @@ class Screen(object):
         :param position:
         """
         pass
+
+    def on_mouse_move(self, position):
+        """Mouse motion event processing, only received if MOUSEMOTION
+        belongs to EVENT_TYPES.
+
+        :param position: Position of the mouse motion event.
+        """
+        pass
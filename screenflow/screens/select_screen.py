@@ -31,11 +31,17 @@
         def on_foo_select(option):
             # TODO : Callback action here.
 
+    Callback is called with the option displayed at the position where
+    the mouse button is released, if any. Option areas are recorded while
+    options are composed, into the screen hit index.
+
 """
 
 from screenflow.screens.screen import Oriented, get_longest, get_highest
+from screenflow.screens.screen import cached_render, unsized
 from screenflow.screens.message_based_screen import MessageBasedScreen
 from screenflow.constants import XML_NAME, VERTICAL, HORIZONTAL, BLACK, WHITE
+from pygame import Rect
 
 # Select screen type name.
 SCREEN_TYPE = 'select_screen'
@@ -60,9 +66,28 @@ class SelectScreen(MessageBasedScreen, Oriented):
         """
         MessageBasedScreen.__init__(self, name, SCREEN_TYPE, message)
         Oriented.__init__(self, orientation)
-        self.options = options
+        self._options = options
         self.callback = None
-        self.__options_surface = None
+        self._option_regions = []
+        self._options_offset = (0, 0)
+
+    @property
+    def options(self):
+        """Property getter for options attribute.
+
+        :returns: Options displayed into the screen.
+        """
+        return self._options
+
+    @options.setter
+    def options(self, options):
+        """Property setter for options attribute, which invalidates
+        this screen rendering.
+
+        :param options: Options to display into the screen.
+        """
+        self._options = options
+        self.invalidate()
 
     def on_select(self, function):
         """Decorator method that registers  the given function as selection callback.
@@ -79,8 +104,9 @@ class SelectScreen(MessageBasedScreen, Oriented):
 
         :param position: Position of the mouse up event.
         """
-        # TODO : Compute option collision
-        pass
+        option = self.hit_test(position)
+        if option is not None and self.callback is not None:
+            self.dispatch(self.callback, option)
 
     def get_options_surface_size(self, options_surface_size):
         """
@@ -91,8 +117,7 @@ class SelectScreen(MessageBasedScreen, Oriented):
         n = len(self.options)
         surface_width = options_surface_size[0]
         surface_height = options_surface_size[1]
-        # TODO : Find padding.
-        total_padding = self.cell_padding * (n - 1)
+        total_padding = self._style.padding * (n - 1)
         if self.isVertical():
             surface_height *= n
             surface_height += total_padding
@@ -111,38 +136,42 @@ class SelectScreen(MessageBasedScreen, Oriented):
             # TODO : Warning.
             pass
 
+    @cached_render(unsized)
     def get_options_surface(self, parent_surface_size):
+        """Factory method that creates a surface with this screen options.
+        Created surface is cached until this screen version changes.
+
+        :param parent_surface_size: Size of the target parent surface.
+        :returns: Created surface.
         """
-        :param parent_surface_width:
-        :returns:
-        """
-        if self._options_surface is None:
-            # TODO : Match sizer.
-            text_sizer = self.font_manager.primary
-            option_width = get_longest(self.options, text_sizer)
-            option_height = get_highest(self.options, text_sizer)
-            option_surface_size = (option_width, option_height)
-            options_surface_size = self.get_options_surface_size(
-                option_surface_size)
-            self.check_bounds(options_surface_size, parent_surface_size)
-            self.__options_surface = self.create_surface(options_surface_size)
-            self.__options_surface.fill((255, 255, 255))
-            current = 0
-            for option in self.options:
-                option_surface = self.draw_button(option, option_surface_size)
-                position = None
-                if self.isVertical():
-                    position = (0, current)
-                else:
-                    position = (current, 0)
-                self.__options_surface.blit(option_surface, position)
-                if self.isVertical():
-                    current += option_height
-                else:
-                    current += option_width
-                # TODO : Get padding.
-                current += self.cell_padding
-        return self.__options_surface
+        text_sizer = self.primary_measurer
+        option_width = get_longest(self.options, text_sizer)
+        option_height = get_highest(self.options, text_sizer)
+        option_surface_size = (option_width, option_height)
+        options_surface_size = self.get_options_surface_size(
+            option_surface_size)
+        self.check_bounds(options_surface_size, parent_surface_size)
+        surface = self.create_surface(options_surface_size)
+        self.draw_background(surface)
+        self._option_regions = []
+        current = 0
+        for option in self.options:
+            option_surface = self.draw_button(option, option_surface_size)
+            position = None
+            if self.isVertical():
+                position = (0, current)
+            else:
+                position = (current, 0)
+            surface.blit(option_surface, position)
+            self.release_surface(option_surface)
+            self._option_regions.append(
+                (Rect(position, option_surface_size), option))
+            if self.isVertical():
+                current += option_height
+            else:
+                current += option_width
+            current += self._style.padding
+        return surface
 
     def get_final_surface(self, message_surface, options_surface):
         """
@@ -160,19 +189,31 @@ class SelectScreen(MessageBasedScreen, Oriented):
         # TODO : Add padding.
         options_y = message_surface_size[1] + 20
         surface.blit(options_surface, (options_x, options_y))
+        self._options_offset = (options_x, options_y)
         return surface
 
     def draw(self, surface):
         """Drawing method, display centered label and options list below.
 
         :param surface: Surface to draw this screen into.
+        :returns: List of modified areas.
         """
-        super(SelectScreen, self).draw(surface)
+        rects = super(SelectScreen, self).draw(surface)
         surface_size = surface.get_size()
         message_surface = self.get_message_surface(surface_size)
         options_surface = self.get_options_surface(surface_size)
         final_surface = self.get_final_surface(message_surface, options_surface)
-        self.draw_centered(surface, final_surface)
+        rects.append(self.draw_centered(surface, final_surface))
+        x, y = self.get_centered_position(
+            surface_size,
+            final_surface.get_size())
+        offset = (x + self._options_offset[0], y + self._options_offset[1])
+        self.set_hit_regions(
+            (self.version, tuple(surface_size), offset),
+            self._option_regions,
+            offset)
+        self.release_surface(final_surface)
+        return rects
 
 # XML tag for option parameters.
 XML_OPTION = 'option'
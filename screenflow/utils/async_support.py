@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Asynchronous support
+    ====================
+
+    Helpers for integrating screenflow with asyncio event loop. As the
+    library itself remains compatible with Python 2, asyncio is only
+    imported when asynchronous features are used.
+"""
+
+
+def get_asyncio():
+    """Imports asyncio module.
+
+    :returns: asyncio module.
+    """
+    try:
+        import asyncio
+    except ImportError:
+        raise RuntimeError('Asynchronous mode requires asyncio (Python 3)')
+    return asyncio
+
+
+def is_awaitable(value):
+    """Indicates if the given value can be awaited, for instance a coroutine
+    object returned by an ``async def`` function, or a future.
+
+    :param value: Value to check.
+    :returns: True if the given value is awaitable, False otherwise.
+    """
+    return hasattr(value, '__await__')
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Cache directory
+    ===============
+
+    Helpers for persisting data between runs, such as the font index. Files
+    are stored into the screenflow cache directory, which is by default
+    *screenflow* directory under user cache directory (``XDG_CACHE_HOME``,
+    or *~/.cache*). It can be overridden using ``SCREENFLOW_CACHE_DIR``
+    environment variable.
+
+    Data compiled from a source file, such as flow definitions or styles,
+    is stored using marshal format, keyed by a digest of the source file
+    content : see *get_digest()*, *read_compiled()* and *write_compiled()*.
+"""
+
+import os
+import marshal
+import logging
+from hashlib import sha1
+
+# Configure logger.
+logger = logging.getLogger(__name__)
+
+# Environment variable that overrides cache directory.
+CACHE_DIRECTORY_VARIABLE = 'SCREENFLOW_CACHE_DIR'
+
+# Name of the cache directory under user cache directory.
+CACHE_DIRECTORY_NAME = 'screenflow'
+
+# Size of chunks read for hashing source files.
+CHUNK_SIZE = 64 * 1024
+
+
+def get_cache_directory():
+    """
+    :returns: Path of the screenflow cache directory.
+    """
+    directory = os.environ.get(CACHE_DIRECTORY_VARIABLE)
+    if directory:
+        return directory
+    base = os.environ.get('XDG_CACHE_HOME')
+    if not base:
+        base = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, CACHE_DIRECTORY_NAME)
+
+
+def get_cache_path(name):
+    """
+    :param name: Name of the cache file.
+    :returns: Path of the given cache file.
+    """
+    return os.path.join(get_cache_directory(), name)
+
+
+def write_file(path, content):
+    """Writes the given content into the given file atomically, creating
+    parent directory if required. Failures are logged and ignored, as
+    cache files are optional.
+
+    :param path: Path of the file to write.
+    :param content: Content to write, as bytes.
+    :returns: True if file has been written, False otherwise.
+    """
+    temporary = '%s.%d.tmp' % (path, os.getpid())
+    try:
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(temporary, 'wb') as stream:
+            stream.write(content)
+        if os.name == 'nt' and os.path.exists(path):
+            os.remove(path)
+        os.rename(temporary, path)
+        return True
+    except (IOError, OSError) as e:
+        logger.warning('Unable to write cache file %s : %s', path, e)
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        return False
+
+
+def get_digest(path, salt):
+    """Computes the cache key of the given source file.
+
+    :param path: Path of the source file.
+    :param salt: Text identifying how data is compiled, such as versions.
+    :returns: Hexadecimal digest of salt and file content.
+    """
+    digest = sha1()
+    digest.update(salt.encode('utf-8'))
+    with open(path, 'rb') as stream:
+        chunk = stream.read(CHUNK_SIZE)
+        while chunk:
+            digest.update(chunk)
+            chunk = stream.read(CHUNK_SIZE)
+    return digest.hexdigest()
+
+
+def read_compiled(path, digest):
+    """Reads compiled data written for the given key if any.
+
+    :param path: Path of the compiled cache file.
+    :param digest: Cache key of the source file.
+    :returns: Compiled data, None if not cached.
+    """
+    try:
+        with open(path, 'rb') as stream:
+            cached_digest, data = marshal.load(stream)
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+        return None
+    if cached_digest != digest:
+        return None
+    return data
+
+
+def write_compiled(path, digest, data):
+    """Writes the given compiled data for the given key.
+
+    :param path: Path of the compiled cache file.
+    :param digest: Cache key of the source file.
+    :param data: Compiled data, made of marshal supported types.
+    :returns: True if file has been written, False otherwise.
+    """
+    try:
+        content = marshal.dumps((digest, data))
+    except ValueError as e:
+        logger.warning('Unable to compile data for %s : %s', path, e)
+        return False
+    return write_file(path, content)
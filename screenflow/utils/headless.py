@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Headless rendering
+    ==================
+
+    Helpers for rendering without any physical display, using SDL dummy
+    video driver. The created display surface is a regular offscreen
+    surface, so rendering does the same pixel work as on a real display,
+    while display updates are no-op.
+
+    A screenflow can be run headless using the *headless* constructor
+    parameter :
+
+    .. code-block:: python
+
+        screenflow = ScreenFlow(headless=True, resolution=(800, 480))
+"""
+
+import os
+import logging
+from pygame import display, font
+
+# Configure logger.
+logger = logging.getLogger(__name__)
+
+# SDL video driver used for headless rendering.
+HEADLESS_DRIVER = 'dummy'
+
+# Default resolution used for headless rendering.
+DEFAULT_RESOLUTION = (800, 480)
+
+
+def init_headless():
+    """Initializes pygame display and font modules using SDL dummy video
+    driver, shutting down the display first if it was initialized with
+    another driver.
+    """
+    os.environ['SDL_VIDEODRIVER'] = HEADLESS_DRIVER
+    if display.get_init() and display.get_driver() != HEADLESS_DRIVER:
+        logger.info('Restarting display with %s driver', HEADLESS_DRIVER)
+        display.quit()
+    display.init()
+    font.init()
+
+
+def create_headless_surface(resolution=DEFAULT_RESOLUTION):
+    """Creates an offscreen display surface with the given resolution.
+
+    :param resolution: Resolution of the surface to create.
+    :returns: Created surface.
+    """
+    init_headless()
+    return display.set_mode(resolution)
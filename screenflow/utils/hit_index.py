@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Hit index
+    =========
+
+    A **HitIndex** is a spatial index of rectangular hit regions, each one
+    associated with a target, such as a button option. Regions are stored
+    into the cells of a uniform grid they overlap, so finding the target at
+    a given position only scans regions of a single cell. A lookup thus
+    costs a dictionary access plus a scan linear in the number of regions
+    overlapping that cell, which stays small for options laid out side by
+    side, but grows up to the number of regions when all of them overlap
+    the same cell. A uniform grid was preferred over a sorted structure
+    with logarithmic lookups, as screens hold few regions of similar size
+    and the grid is cheap to rebuild when layout changes.
+
+    .. code-block:: python
+
+        index = HitIndex()
+        index.add(Rect(0, 0, 100, 40), 'Yes')
+        target = index.find((10, 10))
+
+    When regions overlap, the last added one wins, as it is drawn on top.
+"""
+
+from pygame import Rect
+
+# Default size in pixels of grid cells.
+DEFAULT_CELL_SIZE = 64
+
+
+class HitIndex(object):
+    """ Uniform grid index of hit regions. """
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        """Default constructor.
+
+        :param cell_size: Size in pixels of grid cells.
+        """
+        self.cell_size = cell_size
+        self._cells = {}
+        self._count = 0
+
+    def __len__(self):
+        """
+        :returns: Number of indexed regions.
+        """
+        return self._count
+
+    def get_cell(self, position):
+        """
+        :param position: Position to get cell for.
+        :returns: Coordinates of the cell containing the given position.
+        """
+        return (position[0] // self.cell_size, position[1] // self.cell_size)
+
+    def add(self, rect, target):
+        """Indexes the given region.
+
+        :param rect: Area of the region.
+        :param target: Target associated to the region.
+        """
+        rect = Rect(rect)
+        if rect.width <= 0 or rect.height <= 0:
+            return
+        left, top = self.get_cell(rect.topleft)
+        right, bottom = self.get_cell((rect.right - 1, rect.bottom - 1))
+        entry = (rect, target)
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                self._cells.setdefault((x, y), []).append(entry)
+        self._count += 1
+
+    def find(self, position):
+        """Retrieves the target of the region at the given position.
+
+        :param position: Position to look up.
+        :returns: Target of the topmost region, None if no region found.
+        """
+        entries = self._cells.get(self.get_cell(position), ())
+        for rect, target in reversed(entries):
+            if rect.collidepoint(position):
+                return target
+        return None
+
+    def clear(self):
+        """ Removes all indexed regions. """
+        self._cells.clear()
+        self._count = 0
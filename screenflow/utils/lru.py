@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    LRU cache
+    =========
+
+    A **LRUCache** is a mapping bounded by the total cost of its values,
+    where least recently used entries are evicted first when a new entry
+    does not fit. Cost of an entry is given when inserting it, usually as
+    an estimated number of bytes.
+
+    .. code-block:: python
+
+        cache = LRUCache(limit=1024)
+        value = cache.get(key)
+        if value is None:
+            value = compute(key)
+            cache.put(key, value, len(value))
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """ Cost bounded least recently used cache. """
+
+    def __init__(self, limit):
+        """Default constructor.
+
+        :param limit: Maximum total cost of cached entries.
+        """
+        self.limit = limit
+        self._entries = OrderedDict()
+        self.cost = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """
+        :returns: Number of cached entries.
+        """
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """
+        :param key: Key to check.
+        :returns: True if an entry is cached for the given key.
+        """
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Retrieves the value cached for the given key, marking
+        it as most recently used.
+
+        :param key: Key of the entry to retrieve.
+        :param default: Value returned if no entry is cached.
+        :returns: Cached value, or default if none.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries[key] = entry
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, cost):
+        """Caches the given value, evicting least recently used entries
+        until it fits. Values costing more than limit are not cached.
+
+        :param key: Key of the entry.
+        :param value: Value to cache.
+        :param cost: Cost of the value.
+        """
+        self.pop(key)
+        if cost > self.limit:
+            return
+        while self.cost + cost > self.limit:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.cost -= evicted
+            self.evictions += 1
+        self._entries[key] = (value, cost)
+        self.cost += cost
+
+    def pop(self, key):
+        """Removes the entry for the given key if any.
+
+        :param key: Key of the entry to remove.
+        :returns: Removed value, None if not cached.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        self.cost -= entry[1]
+        return entry[0]
+
+    def clear(self):
+        """ Removes all cached entries. """
+        self._entries.clear()
+        self.cost = 0
+
+    def stats(self):
+        """
+        :returns: Dictionary of cache usage and efficiency counters.
+        """
+        requests = self.hits + self.misses
+        hit_rate = 0.0
+        if requests > 0:
+            hit_rate = float(self.hits) / requests
+        return {
+            'entries': len(self._entries),
+            'cost': self.cost,
+            'limit': self.limit,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': hit_rate}
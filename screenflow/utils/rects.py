@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Rectangle helpers
+    =================
+
+    Utility functions for manipulating dirty rectangles collected
+    while rendering a frame.
+"""
+
+from pygame import Rect
+
+# Ratio of covered area from which a full update is preferred.
+FULL_UPDATE_RATIO = 0.75
+
+
+def merge_rects(rects, bounds=None):
+    """Merges the given rectangles so that overlapping ones are replaced by
+    their union. If bounds is given, rectangles are clipped into it, and a
+    single bounds rectangle is returned if merged rectangles covers most of
+    it.
+
+    :param rects: Collection of rectangles to merge.
+    :param bounds: Optional rectangle merged ones should be clipped into.
+    :returns: List of merged rectangles.
+    """
+    merged = []
+    for rect in rects:
+        current = Rect(rect)
+        if bounds is not None:
+            current = current.clip(bounds)
+        if current.width == 0 or current.height == 0:
+            continue
+        index = current.collidelist(merged)
+        while index != -1:
+            current.union_ip(merged.pop(index))
+            index = current.collidelist(merged)
+        merged.append(current)
+    if bounds is not None and len(merged) > 0:
+        area = sum(rect.width * rect.height for rect in merged)
+        if area >= bounds.width * bounds.height * FULL_UPDATE_RATIO:
+            return [Rect(bounds)]
+    return merged
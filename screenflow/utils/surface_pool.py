@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Surface pool
+    ============
+
+    A **SurfacePool** is a surface factory that reuses released surfaces
+    instead of allocating new ones. Requested sizes are rounded up to size
+    buckets, so a released surface can serve any later request of the same
+    bucket : the pooled surface is then returned as a subsurface of the
+    requested size.
+
+    .. code-block:: python
+
+        pool = SurfacePool()
+        surface = pool((120, 40))
+        # TODO : Draw into surface here.
+        pool.release(surface)
+
+    Released surfaces are kept until the pool byte limit is reached, beyond
+    which they are discarded. A pool is shared by all screens of a
+    screenflow, through screen *surface_factory* attribute.
+"""
+
+from pygame import Surface, Rect
+
+# Default maximum number of bytes held by released surfaces.
+DEFAULT_LIMIT = 16 * 1024 * 1024
+
+# Default size granularity in pixels of surface buckets.
+DEFAULT_GRANULARITY = 32
+
+# Estimated number of bytes per surface pixel.
+PIXEL_BYTES = 4
+
+
+class SurfacePool(object):
+    """ Size bucketed pool of reusable surfaces. """
+
+    def __init__(self, limit=DEFAULT_LIMIT, granularity=DEFAULT_GRANULARITY):
+        """Default constructor.
+
+        :param limit: Maximum number of bytes held by released surfaces.
+        :param granularity: Size granularity in pixels of surface buckets.
+        """
+        self.limit = limit
+        self.granularity = granularity
+        self._buckets = {}
+        self._parents = {}
+        self.pooled_bytes = 0
+        self.allocations = 0
+        self.reuses = 0
+        self.releases = 0
+        self.discards = 0
+
+    def get_bucket(self, size):
+        """
+        :param size: Requested surface size.
+        :returns: Size of the bucket the given size belongs to.
+        """
+        granularity = self.granularity
+        return tuple(
+            max(1, (int(length) + granularity - 1) // granularity)
+            * granularity
+            for length in size)
+
+    def get_cost(self, size):
+        """
+        :param size: Surface size.
+        :returns: Estimated number of bytes of a surface of the given size.
+        """
+        return size[0] * size[1] * PIXEL_BYTES
+
+    def __call__(self, size):
+        """ Surface factory interface, see acquire(). """
+        return self.acquire(size)
+
+    def acquire(self, size):
+        """Retrieves a surface of the given size, reusing
+        a released surface of the same bucket if any.
+
+        :param size: Size of the surface.
+        :returns: Surface of the given size.
+        """
+        size = (int(size[0]), int(size[1]))
+        bucket = self.get_bucket(size)
+        available = self._buckets.get(bucket)
+        if available:
+            parent = available.pop()
+            self.pooled_bytes -= self.get_cost(bucket)
+            self.reuses += 1
+        else:
+            parent = Surface(bucket)
+            self.allocations += 1
+        if size == bucket:
+            return parent
+        surface = parent.subsurface(Rect((0, 0), size))
+        self._parents[surface] = parent
+        return surface
+
+    def release(self, surface):
+        """Gives back the given surface to this pool. Released surface
+        should not be used anymore by the caller.
+
+        :param surface: Surface to release.
+        """
+        if surface is None:
+            return
+        parent = self._parents.pop(surface, surface)
+        bucket = parent.get_size()
+        cost = self.get_cost(bucket)
+        if bucket != self.get_bucket(bucket) \
+                or self.pooled_bytes + cost > self.limit:
+            self.discards += 1
+            return
+        self._buckets.setdefault(bucket, []).append(parent)
+        self.pooled_bytes += cost
+        self.releases += 1
+
+    def clear(self):
+        """ Discards all released surfaces. """
+        self._buckets.clear()
+        self.pooled_bytes = 0
+
+    def stats(self):
+        """
+        :returns: Dictionary of allocation and reuse counters.
+        """
+        return {
+            'allocations': self.allocations,
+            'reuses': self.reuses,
+            'releases': self.releases,
+            'discards': self.discards,
+            'pooled_bytes': self.pooled_bytes}
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+"""
+    Line wrapping
+    =============
+
+    Wraps text into lines that fit into a given width. Text is split into
+    whitespace separated tokens, and tokens too wide for a single line (long
+    URLs, or text without spaces such as CJK) are broken by character. Token
+    widths are measured once, and line widths are then computed from prefix
+    sums of token widths. Two wrapping modes are available :
+
+    - *GREEDY* puts as many tokens as possible on each line, in a single
+      pass over tokens.
+    - *BALANCED* minimizes the raggedness of lines (sum of squared remaining
+      widths, last line excepted), considering for each token only the
+      candidate lines that fit.
+
+    .. code-block:: python
+
+        lines = wrap(text, measurer, 400, mode=BALANCED)
+
+    Sizer can be any function that returns size of a given text. When it is
+    a **TextMeasurer**, token widths are estimated from glyph advances, and
+    resulting lines are checked with its *fits()* method.
+"""
+
+# Wrapping mode that fills each line as much as possible.
+GREEDY = 'greedy'
+
+# Wrapping mode that minimizes raggedness of lines.
+BALANCED = 'balanced'
+
+
+def fits(text, sizer, surface_width):
+    """Indicates if the given text fits into the given width, using
+    sizer fits() method if available, such as **TextMeasurer** one.
+
+    :param text: Text to check.
+    :param sizer: Function that computes rendering size for a given text.
+    :param surface_width: Width of the surface text will be rendered.
+    :returns: True if text fits, False otherwise.
+    """
+    measure = getattr(sizer, 'fits', None)
+    if measure is not None:
+        return measure(text, surface_width)
+    return sizer(text)[0] < surface_width
+
+
+def get_measure(sizer):
+    """
+    :param sizer: Function that computes rendering size for a given text.
+    :returns: Function that computes width of a given text.
+    """
+    width = getattr(sizer, 'width', None)
+    if width is not None:
+        return width
+    return lambda text: sizer(text)[0]
+
+
+def break_token(token, sizer, surface_width):
+    """Breaks the given token by character into pieces that fit
+    into the given width, a piece holding at least one character.
+    Pieces are estimated from character widths, then checked with
+    *fits()*, trailing characters being moved to the next piece until
+    the piece fits.
+
+    :param token: Token to break.
+    :param sizer: Function that computes rendering size for a given text.
+    :param surface_width: Width of the surface token will be rendered.
+    :returns: List of token pieces.
+    """
+    measure = get_measure(sizer)
+    pieces = []
+    start = 0
+    while start < len(token):
+        end = start + 1
+        current = measure(token[start])
+        while end < len(token):
+            advance = measure(token[end])
+            if current + advance >= surface_width:
+                break
+            current += advance
+            end += 1
+        while end - start > 1 \
+                and not fits(token[start:end], sizer, surface_width):
+            end -= 1
+        pieces.append(token[start:end])
+        start = end
+    return pieces
+
+
+def get_tokens(line, sizer, surface_width):
+    """Splits the given line into tokens, breaking too wide ones.
+
+    :param line: Line to split.
+    :param sizer: Function that computes rendering size for a given text.
+    :param surface_width: Width of the surface line will be rendered.
+    :returns: Tuple of tokens list and tokens width list.
+    """
+    measure = get_measure(sizer)
+    tokens = []
+    widths = []
+    for token in line.split():
+        width = measure(token)
+        if width < surface_width:
+            tokens.append(token)
+            widths.append(width)
+            continue
+        for piece in break_token(token, sizer, surface_width):
+            tokens.append(piece)
+            widths.append(measure(piece))
+    return tokens, widths
+
+
+def get_prefix_sums(widths):
+    """
+    :param widths: List of widths.
+    :returns: List of cumulated widths, starting with 0.
+    """
+    sums = [0]
+    total = 0
+    for width in widths:
+        total += width
+        sums.append(total)
+    return sums
+
+
+def greedy_breaks(sums, space, surface_width):
+    """Computes line breaks filling each line as much as possible.
+
+    :param sums: Prefix sums of token widths.
+    :param space: Width of a space.
+    :param surface_width: Width of the surface lines will be rendered.
+    :returns: List of (start, end) token index pairs for each line.
+    """
+    breaks = []
+    start = 0
+    for end in range(2, len(sums)):
+        width = sums[end] - sums[start] + space * (end - start - 1)
+        if width >= surface_width:
+            breaks.append((start, end - 1))
+            start = end - 1
+    breaks.append((start, len(sums) - 1))
+    return breaks
+
+
+def balanced_breaks(sums, space, surface_width):
+    """Computes line breaks minimizing raggedness of lines.
+
+    :param sums: Prefix sums of token widths.
+    :param space: Width of a space.
+    :param surface_width: Width of the surface lines will be rendered.
+    :returns: List of (start, end) token index pairs for each line.
+    """
+    n = len(sums) - 1
+    costs = [0] + [None] * n
+    previous = [0] * (n + 1)
+    for end in range(1, n + 1):
+        start = end - 1
+        while start >= 0:
+            width = sums[end] - sums[start] + space * (end - start - 1)
+            if width >= surface_width and start < end - 1:
+                break
+            cost = costs[start]
+            if end < n:
+                cost += (surface_width - width) ** 2
+            if costs[end] is None or cost < costs[end]:
+                costs[end] = cost
+                previous[end] = start
+            start -= 1
+    breaks = []
+    end = n
+    while end > 0:
+        breaks.append((previous[end], end))
+        end = previous[end]
+    breaks.reverse()
+    return breaks
+
+
+def fit_line(tokens, sizer, surface_width):
+    """Ensures the line made of the given tokens fits into the given width,
+    moving trailing tokens to their own lines otherwise. A single token
+    that does not fit is broken by character.
+
+    :param tokens: Tokens of the line.
+    :param sizer: Function that computes rendering size for a given text.
+    :param surface_width: Width of the surface line will be rendered.
+    :returns: List of lines.
+    """
+    line = ' '.join(tokens)
+    if fits(line, sizer, surface_width):
+        return [line]
+    if len(tokens) == 1:
+        return break_token(line, sizer, surface_width)
+    return (
+        fit_line(tokens[:-1], sizer, surface_width) +
+        fit_line(tokens[-1:], sizer, surface_width))
+
+
+def wrap(line, sizer, surface_width, mode=GREEDY):
+    """Wraps the given line into lines that fit into the given width.
+
+    :param line: Line to wrap.
+    :param sizer: Function that computes rendering size for a given text.
+    :param surface_width: Width of the surface lines will be rendered.
+    :param mode: Wrapping mode, GREEDY or BALANCED.
+    :returns: List of lines.
+    """
+    if fits(line, sizer, surface_width):
+        return [line]
+    tokens, widths = get_tokens(line, sizer, surface_width)
+    if len(tokens) == 0:
+        return [line]
+    sums = get_prefix_sums(widths)
+    space = get_measure(sizer)(' ')
+    if mode == BALANCED:
+        breaks = balanced_breaks(sums, space, surface_width)
+    elif mode == GREEDY:
+        breaks = greedy_breaks(sums, space, surface_width)
+    else:
+        raise ValueError('Unknown wrapping mode %s' % mode)
+    lines = []
+    for start, end in breaks:
+        lines += fit_line(tokens[start:end], sizer, surface_width)
+    return lines
@@ -13,10 +13,11 @@ setup(
     author_email='felix.voituret@gmail.com',
     url='https://github.com/Faylixe/screenflow',
     download_url='https://github.com/Faylixe/screenflow/tarball/1.0',
-    install_requires=['pygame', 'pygame_vkeyboard'],
+    install_requires=['pygame>=2.0', 'pygame_vkeyboard'],
     keywords=['pygame', 'UI'],
     classifiers=[
         'Programming Language :: Python :: 2.7',
+        'Programming Language :: Python :: 3',
         'Topic :: Software Development :: Libraries :: pygame'
     ],
     include_package_data=True
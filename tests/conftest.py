@@ -0,0 +1,18 @@
+#!/usr/bin/python
+
+""" Shared fixtures for screenflow test suite. """
+
+from pygame.font import init as font_init
+from pytest import fixture
+
+
+@fixture(autouse=True)
+def cache_directory_isolation(tmpdir, monkeypatch):
+    """ Fixture that keeps tests from writing into user cache directory. """
+    monkeypatch.setenv('SCREENFLOW_CACHE_DIR', str(tmpdir.join('.cache')))
+
+
+@fixture(autouse=True)
+def font_initialization():
+    """ Fixture that initializes pygame font module for every test. """
+    font_init()
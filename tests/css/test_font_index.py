@@ -0,0 +1,80 @@
+#!/usr/bin/python
+
+""" Simple test suite for FontIndex class. """
+
+import os
+import shutil
+import struct
+import pygame
+from pygame.font import get_default_font
+from pytest import raises
+from screenflow.css.font_index import FontIndex, normalize, read_font_names
+
+# Path of pygame default font file, used as indexed font.
+DEFAULT_FONT = os.path.join(
+    os.path.dirname(pygame.__file__),
+    get_default_font())
+
+
+def create_index(tmpdir):
+    """Creates an index over a font directory holding pygame default font.
+
+    :param tmpdir: Temporary directory to create font directory into.
+    :returns: Created index and font file path.
+    """
+    fonts = tmpdir.mkdir('fonts')
+    path = str(fonts.join('FreeSansBold.ttf'))
+    shutil.copy(DEFAULT_FONT, path)
+    index = FontIndex(
+        directories=[str(fonts)],
+        path=str(tmpdir.join('index.json')))
+    return index, path
+
+
+def test_normalize():
+    """ Test case for family name normalization. """
+    assert normalize('DejaVu Sans') == 'dejavusans'
+    assert normalize('free-sans') == 'freesans'
+
+
+def test_read_font_names():
+    """ Test case for font file name table parsing. """
+    family, subfamily = read_font_names(DEFAULT_FONT)
+    assert family == 'FreeSans'
+    assert subfamily == 'Bold'
+
+
+def test_read_font_names_truncated(tmpdir):
+    """ Test case for name table lookup in a truncated font file. """
+    path = str(tmpdir.join('truncated.ttf'))
+    with open(DEFAULT_FONT, 'rb') as stream:
+        data = stream.read(64)
+    with open(path, 'wb') as stream:
+        stream.write(data)
+    with raises(struct.error):
+        read_font_names(path)
+
+
+def test_find(tmpdir):
+    """ Test case for font lookup. """
+    index, path = create_index(tmpdir)
+    assert index.find('FreeSans') == path
+    assert index.find('Free Sans Bold') == path
+    assert index.find('freesansbold') == path
+    assert index.find('Unknown, "FreeSans"') == path
+    assert index.find('Unknown') is None
+    assert os.path.exists(index.path)
+
+
+def test_persistence(tmpdir):
+    """ Test case for index reuse and invalidation. """
+    index, path = create_index(tmpdir)
+    index.find('FreeSans')
+    other = FontIndex(directories=index.directories, path=index.path)
+    assert other.load()
+    assert other.find('FreeSans') == path
+    shutil.copy(DEFAULT_FONT, os.path.join(index.directories[0], 'Other.ttf'))
+    os.utime(index.directories[0], (0, 0))
+    other = FontIndex(directories=index.directories, path=index.path)
+    assert not other.load()
+    assert other.find('Other') is not None
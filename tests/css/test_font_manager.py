@@ -3,7 +3,30 @@
 """ Simple test suite for FontManager class. """
 
 from pygame.font import SysFont, init as font_init
-from screenflow.css.font_manager import FontManager
+from screenflow.css.font_manager import FontManager, TextMeasurer
+from screenflow.css.font_index import FontIndex
+
+
+class CountingFont(object):
+    """ Font wrapper counting size calls. """
+
+    def __init__(self, font):
+        """ Default constructor. """
+        self.font = font
+        self.size_call = 0
+
+    def get_height(self):
+        """ Delegates height lookup to the wrapped font. """
+        return self.font.get_height()
+
+    def metrics(self, text):
+        """ Delegates glyph metrics to the wrapped font. """
+        return self.font.metrics(text)
+
+    def size(self, text):
+        """ Counts and delegates text sizing to the wrapped font. """
+        self.size_call += 1
+        return self.font.size(text)
 
 
 def setup_module(module):
@@ -25,9 +48,90 @@ def test_get():
 def test_font_factory():
     """ FontManager delegate factory test case. """
     manager = FontManager()
-    assert manager.font_factory == SysFont
+    assert manager.font_factory == manager.index_font_factory
 
     def factory(name, size):
         return None
     manager.font_factory = factory
     assert manager.get('arial', 20) is None
+
+
+def test_index_font_factory(tmpdir):
+    """ FontManager indexed font loading test case. """
+    index = FontIndex(
+        directories=[str(tmpdir)],
+        path=str(tmpdir.join('i.json')))
+    manager = FontManager(font_index=index)
+    font = manager.get('unknown', 20)
+    assert font.get_height() > 0
+    assert manager.font_index is index
+
+
+def test_preload():
+    """ FontManager font preloading test case. """
+    manager = FontManager()
+    created = []
+
+    def factory(name, size):
+        created.append((name, size))
+        return None
+    manager.font_factory = factory
+    manager.preload([('arial', 20), ('arial', 30), ('arial', 20)])
+    assert manager.preload_step()
+    assert not manager.preload_step()
+    assert not manager.preload_step()
+    assert created == [('arial', 20), ('arial', 30)]
+
+
+def test_render():
+    """ FontManager rendered text cache test case. """
+    manager = FontManager()
+    surface = manager.render('Yes', 'arial', 20, (0, 0, 0))
+    assert surface is manager.render('Yes', 'arial', 20, [0, 0, 0])
+    assert surface is not manager.render('Yes', 'arial', 20, (255, 0, 0))
+    assert surface is not manager.render('Yes', 'arial', 20, (0, 0, 0), True)
+    stats = manager.text_stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 3
+    assert stats['entries'] == 3
+
+
+def test_render_limit():
+    """ FontManager rendered text cache bound test case. """
+    manager = FontManager(text_cache_limit=0)
+    surface = manager.render('Yes', 'arial', 20, (0, 0, 0))
+    assert surface is not manager.render('Yes', 'arial', 20, (0, 0, 0))
+    assert manager.text_stats()['cost'] == 0
+
+
+def test_get_measurer():
+    """ FontManager text measurer access test case. """
+    manager = FontManager()
+    measurer = manager.get_measurer('arial', 20)
+    assert measurer is manager.get_measurer('arial', 20)
+    assert measurer.font is manager.get('arial', 20)
+
+
+def test_measurer_size():
+    """ TextMeasurer memoized size test case. """
+    font = CountingFont(SysFont('arial', 20))
+    measurer = TextMeasurer(font)
+    size = measurer('Hello world')
+    assert size == font.font.size('Hello world')
+    assert measurer.size('Hello world') == size
+    assert font.size_call == 1
+
+
+def test_measurer_width():
+    """ TextMeasurer estimated width and fits test case. """
+    font = CountingFont(SysFont('arial', 20))
+    measurer = TextMeasurer(font)
+    text = 'The quick brown fox jumps over the lazy dog'
+    width = font.font.size(text)[0]
+    assert abs(measurer.width(text) - width) <= len(text)
+    assert measurer.fits(text, width + 1)
+    assert not measurer.fits(text, width)
+    calls = font.size_call
+    assert measurer.fits(text, width * 2)
+    assert not measurer.fits(text, width / 2)
+    assert font.size_call == calls
@@ -0,0 +1,160 @@
+#!/usr/bin/python
+
+""" Simple test suite for StyleFactory computed styles. """
+
+import sys
+from os.path import join
+from pytest import raises, fixture
+from screenflow.constants import WHITE
+from screenflow.css.style_factory import StyleFactory, DEFAULT_PADDING
+from tests.mocks.mock_screen import MockScreen
+
+# Path of the CSS test resource.
+STYLE_FILE = join('tests', 'resources', 'test_style.css')
+
+# Stylesheet using every component selector.
+COMPONENTS_STYLESHEET = """
+screenflow { background-color: #102030; padding: 5; }
+screenflow primary { font-family: Arial; color: navy; }
+.message_screen secondary { font-size: 8; }
+#foo { transition-duration: 1s; }
+#foo button { background-color: red; color: white; font-size: 12; }
+"""
+
+
+@fixture
+def cache_directory(tmpdir, monkeypatch):
+    """ Fixture that uses a temporary cache directory. """
+    monkeypatch.setenv('SCREENFLOW_CACHE_DIR', str(tmpdir.mkdir('cache')))
+    return tmpdir
+
+
+def get_tables(factory):
+    """
+    :param factory: Style factory to retrieve style tables from.
+    :returns: Own attributes of each selector component style.
+    """
+    tables = {}
+    selectors = [('screenflow', factory._screenflow_styles)]
+    selectors += [('.' + k, v) for k, v in factory._type_styles.items()]
+    selectors += [('#' + k, v) for k, v in factory._name_styles.items()]
+    for tls, styles in selectors:
+        components = {
+            'style': styles._style,
+            'primary': styles._primary,
+            'secondary': styles._secondary}
+        components.update(styles._other)
+        for component, style in components.items():
+            if style is not None:
+                attributes = dict(vars(style))
+                del attributes['_parent']
+                tables[(tls, component)] = attributes
+    return tables
+
+
+def test_computed_styles():
+    """ Test case for computed styles resolution. """
+    factory = StyleFactory()
+    screen = MockScreen('foo')
+    style, primary, secondary = factory.get_computed_styles(screen)
+    assert style.background_color == WHITE
+    assert style.padding == DEFAULT_PADDING
+    assert style.version == 0
+    assert primary.size > secondary.size
+    assert factory.get_computed_styles(screen)[0] is style
+    with raises(AttributeError) as e:
+        style.padding = 0
+    with raises(AttributeError) as e:
+        style.other = 0
+
+
+def test_computed_styles_load():
+    """ Test case for computed styles update on CSS loading. """
+    factory = StyleFactory()
+    bar = MockScreen('bar')
+    bar.type = 'message_screen'
+    before = factory.get_computed_styles(bar)
+    factory.load(STYLE_FILE)
+    style, primary, _ = factory.get_computed_styles(bar)
+    assert style.version == 1
+    assert style != before[0]
+    assert style.padding == 10
+    assert style.transition_duration == 500
+    assert style.transition_easing == 'linear'
+    assert style.background_color == (0, 0, 0)
+    assert primary.size == 30
+
+
+def test_reload(tmpdir):
+    """ Test case for incremental invalidation on styles reloading. """
+    css = tmpdir.join('style.css')
+    css.write('screenflow { padding: 5; }\n#foo { padding: 10; }\n')
+    factory = StyleFactory()
+    factory.load(str(css))
+    foo = MockScreen('foo')
+    bar = MockScreen('bar')
+    foo_styles = factory.get_computed_styles(foo)
+    bar_styles = factory.get_computed_styles(bar)
+    assert factory.reload() == set()
+    assert factory.get_computed_styles(foo) is foo_styles
+    css.write('screenflow { padding: 5; }\n#foo { padding: 15; }\n')
+    assert factory.reload() == set(['#foo'])
+    assert factory.get_computed_styles(foo)[0].padding == 15
+    assert factory.get_computed_styles(bar) is bar_styles
+    css.write('screenflow { padding: 0; }\n#foo { padding: 15; }\n')
+    assert factory.reload() == set(['screenflow'])
+    assert factory.get_computed_styles(bar)[0].padding == 0
+    assert factory.get_computed_styles(foo)[0].padding == 15
+
+
+def test_compiled_cache(cache_directory, monkeypatch):
+    """ Test case for compiled style cache equivalence with parsing. """
+    css = cache_directory.join('style.css')
+    css.write(COMPONENTS_STYLESHEET)
+    parsed = StyleFactory()
+    parsed.load(str(css), cache=False)
+    written = StyleFactory()
+    written.load(str(css))
+    monkeypatch.setitem(sys.modules, 'tinycss', None)
+    monkeypatch.setitem(sys.modules, 'webcolors', None)
+    cached = StyleFactory()
+    cached.load(str(css))
+    assert get_tables(cached) == get_tables(parsed)
+    assert get_tables(written) == get_tables(parsed)
+    assert cached._declarations == parsed._declarations
+    foo = MockScreen('foo')
+    foo.type = 'message_screen'
+    assert cached.get_computed_styles(foo) == parsed.get_computed_styles(foo)
+    assert cached.get_computed_styles(foo)[1].color == (0, 0, 128)
+    with raises(ImportError) as e:
+        StyleFactory().load(str(css), cache=False)
+
+
+def test_compiled_cache_parser_version(cache_directory):
+    """ Test case for compiled style cache keyed by parser versions. """
+    css = cache_directory.join('style.css')
+    css.write('screenflow { padding: 5; }\n')
+    foo = MockScreen('foo')
+    for factor, version in ((2, 2), (3, 3), (4, None)):
+        def parser(value, style, factor=factor):
+            style.padding = int(value) * factor
+        factory = StyleFactory()
+        factory.register_declaration_parser('padding', parser, version)
+        factory.load(str(css))
+        assert factory.get_computed_styles(foo)[0].padding == 5 * factor
+    assert len(cache_directory.join('cache').listdir()) == 2
+
+
+def test_compiled_cache_unsupported_value(cache_directory):
+    """ Test case for resolved values not supported by compiled cache. """
+    css = cache_directory.join('style.css')
+    css.write('screenflow { padding: 5; }\n')
+    value = object()
+
+    def parser(_, style):
+        style.padding = value
+    factory = StyleFactory()
+    factory.register_declaration_parser('padding', parser, 1)
+    factory.load(str(css))
+    assert factory._screenflow_styles.style.padding is value
+    assert len(cache_directory.join('cache').listdir()) == 0
@@ -2,7 +2,7 @@
 
 """ To document. """
 
-from mock_surface import MockSurface
+from tests.mocks.mock_surface import MockSurface
 
 
 class MockScreen(object):
@@ -12,13 +12,34 @@ class MockScreen(object):
         """ Default constructor. """
         self._font_manager = None
         self.name = name
+        self.type = 'mock_screen'
         self.preview_generated = 0
+        self.preview_hits = 0
+        self.preview_misses = 0
+        self.preview_dropped = 0
+        self.caches_cleared = 0
 
     def configure_styles(self, style_factory):
-        """ """
+        """ Ignores style configuration. """
         pass
 
+    def clear_caches(self):
+        """ Counts cache clearing requests. """
+        self.caches_cleared += 1
+
+    def render_stats(self):
+        """ Returns fixed render cache statistics. """
+        return {'entries': 1, 'cost': 100, 'hits': 1, 'misses': 1}
+
+    def has_preview(self, size):
+        """ Indicates no preview is ever cached. """
+        return False
+
+    def drop_preview(self, size):
+        """ Counts dropped previews. """
+        self.preview_dropped += 1
+
     def generate_preview(self, size):
-        """ """
+        """ Counts and returns a mock preview surface. """
         self.preview_generated += 1
         return MockSurface(size)
@@ -2,6 +2,8 @@
 
 """ To document. """
 
+from pygame import Rect
+
 # Default surface size used for testing.
 DEFAULT_SURFACE_SIZE = (640, 480)
 
@@ -17,6 +19,7 @@ class MockSurface(object):
         self.size = size
         self.blit_call = 0
         self.fill_call = 0
+        self.clip = None
 
     def get_size(self):
         """ Returns the size of this surface.
@@ -25,20 +28,41 @@ class MockSurface(object):
         """
         return self.size
 
-    def blit(self, source, position):
+    def get_rect(self):
+        """ Returns the area covered by this surface.
+
+        :returns: Rectangle of this surface.
+        """
+        return Rect((0, 0), self.size)
+
+    def set_clip(self, rect):
+        """ Clipping area setter mocking.
+
+        :param rect: Clipping area to use, None to reset it.
+        """
+        self.clip = rect
+
+    def blit(self, source, position, area=None):
         """ Blit method mocking.
 
         :param source: Source to blit into this surface.
         :param position: Position to blit source to.
+        :param area: Optional area of the source to blit.
+        :returns: Area covered by the blitted source.
         """
         self.blit_call += 1
+        if area is not None:
+            return Rect(position, area.size)
+        return Rect(position, source.get_size())
 
     def fill(self, color):
         """
 
         :param color:
+        :returns: Filled area.
         """
         self.fill_call += 1
+        return self.get_rect()
 
     def copy(self):
         """
@@ -0,0 +1,234 @@
+#!/usr/bin/python
+
+""" Simple test suite for List screen associated classes. """
+
+from screenflow.constants import XML_NAME
+from screenflow.css.font_manager import FontManager
+from screenflow.css.style_factory import StyleFactory
+from screenflow.screens.list_screen import ListScreen
+from screenflow.screens.list_screen import factory
+from tests.mocks.mock_surface import MockSurface, factory as surface_factory
+from pytest import raises
+
+# Default name for testing.
+DEFAULT_NAME = 'list'
+
+# Number of items provided for testing.
+DEFAULT_LENGTH = 100000
+
+# Row size used for testing.
+DEFAULT_ITEM_SIZE = 40
+
+
+class MockFuture(object):
+    """ Mock class for asynchronous provider result. """
+
+    def __init__(self):
+        """ Default constructor. """
+        self.callbacks = []
+        self.items = None
+
+    def __await__(self):
+        """ Marks this object as awaitable. """
+        pass
+
+    def add_done_callback(self, callback):
+        """ Registers a callback invoked on completion. """
+        self.callbacks.append(callback)
+
+    def cancelled(self):
+        """ Indicates this future is never cancelled. """
+        return False
+
+    def exception(self):
+        """ Indicates this future never fails. """
+        return None
+
+    def result(self):
+        """ Returns items this future was completed with. """
+        return self.items
+
+    def complete(self, items):
+        """ Completes this future and invokes callbacks. """
+        self.items = items
+        for callback in self.callbacks:
+            callback(self)
+
+
+def create_list_screen(length=DEFAULT_LENGTH, **kwargs):
+    """Simple factory method that creates a styled list
+    screen with a provider of the given length.
+
+    :param length: Number of items provided.
+    :returns: Created screen and list of provider calls.
+    """
+    screen = ListScreen(DEFAULT_NAME, item_size=DEFAULT_ITEM_SIZE, **kwargs)
+    screen.font_manager = FontManager()
+    screen.surface_factory = surface_factory
+    screen.configure_styles(StyleFactory())
+    calls = []
+
+    @screen.provider
+    def provide(offset, limit):
+        calls.append((offset, limit))
+        return range(offset, min(offset + limit, length))
+    return screen, calls
+
+
+def test_factory():
+    """ Test case for list screen factory. """
+    screen = factory({XML_NAME: DEFAULT_NAME})
+    assert isinstance(screen, ListScreen)
+    assert screen.name == DEFAULT_NAME
+
+
+def test_providerless_list():
+    """ Test case for item access without provider. """
+    screen = ListScreen(DEFAULT_NAME)
+    with raises(AttributeError) as e:
+        screen.get_item(0)
+
+
+def test_get_item():
+    """ Test case for item access through provider pages. """
+    screen, calls = create_list_screen(page_size=10, cached_pages=2)
+    assert screen.get_item(5) == 5
+    assert screen.get_item(9) == 9
+    assert calls == [(0, 10)]
+    assert screen.get_item(25) == 25
+    assert screen.get_item(35) == 35
+    assert len(screen._pages) == 2
+    assert screen.get_item(5) == 5
+    assert len(calls) == 4
+    assert screen.length is None
+
+
+def test_length_discovery():
+    """ Test case for end of data detection. """
+    screen, calls = create_list_screen(length=15, page_size=10)
+    assert screen.get_item(12) == 12
+    assert screen.length == 15
+    assert screen.get_item(15) is None
+    assert screen.get_item(-1) is None
+
+
+def test_draw_visible_rows():
+    """ Test case for drawing only visible rows. """
+    screen, calls = create_list_screen()
+    surface = MockSurface()
+    screen.draw(surface)
+    visible = len(screen._rows)
+    viewport = surface.get_size()[1] - screen._style.padding * 2
+    assert visible <= viewport // DEFAULT_ITEM_SIZE + 1
+    assert surface.blit_call == visible
+    assert len(calls) == 1
+
+
+def test_scroll_reuses_rows():
+    """ Test case for row surfaces pool reuse while scrolling. """
+    screen, calls = create_list_screen()
+    surface = MockSurface()
+    screen.draw(surface)
+    allocated = screen.rows_allocated
+    for i in range(200):
+        screen.scroll(DEFAULT_ITEM_SIZE * 7 + 3)
+        screen.draw(surface)
+    assert screen.rows_allocated <= allocated + 1
+    assert len(screen._rows) + len(screen._free_rows) <= allocated + 1
+    assert len(screen._pages) <= screen.cached_pages
+
+
+def test_scroll_bounds():
+    """ Test case for scrolling offset bounds. """
+    screen, calls = create_list_screen(length=20)
+    surface = MockSurface()
+    screen.scroll(-100)
+    assert screen.offset == 0
+    screen.scroll_to(1000)
+    screen.draw(surface)
+    viewport = surface.get_size()[1] - screen._style.padding * 2
+    assert screen.offset == 20 * DEFAULT_ITEM_SIZE - viewport
+
+
+def test_mouse_select():
+    """ Test case for item selection and drag scrolling. """
+    screen, calls = create_list_screen()
+    selected = []
+
+    @screen.on_select
+    def on_select(item):
+        selected.append(item)
+    screen.draw(MockSurface())
+    padding = screen._style.padding
+    position = (padding + 1, padding + DEFAULT_ITEM_SIZE * 2 + 1)
+    screen.on_mouse_down(position)
+    screen.on_mouse_up(position)
+    assert selected == [2]
+    screen.on_mouse_down(position)
+    screen.on_mouse_up((position[0], position[1] - DEFAULT_ITEM_SIZE))
+    assert screen.offset == DEFAULT_ITEM_SIZE
+    assert selected == [2]
+
+
+def test_mouse_drag():
+    """ Test case for list following the pointer while dragged. """
+    screen, calls = create_list_screen()
+    selected = []
+
+    @screen.on_select
+    def on_select(item):
+        selected.append(item)
+    screen.draw(MockSurface())
+    padding = screen._style.padding
+    x, y = (padding + 1, padding + DEFAULT_ITEM_SIZE * 4 + 1)
+    screen.on_mouse_move((x, y - 50))
+    assert screen.offset == 0
+    screen.on_mouse_down((x, y))
+    screen.on_mouse_move((x, y - 5))
+    assert screen.offset == 0
+    screen.on_mouse_move((x, y - 50))
+    assert screen.offset == 50
+    screen.on_mouse_move((x, y - 5))
+    assert screen.offset == 5
+    screen.on_mouse_up((x, y - 20))
+    assert screen.offset == 20
+    assert selected == []
+    screen.on_mouse_move((x, y - 80))
+    assert screen.offset == 20
+
+
+def test_draw_unicode_row():
+    """ Test case for default rendering of non ASCII items. """
+    screen = ListScreen(DEFAULT_NAME, item_size=DEFAULT_ITEM_SIZE)
+    screen.font_manager = FontManager()
+    screen.surface_factory = surface_factory
+    screen.configure_styles(StyleFactory())
+
+    @screen.provider
+    def provide(offset, limit):
+        return [u'R\xe9seau caf\xe9', u'\u7f51\u7edc'][offset:offset + limit]
+    screen.draw(MockSurface())
+    assert screen.rows_rendered == 2
+
+
+def test_asynchronous_provider():
+    """ Test case for provider returning awaitable pages. """
+    screen, calls = create_list_screen()
+    futures = []
+
+    @screen.provider
+    def provide(offset, limit):
+        future = MockFuture()
+        futures.append(future)
+        return future
+    surface = MockSurface()
+    screen.draw(surface)
+    assert screen.get_item(0) is ListScreen.LOADING
+    assert len(futures) == 1
+    rendered = screen.rows_rendered
+    screen.pop_damages()
+    futures[0].complete(range(screen.page_size))
+    assert screen.get_item(3) == 3
+    assert screen.pop_damages() == [None]
+    screen.draw(surface)
+    assert screen.rows_rendered > rendered
@@ -52,5 +52,16 @@ def test_message_large_token(screen):
     text = 'Thisisaverylongtextwhichrequirestobesplitted'
     message = Message(text)
     lines = message.lines(screen.primary_size, 200)
-    assert len(lines) == 1
-    assert lines[0] == 'Thisisaverylongtextwhichrequirestobesplitted'
+    assert len(lines) > 1
+    assert ''.join(lines) == text
+    assert all(screen.primary_size(line)[0] < 200 for line in lines)
+
+
+def test_message_lines_sizer_update(screen):
+    """ Test case for message splitting update on sizer change. """
+    text = 'This is a very long text which requires to be splitted'
+    message = Message(text)
+    lines = message.lines(screen.primary_size, 100)
+    assert not message.should_update(100, screen.primary_size)
+    assert message.should_update(100, screen.secondary_size)
+    assert len(message.lines(screen.secondary_size, 100)) <= len(lines)
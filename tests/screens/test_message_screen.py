@@ -5,7 +5,7 @@
 from screenflow.constants import XML_NAME
 from screenflow.css.font_manager import FontManager
 from screenflow.css.style_factory import StyleFactory
-from screenflow.screens import MessageScreen
+from screenflow.screens.message_screen import MessageScreen
 from screenflow.screens.message_screen import factory
 from screenflow.screens.message_based_screen import Message, XML_MESSAGE
 from tests.mocks.mock_surface import MockSurface, factory as mock_factory
@@ -59,16 +59,74 @@ def test_mouse_event(screen):
     assert len(call) == 1
 
 
+def test_damage(screen):
+    """ Test case for damaged regions tracking. """
+    assert screen.pop_damages() == []
+    screen.damage((0, 0, 10, 10))
+    assert screen.pop_damages() == [(0, 0, 10, 10)]
+    screen.damage()
+    screen.damage((0, 0, 10, 10))
+    assert screen.pop_damages() == [None]
+    assert screen.pop_damages() == []
+
+
 def test_draw(screen):
     """ Test case for message screen drawing method. """
     screen.font_manager = FontManager()
     screen.configure_styles(StyleFactory())
     screen.surface_factory = mock_factory
     surface = MockSurface()
-    screen.draw(surface)
+    rects = screen.draw(surface)
     assert surface.fill_call == 1
     assert surface.blit_call == 1
+    assert surface.get_rect() in rects
     drawable_size = screen.get_surface_drawable_size(surface)
     lines = screen.message.lines(None, drawable_size[0])
     assert len(lines) >= 0
     assert lines[0] == DEFAULT_MESSAGE
+
+
+def test_preview_cache(screen):
+    """ Test case for preview caching. """
+    screen.font_manager = FontManager()
+    screen.configure_styles(StyleFactory())
+    preview = screen.generate_preview((200, 100))
+    assert screen.preview_misses == 1
+    assert screen.generate_preview((200, 100)) is preview
+    assert screen.preview_hits == 1
+    assert screen.generate_preview((100, 100)) is not preview
+    assert screen.preview_misses == 2
+
+
+def test_preview_invalidation(screen):
+    """ Test case for preview invalidation on content or style change. """
+    screen.font_manager = FontManager()
+    screen.configure_styles(StyleFactory())
+    preview = screen.generate_preview((200, 100))
+    screen.message = 'Another message'
+    assert screen.message.text == ['Another message']
+    assert screen.generate_preview((200, 100)) is not preview
+    preview = screen.generate_preview((200, 100))
+    screen.configure_styles(StyleFactory())
+    assert screen.generate_preview((200, 100)) is not preview
+    assert screen.preview_misses == 3
+    assert screen.preview_hits == 1
+
+
+def test_render_cache(screen):
+    """ Test case for message surface render cache. """
+    screen.font_manager = FontManager()
+    screen.configure_styles(StyleFactory())
+    surface = screen.get_message_surface((200, 100))
+    assert screen.get_message_surface((200, 50)) is surface
+    stats = screen.render_stats()
+    assert stats['entries'] == 1
+    assert stats['hits'] == 1
+    assert stats['cost'] == surface.get_width() * surface.get_height() * 4
+    assert screen.get_message_surface((300, 100)) is not surface
+    surface = screen.get_message_surface((300, 100))
+    screen.message = 'Another message'
+    assert screen.render_stats()['entries'] == 0
+    assert screen.get_message_surface((300, 100)) is not surface
+    screen.clear_caches()
+    assert screen.render_stats()['cost'] == 0
@@ -4,7 +4,8 @@
 
 from screenflow.constants import XML_NAME
 from screenflow.css.font_manager import FontManager
-from screenflow.screens import SelectScreen
+from screenflow.css.style_factory import StyleFactory
+from screenflow.screens.select_screen import SelectScreen
 from screenflow.screens.message_based_screen import XML_MESSAGE
 from screenflow.screens.select_screen import factory, XML_OPTION
 from tests.mocks.mock_surface import MockSurface, factory as surface_factory
@@ -82,9 +83,32 @@ def test_on_select():
 
 def test_mouse_event():
     """ Test case for mouse event. """
-    pass
+    screen = create_select_screen()
+    screen.configure_styles(StyleFactory())
+    selected = []
+    screen.on_select(selected.append)
+    surface = MockSurface()
+    screen.draw(surface)
+    regions = list(screen._option_regions)
+    assert [option for _, option in regions] == DEFAULT_OPTIONS
+    offset = screen._hit_layout[2]
+    for rect, option in regions:
+        screen.on_mouse_up(rect.move(offset).center)
+    assert selected == DEFAULT_OPTIONS
+    screen.on_mouse_up((0, 0))
+    assert selected == DEFAULT_OPTIONS
+    assert not screen.set_hit_regions(screen._hit_layout, [], offset)
 
 
 def test_draw():
     """ Test case for select screen drawing method. """
-    pass
+    screen = create_select_screen()
+    screen.configure_styles(StyleFactory())
+    surface = MockSurface()
+    rects = screen.draw(surface)
+    assert surface.fill_call == 1
+    assert surface.blit_call == 1
+    assert surface.get_rect() in rects
+    options_surface = screen.get_options_surface(surface.get_size())
+    assert options_surface.blit_call == len(DEFAULT_OPTIONS)
+    assert screen.get_options_surface(surface.get_size()) is options_surface
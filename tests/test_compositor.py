@@ -0,0 +1,76 @@
+#!/usr/bin/python
+
+""" Test suite for Compositor class. """
+
+from pygame import Rect
+from pygame.event import Event
+from pygame.constants import QUIT, KEYDOWN, MOUSEBUTTONDOWN, MOUSEBUTTONUP
+from pytest import raises, fixture
+from screenflow.compositor import Compositor
+from screenflow.screens.message_screen import MessageScreen
+
+
+@fixture
+def compositor():
+    """ Fixture for a compositor hosting two started flows. """
+    compositor = Compositor(headless=True, resolution=(200, 100))
+    for region in (Rect(0, 0, 100, 100), Rect(100, 0, 100, 100)):
+        flow = compositor.create_flow(region)
+        foo = MessageScreen('foo', 'Foo')
+        bar = MessageScreen('bar', 'Bar')
+        flow.add_screen(foo)
+        flow.add_screen(bar)
+        compositor.start(flow, foo)
+    yield compositor
+    compositor.event_pipeline.release()
+
+
+def test_create_flow(compositor):
+    """ Test case for flow creation with shared caches. """
+    left, right = compositor._flows
+    assert left.surface.get_abs_offset() == (0, 0)
+    assert right.surface.get_abs_offset() == (100, 0)
+    assert left.foo.font_manager is compositor.font_manager
+    assert right.foo.font_manager is compositor.font_manager
+    assert right.foo.surface_factory is compositor.surface_pool
+    assert compositor.text_stats()['entries'] > 0
+    with raises(ValueError):
+        compositor.create_flow(Rect(50, 0, 100, 100))
+    with raises(ValueError):
+        compositor.create_flow(Rect(150, 0, 100, 100))
+
+
+def test_route(compositor):
+    """ Test case for event routing and translation. """
+    left, right = compositor._flows
+    key = Event(KEYDOWN, key=0)
+    routed = compositor.route([Event(QUIT), key])
+    assert len(routed[left]) == 2
+    assert len(routed[right]) == 1
+    click = Event(MOUSEBUTTONDOWN, pos=(150, 20), button=1)
+    routed = compositor.route([click, key])
+    assert routed[left] == []
+    assert routed[right][0].pos == (50, 20)
+    assert routed[right][1] is key
+
+
+def test_process_frame(compositor):
+    """ Test case for idle flows skipping and transition deferring. """
+    left, right = compositor._flows
+    assert compositor.is_idle()
+    assert not compositor.process_frame([])
+
+    @right.foo.on_touch
+    def on_touch():
+        right.navigate_to(right.bar)
+    up = Event(MOUSEBUTTONUP, pos=(150, 20), button=1)
+    compositor.process_frame([up])
+    assert right.is_animating()
+    assert not left.is_animating()
+    assert not compositor.is_idle()
+    assert compositor.process_frame([up])
+    assert len(compositor._deferred[right]) == 1
+    right.foo.damage()
+    assert not right.is_idle()
+    compositor.quit()
+    assert not any(flow.is_running() for flow in compositor._flows)
@@ -0,0 +1,67 @@
+#!/usr/bin/python
+
+""" Test suite for EventPipeline class. """
+
+from pygame.event import Event, get_blocked
+from pygame.constants import QUIT, MOUSEMOTION, MOUSEBUTTONUP, KEYDOWN
+from screenflow.event_pipeline import EventPipeline
+from screenflow.screens.screen import Screen
+from screenflow.utils.headless import create_headless_surface
+
+
+def motion(position, rel=(1, 1)):
+    """
+    :param position: Position of the created event.
+    :param rel: Relative motion of the created event.
+    :returns: Created mouse motion event.
+    """
+    return Event(MOUSEMOTION, pos=position, rel=rel, buttons=(1, 0, 0))
+
+
+def test_process():
+    """ Test case for event filtering and motion coalescing. """
+    pipeline = EventPipeline()
+    pipeline.subscribe((MOUSEMOTION, MOUSEBUTTONUP))
+    pending = [
+        motion((1, 1)),
+        motion((2, 2)),
+        motion((3, 5), (1, 3)),
+        Event(KEYDOWN, key=0),
+        Event(MOUSEBUTTONUP, pos=(3, 5), button=1),
+        motion((4, 5))]
+    dispatched = pipeline.process(pending)
+    assert [event.type for event in dispatched] == [
+        MOUSEMOTION,
+        MOUSEBUTTONUP,
+        MOUSEMOTION]
+    assert dispatched[0].pos == (3, 5)
+    assert dispatched[0].rel == (3, 5)
+    assert dispatched[0].buttons == (1, 0, 0)
+    assert dispatched[2] is pending[-1]
+    assert pipeline.stats() == {'received': 6, 'dropped': 3, 'dispatched': 3}
+
+
+def test_apply():
+    """ Test case for pygame queue restriction. """
+    create_headless_surface((64, 48))
+    pipeline = EventPipeline()
+    assert pipeline.apply()
+    assert get_blocked(MOUSEMOTION)
+    assert not get_blocked(QUIT)
+    pipeline.subscribe(Screen.EVENT_TYPES)
+    assert not get_blocked(MOUSEBUTTONUP)
+    pipeline.release()
+    assert not get_blocked(MOUSEMOTION)
+
+
+def test_event_position():
+    """ Test case for screen dispatching event positions. """
+    positions = []
+    screen = Screen('foo', 'test_screen')
+    screen.on_mouse_up = positions.append
+    screen.on_mouse_move = positions.append
+    assert screen.process_event([
+        motion((1, 2)),
+        Event(MOUSEBUTTONUP, pos=(3, 4), button=1)])
+    assert positions == [(1, 2), (3, 4)]
+    assert not screen.process_event([Event(QUIT)])
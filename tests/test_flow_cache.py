@@ -0,0 +1,59 @@
+#!/usr/bin/python
+
+""" Test suite for compiled flow cache. """
+
+from os.path import join, exists
+from screenflow import flow_cache
+from screenflow.flow_cache import load_definitions, parse_file, iterparse_file
+from screenflow.flow_cache import get_digest, get_cache_file
+from pytest import raises, fixture
+
+# Path of test resources.
+RESOURCES_PATH = join('tests', 'resources')
+
+# Flow file used for testing.
+LINKED_FLOW = join(RESOURCES_PATH, 'test_linked_screenflow.xml')
+
+
+@fixture
+def cache_directory(tmpdir, monkeypatch):
+    """ Fixture that uses a temporary cache directory. """
+    monkeypatch.setenv('SCREENFLOW_CACHE_DIR', str(tmpdir))
+    return tmpdir
+
+
+def test_iterparse_file():
+    """ Test case for streaming parsing equivalence. """
+    for name in ('test_single_screenflow.xml', 'test_linked_screenflow.xml'):
+        path = join(RESOURCES_PATH, name)
+        assert list(iterparse_file(path)) == parse_file(path)
+
+
+def test_iterparse_invalid_file():
+    """ Test case for streaming parsing error handling. """
+    for name in (
+            'test_screenflow_without_root.xml',
+            'test_screenflow_without_screen.xml'):
+        with raises(AttributeError) as e:
+            list(iterparse_file(join(RESOURCES_PATH, name)))
+
+
+def test_load_definitions(cache_directory, monkeypatch):
+    """ Test case for compiled cache writing and reading. """
+    definitions = load_definitions(LINKED_FLOW)
+    assert len(definitions) == 3
+    assert definitions[0]['next'] == ['bar', 'baz']
+    assert exists(get_cache_file(get_digest(LINKED_FLOW)))
+
+    def fail(flow_file):
+        raise AssertionError('Flow file parsed again')
+    monkeypatch.setattr(flow_cache, 'parse_file', fail)
+    assert load_definitions(LINKED_FLOW) == definitions
+    with raises(AssertionError) as e:
+        load_definitions(LINKED_FLOW, cache=False)
+
+
+def test_load_definitions_streaming(cache_directory):
+    """ Test case for streaming parsing through cache loading. """
+    definitions = load_definitions(LINKED_FLOW, streaming=True)
+    assert definitions == load_definitions(LINKED_FLOW, cache=False)
@@ -0,0 +1,67 @@
+#!/usr/bin/python
+
+""" Test suite for screenflow import graph. """
+
+import os
+import sys
+import subprocess
+from pytest import mark
+
+# Root directory of the repository.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that should not be imported until required.
+LAZY_MODULES = (
+    'xmltodict',
+    'tinycss',
+    'webcolors',
+    'screenflow.screens.screen',
+    'screenflow.screens.message_screen',
+    'screenflow.screens.select_screen',
+    'screenflow.screens.list_screen')
+
+
+def run(arguments, environment=None):
+    """Runs a python interpreter with the given arguments from repository root.
+
+    :param arguments: Interpreter arguments.
+    :param environment: Additional environment variables.
+    :returns: Tuple of standard output and error.
+    """
+    env = dict(os.environ)
+    env.update(environment or {})
+    process = subprocess.Popen(
+        [sys.executable] + arguments,
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True)
+    out, err = process.communicate()
+    assert process.returncode == 0, err
+    return out, err
+
+
+def test_lazy_imports():
+    """ Test case for modules not imported by screenflow creation. """
+    script = (
+        'import sys\n'
+        'from screenflow.screenflow import ScreenFlow\n'
+        'ScreenFlow(object())\n'
+        'print(",".join(sys.modules))\n')
+    out, _ = run(['-c', script])
+    modules = out.strip().split('\n')[-1].split(',')
+    for module in LAZY_MODULES:
+        assert module not in modules
+
+
+@mark.skipif(sys.version_info < (3, 7), reason='requires PEP 562')
+def test_lazy_attributes():
+    """ Test case for screen classes imported on access. """
+    script = (
+        'import sys\n'
+        'from screenflow.screens import SelectScreen\n'
+        'print("screenflow.screens.select_screen" in sys.modules)\n'
+        'print("screenflow.screens.list_screen" in sys.modules)\n')
+    out, _ = run(['-c', script])
+    assert out.strip().split('\n')[-2:] == ['True', 'False']
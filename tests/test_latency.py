@@ -0,0 +1,105 @@
+#!/usr/bin/python
+
+""" Simple test suite for LatencyTracer associated classes. """
+
+from pygame.event import Event
+from pygame.constants import MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION
+from screenflow.latency import LatencyTracer, LatencyHistogram
+from screenflow.latency import NAVIGATE, PREVIEW, NO_CALLBACK, BUCKETS
+from screenflow.screenflow import ScreenFlow
+from screenflow.screens.message_screen import MessageScreen
+
+# Input events used for testing.
+PRESS = Event(MOUSEBUTTONDOWN, pos=(10, 10), button=1)
+TAP = Event(MOUSEBUTTONUP, pos=(10, 10), button=1)
+
+
+def test_histogram():
+    """ Test case for latency bucketing. """
+    histogram = LatencyHistogram()
+    for latency in (0.001, 0.010, 0.010, 5.0):
+        histogram.record(latency)
+    stats = histogram.stats()
+    assert stats['count'] == 4
+    buckets = dict(stats['buckets'])
+    assert buckets[BUCKETS[0]] == 1
+    assert buckets[BUCKETS[1]] == 2
+    assert buckets[None] == 1
+    assert stats['max'] == 5000.0
+
+
+def test_tracer_navigation():
+    """ Test case for a traced input leading to a navigation. """
+    tracer = LatencyTracer()
+    tracer.begin([Event(MOUSEMOTION, pos=(0, 0))], 'foo')
+    tracer.presented(False)
+    assert tracer.stats()['count'] == 0
+    tracer.begin([TAP], 'foo')
+
+    def on_foo_touch():
+        pass
+    tracer.dispatched(on_foo_touch)
+    tracer.mark(NAVIGATE)
+    tracer.mark(PREVIEW)
+    tracer.presented(False)
+    assert tracer.stats()['count'] == 0
+    tracer.presented(True)
+    stats = tracer.stats()
+    assert stats['count'] == 1
+    assert stats['screens']['foo']['count'] == 1
+    assert stats['callbacks']['on_foo_touch']['count'] == 1
+    for step in ('callback', 'navigate', 'preview', 'present'):
+        assert stats['steps'][step]['count'] == 1
+
+
+def test_tracer_without_navigation():
+    """ Test case for traced inputs that do not navigate. """
+    tracer = LatencyTracer()
+    tracer.begin([TAP], 'foo')
+    tracer.begin([TAP], 'foo')
+    tracer.presented(False)
+    tracer.presented(False)
+    stats = tracer.stats()
+    assert stats['count'] == 1
+    assert stats['dropped'] == 1
+    assert stats['callbacks'][NO_CALLBACK]['count'] == 1
+    assert stats['steps']['navigate']['count'] == 0
+
+
+def test_tracer_press_release():
+    """ Test case for a tap traced from its button press. """
+    tracer = LatencyTracer()
+    tracer.begin([PRESS], 'foo')
+    start = tracer._trace.start
+    tracer.begin([TAP], 'foo')
+    assert tracer._trace.start == start
+    tracer.presented(False)
+    tracer.begin([PRESS, TAP], 'foo')
+    tracer.presented(False)
+    stats = tracer.stats()
+    assert stats['count'] == 2
+    assert stats['dropped'] == 0
+
+
+def test_screenflow_latency():
+    """ Test case for input to transition frame tracing. """
+    screenflow = ScreenFlow(headless=True, resolution=(64, 48))
+    foo = MessageScreen('foo', 'Foo')
+    bar = MessageScreen('bar', 'Bar')
+    screenflow.add_screen(foo)
+    screenflow.add_screen(bar)
+
+    @foo.on_touch
+    def on_foo_touch():
+        screenflow.navigate_to(bar)
+    screenflow.enable_latency_tracing()
+    screenflow.start(foo)
+    screenflow.process_frame([TAP])
+    assert screenflow.latency_stats()['count'] == 0
+    screenflow.process_frame([])
+    stats = screenflow.latency_stats()
+    assert stats['count'] == 1
+    assert stats['screens']['foo']['count'] == 1
+    assert stats['callbacks']['on_foo_touch']['count'] == 1
+    screenflow._events.release()
+    screenflow.disable_latency_tracing()
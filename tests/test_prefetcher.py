@@ -0,0 +1,54 @@
+#!/usr/bin/python
+
+""" Simple test suite for Prefetcher class. """
+
+from screenflow.prefetcher import Prefetcher
+from tests.mocks.mock_screen import MockScreen
+
+# Preview size used for testing.
+SIZE = (100, 100)
+
+
+def prefetcher_budget(count):
+    """Computes memory budget required for the given number of previews.
+
+    :param count: Number of previews.
+    :returns: Memory budget in bytes.
+    """
+    return Prefetcher().get_cost(SIZE) * count
+
+
+def test_prefetch():
+    """ Test case for prefetching all scheduled screens. """
+    prefetcher = Prefetcher()
+    screens = [MockScreen('foo'), MockScreen('bar')]
+    prefetcher.schedule(screens, SIZE)
+    assert prefetcher.pending
+    assert prefetcher.step()
+    assert not prefetcher.step()
+    assert not prefetcher.pending
+    assert prefetcher.rendered == 2
+    assert all(screen.preview_generated == 1 for screen in screens)
+
+
+def test_prefetch_budget():
+    """ Test case for prefetching within memory budget. """
+    prefetcher = Prefetcher(prefetcher_budget(1))
+    screens = [MockScreen('foo'), MockScreen('bar')]
+    prefetcher.schedule(screens, SIZE)
+    assert not prefetcher.step()
+    assert screens[0].preview_generated == 1
+    assert screens[1].preview_generated == 0
+
+
+def test_prefetch_release():
+    """ Test case for releasing previews not required anymore. """
+    prefetcher = Prefetcher()
+    foo = MockScreen('foo')
+    bar = MockScreen('bar')
+    prefetcher.schedule([foo, bar], SIZE)
+    while prefetcher.step():
+        continue
+    prefetcher.schedule([bar], SIZE)
+    assert foo.preview_dropped == 1
+    assert bar.preview_dropped == 0
@@ -0,0 +1,53 @@
+#!/usr/bin/python
+
+""" Simple test suite for FrameProfiler associated classes. """
+
+from screenflow.profiler import FrameProfiler, RingBuffer, percentile
+from screenflow.profiler import PHASES, FRAME, EVENTS, DRAW
+
+
+def test_percentile():
+    """ Test case for nearest rank percentile. """
+    values = range(1, 101)
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) == 0.0
+    assert percentile([3], 95) == 3
+
+
+def test_ring_buffer():
+    """ Test case for ring buffer overwriting. """
+    buffer = RingBuffer(3)
+    for value in range(5):
+        buffer.append(value)
+    assert len(buffer) == 3
+    assert sorted(buffer.values()) == [2, 3, 4]
+
+
+def test_profiler_stats():
+    """ Test case for frame recording and statistics. """
+    profiler = FrameProfiler(capacity=4)
+    for screen in ('foo', 'foo', 'bar'):
+        profiler.begin_frame(screen)
+        profiler.mark(EVENTS)
+        profiler.mark(DRAW)
+        profiler.end_frame()
+    profiler.begin_frame('foo')
+    profiler.end_frame(record=False)
+    stats = profiler.stats()
+    assert stats['frames'] == 3
+    assert stats['dropped'] == 0
+    for phase in PHASES + (FRAME,):
+        assert set(stats['phases'][phase].keys()) == set(
+            ('p50', 'p95', 'p99', 'max'))
+    assert stats['screens']['foo']['frames'] == 2
+    assert stats['screens']['bar']['frames'] == 1
+
+
+def test_profiler_dropped_frames():
+    """ Test case for dropped frame detection. """
+    profiler = FrameProfiler(budget=-1)
+    profiler.begin_frame('foo')
+    profiler.mark(DRAW)
+    profiler.end_frame()
+    assert profiler.stats()['dropped'] == 1
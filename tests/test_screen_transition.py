@@ -3,46 +3,71 @@
 """ Simple test suite for ScreenTransition class. """
 
 from screenflow.screenflow import ScreenTransition
-from mocks.mock_surface import MockSurface, DEFAULT_SURFACE_SIZE
+from screenflow.easing import ease_in
+from tests.mocks.mock_surface import MockSurface, DEFAULT_SURFACE_SIZE
 
 
-def check_transition(side, speed, width, expected_speed, expected_position):
-    """ Executes and check a transition using given side, speed and surface width.
+class MockClock(object):
+    """ Mock clock which time is manually settled. """
+
+    def __init__(self):
+        """ Default constructor. """
+        self.time = 0
+
+    def __call__(self):
+        """ Returns current time. """
+        return self.time
+
+
+def check_transition(side, duration, step, easing='linear'):
+    """ Executes and check a transition using given side, duration and step.
 
     :param side: Side of the created transition.
-    :param speed: Speed of the created transition.
-    :param width: Width of the target surface transition is running into.
-    :param expected_speed: Expected effective speed value for transition.
-    :param expected_position: Expected starting position for transition.
+    :param duration: Duration of the created transition.
+    :param step: Time elapsed between two transition updates.
+    :param easing: Easing of the created transition.
+    :returns: Positions the transition went through.
     """
+    clock = MockClock()
     surface = MockSurface()
     previews = [MockSurface(), MockSurface()]
-    transition = ScreenTransition(previews, side, speed)
-    assert transition._speed == expected_speed
-    assert transition._position == expected_position
+    transition = ScreenTransition(previews, side, duration, easing, clock)
+    positions = []
     while transition.update(surface):
-        continue
-    assert surface.blit_call == (width / speed) * 2
-    return transition._position
+        positions.append(transition._position)
+        clock.time += step
+    assert clock.time >= duration
+    assert surface.blit_call == len(positions) * 2
+    return positions
 
 
 def test_forward_transition():
     """ Test case for forward transition. """
-    final_position = check_transition(
-        ScreenTransition.FORWARD,
-        20,
-        DEFAULT_SURFACE_SIZE[0],
-        -20,
-        DEFAULT_SURFACE_SIZE[0])
-    assert final_position < 0
+    width = DEFAULT_SURFACE_SIZE[0]
+    positions = check_transition(ScreenTransition.FORWARD, 100, 25)
+    assert positions == [width, width * 3 / 4, width / 2, width / 4]
 
 
 def test_backward_transition():
     """ Test case for backward transition. """
-    final_position = check_transition(
-        ScreenTransition.BACKWARD,
-        20,
-        DEFAULT_SURFACE_SIZE[0],
-        20,
-        0)
-    assert final_position > DEFAULT_SURFACE_SIZE[0]
+    width = DEFAULT_SURFACE_SIZE[0]
+    positions = check_transition(ScreenTransition.BACKWARD, 100, 25)
+    assert positions == [0, width / 4, width / 2, width * 3 / 4]
+
+
+def test_frame_skipping():
+    """ Test case for transition duration independence from frame rate. """
+    slow = check_transition(ScreenTransition.FORWARD, 400, 100)
+    fast = check_transition(ScreenTransition.FORWARD, 400, 10)
+    assert len(slow) == 4
+    assert len(fast) == 40
+    assert slow[2] == fast[20]
+
+
+def test_easing():
+    """ Test case for eased transition. """
+    width = DEFAULT_SURFACE_SIZE[0]
+    positions = check_transition(ScreenTransition.BACKWARD, 100, 50, ease_in)
+    assert positions == [0, int(round(width * ease_in(0.5)))]
+    positions = check_transition(ScreenTransition.BACKWARD, 100, 50, 'ease-in')
+    assert positions == [0, int(round(width * ease_in(0.5)))]
@@ -4,12 +4,21 @@
 
 from screenflow.constants import XML_TYPE, XML_NAME
 from screenflow.screenflow import ScreenFlow, NavigationException
+from screenflow.screenflow import DEFAULT_MAX_FPS
 from screenflow.css.font_manager import FontManager
-from screenflow.screens import MessageScreen
-from mocks.mock_surface import MockSurface
-from mocks.mock_screen import MockScreen
-from pytest import raises, fixture
+from screenflow.screens.message_screen import MessageScreen
+from screenflow.screens.select_screen import SelectScreen
+from tests.mocks.mock_surface import MockSurface
+from tests.mocks.mock_screen import MockScreen
+from pygame import Rect
+from pytest import raises, fixture, mark
 from os.path import join
+import sys
+
+# Marker for tests requiring asyncio.
+requires_asyncio = mark.skipif(
+    sys.version_info < (3, 5),
+    reason='requires asyncio')
 
 
 @fixture
@@ -25,6 +34,7 @@ def test_add_screen(surface):
     screenflow = ScreenFlow(surface)
     screenflow.add_screen(screen)
     assert screen.font_manager == screenflow._font_manager
+    assert screen.surface_factory == screenflow._surface_pool
     assert name in screenflow._screens.keys()
     assert screenflow._screens[name] == screen
     assert screenflow.foo == screen
@@ -67,6 +77,152 @@ def test_navigate_to(surface):
     assert screenflow._stack[1] == bar
 
 
+def test_preview_stats(surface):
+    """ Test case for preview cache statistics. """
+    screenflow = ScreenFlow(surface)
+    foo = MockScreen('foo')
+    foo.preview_hits = 2
+    bar = MockScreen('bar')
+    bar.preview_misses = 1
+    screenflow.add_screen(foo)
+    screenflow.add_screen(bar)
+    assert screenflow.preview_stats() == {'hits': 2, 'misses': 1}
+
+
+def test_render_stats(surface):
+    """ Test case for render cache statistics. """
+    screenflow = ScreenFlow(surface)
+    screenflow.add_screen(MockScreen('foo'))
+    screenflow.add_screen(MockScreen('bar'))
+    stats = screenflow.render_stats()
+    assert stats['cost'] == 200
+    assert stats['hits'] == 2
+    assert stats['screens'] == {'foo': 100, 'bar': 100}
+
+
+def test_pool_stats(surface):
+    """ Test case for steady state surface allocations. """
+    screenflow = ScreenFlow(surface)
+    screen = SelectScreen('foo', 'Test', ['Yes', 'No'])
+    screenflow.add_screen(screen)
+    screen.draw(surface)
+    allocations = screenflow.pool_stats()['allocations']
+    screen.message = 'Test'
+    for i in range(3):
+        screen.draw(surface)
+    stats = screenflow.pool_stats()
+    assert stats['allocations'] == allocations
+    assert stats['reuses'] > 0
+
+
+def test_get_fonts(surface):
+    """ Test case for fonts used by screens collection. """
+    screenflow = ScreenFlow(surface)
+    screenflow.add_screen(MockScreen('foo'))
+    screenflow.add_screen(MockScreen('bar'))
+    screenflow.load_style(join('tests', 'resources', 'test_style.css'))
+    fonts = screenflow.get_fonts()
+    assert len(fonts) == len(set(fonts))
+    assert len(fonts) >= 2
+
+
+def test_get_fonts_lazy(surface):
+    """ Test case for fonts used by lazily defined screens collection. """
+    file = join(RESOURCES_PATH, 'test_linked_screenflow.xml')
+    screenflow = ScreenFlow(surface)
+    screenflow.load_from_file(file, lazy=True)
+    screenflow.load_style(join('tests', 'resources', 'test_style.css'))
+    assert len(screenflow.get_fonts()) >= 1
+    assert len(screenflow._screens) == 0
+
+
+def test_predict(surface):
+    """ Test case for likely successors computation. """
+    screenflow = ScreenFlow(surface)
+    foo = MockScreen('foo')
+    bar = MockScreen('bar')
+    baz = MockScreen('baz')
+    for screen in (foo, bar, baz):
+        screenflow.add_screen(screen)
+    screenflow.link('foo', 'baz')
+    screenflow.link('foo', 'ghost')
+    assert screenflow.predict(foo) == ['baz']
+    screenflow._stack.append(foo)
+    screenflow.navigate_to(bar)
+    assert screenflow.predict(foo) == ['baz', 'bar']
+    assert screenflow.predict(bar) == ['foo']
+
+
+def test_idle_tasks(surface):
+    """ Test case for idle task scheduling. """
+    screenflow = ScreenFlow(surface)
+    steps = []
+
+    def task():
+        steps.append(True)
+        return len(steps) < 2
+    screenflow.schedule_idle(task)
+    screenflow.schedule_idle(task)
+    assert screenflow.run_idle_task()
+    assert not screenflow.run_idle_task()
+    assert not screenflow.run_idle_task()
+    assert len(steps) == 2
+
+
+def test_idle_tasks_turns(surface):
+    """ Test case for pending idle tasks taking turns. """
+    screenflow = ScreenFlow(surface)
+    steps = []
+
+    def foo():
+        steps.append('foo')
+        return True
+
+    def bar():
+        steps.append('bar')
+        return True
+    screenflow.schedule_idle(foo)
+    screenflow.schedule_idle(bar)
+    for i in range(4):
+        assert screenflow.run_idle_task()
+    assert steps == ['foo', 'bar', 'foo', 'bar']
+
+
+def test_wait_events_pacing(surface, monkeypatch):
+    """ Test case for loop pacing while idle tasks are pending. """
+    import screenflow.screenflow as module
+    screenflow = ScreenFlow(surface, max_fps=30)
+    ticks = []
+
+    class Clock(object):
+        """ Clock recording requested frame rates. """
+
+        def tick(self, framerate):
+            """ Records the given frame rate. """
+            ticks.append(framerate)
+    screenflow._clock = Clock()
+    monkeypatch.setattr(module, 'events', lambda: [])
+    screenflow.schedule_idle(lambda: True)
+    assert screenflow.wait_events() == []
+    assert ticks == [30]
+
+
+def test_activate_prefetch(surface):
+    """ Test case for prefetching on screen activation. """
+    screenflow = ScreenFlow(surface)
+    screenflow.enable_prefetch()
+    foo = MockScreen('foo')
+    foo.on_screen_activated = lambda: None
+    bar = MockScreen('bar')
+    screenflow.add_screen(foo)
+    screenflow.add_screen(bar)
+    screenflow.link('foo', 'bar')
+    screenflow.activate(foo)
+    while screenflow.run_idle_task():
+        continue
+    assert bar.preview_generated == 1
+
+
 def test_navigate_back_error(surface):
     """ Test case for navigating back error handling. """
     screenflow = ScreenFlow(surface)
@@ -87,9 +243,138 @@ def test_navigate_back(surface):
     assert screenflow._stack[0] == foo
 
 
-def test_main_loop():
-    """ Test case for the main loop. """
-    pass
+def test_loop_options(surface):
+    """ Test case for main loop options. """
+    screenflow = ScreenFlow(surface)
+    assert screenflow.max_fps == DEFAULT_MAX_FPS
+    assert screenflow.idle_mode == ScreenFlow.IDLE_WAIT
+    screenflow = ScreenFlow(surface, max_fps=0, idle_mode=ScreenFlow.IDLE_POLL)
+    assert screenflow.max_fps == 0
+    assert screenflow.idle_mode == ScreenFlow.IDLE_POLL
+
+
+def test_repair(surface):
+    """ Test case for damaged area redrawing. """
+    screenflow = ScreenFlow(surface)
+    screen = MessageScreen('foo', 'Test')
+    screenflow.add_screen(screen)
+    screenflow._stack.append(screen)
+    screenflow._state = ScreenFlow.ACTIVE
+    screenflow.draw()
+    del screenflow._damages[:]
+    screenflow.repair(screen)
+    assert screenflow._damages == []
+    clip = Rect(0, 0, 10, 10)
+    screen.damage(clip)
+    screenflow.repair(screen)
+    assert surface.clip is None
+    assert len(screenflow._damages) > 0
+    assert all(clip.contains(rect) for rect in screenflow._damages)
+
+
+def test_repair_whole_screen(surface):
+    """ Test case for whole screen redrawing. """
+    screenflow = ScreenFlow(surface)
+    screen = MessageScreen('foo', 'Test')
+    screenflow.add_screen(screen)
+    screenflow._stack.append(screen)
+    screenflow._state = ScreenFlow.ACTIVE
+    screen.damage()
+    screenflow.repair(screen)
+    assert surface.get_rect() in screenflow._damages
+
+
+def test_stats(surface):
+    """ Test case for frame statistics access. """
+    screenflow = ScreenFlow(surface)
+    with raises(AttributeError) as e:
+        screenflow.stats()
+    screenflow.enable_profiler()
+    assert screenflow.stats()['frames'] == 0
+    screenflow.disable_profiler()
+    with raises(AttributeError) as e:
+        screenflow.stats()
+
+
+def test_dispatch(surface):
+    """ Test case for synchronous callback dispatching. """
+    screenflow = ScreenFlow(surface)
+    screen = MockScreen('foo')
+    screenflow.add_screen(screen)
+    assert screen.dispatcher == screenflow.dispatch
+    assert screenflow.dispatch(lambda x: x + 1, 1) == 2
+
+
+@requires_asyncio
+def test_dispatch_awaitable_without_loop(surface):
+    """ Test case for awaitable callback dispatching outside of a loop. """
+    import asyncio
+    screenflow = ScreenFlow(surface)
+    loop = asyncio.new_event_loop()
+
+    def callback():
+        future = loop.create_future()
+        loop.call_soon(future.set_result, 'foo')
+        return future
+    screenflow._sync_loop = loop
+    assert screenflow.dispatch(callback) == 'foo'
+    loop.close()
+
+
+@requires_asyncio
+def test_run_async():
+    """ Test case for asynchronous main loop and callback failure. """
+    import asyncio
+    screenflow = ScreenFlow(max_fps=0, headless=True)
+    screen = MessageScreen('foo', 'Test')
+    screenflow.add_screen(screen)
+    loop = asyncio.new_event_loop()
+    pending = loop.create_future()
+    finished = screenflow.run_async(screen, loop=loop)
+    task = screenflow.dispatch(lambda: pending)
+    assert task in screenflow._tasks
+    loop.call_soon(pending.set_exception, ValueError('foo'))
+    with raises(ValueError):
+        loop.run_until_complete(finished)
+    assert not screenflow._running
+    assert screenflow._loop is None
+    loop.close()
+
+
+def test_main_loop(monkeypatch):
+    """ Test case for the main loop in both idle modes. """
+    import pygame
+    import screenflow.screenflow as module
+    waits = []
+
+    def wait_event(timeout):
+        waits.append(timeout)
+        assert len(waits) < 100
+        return pygame.event.wait(timeout)
+    monkeypatch.setattr(module, 'wait_event', wait_event)
+    for idle_mode in (ScreenFlow.IDLE_WAIT, ScreenFlow.IDLE_POLL):
+        del waits[:]
+        screenflow = ScreenFlow(
+            headless=True,
+            resolution=(64, 48),
+            idle_mode=idle_mode)
+        screenflow.idle_timeout = 10
+        screen = MessageScreen('foo', 'Test')
+        screenflow.add_screen(screen)
+        monkeypatch.setattr(screenflow, 'schedule_idle', lambda task: None)
+        start = screenflow.start
+
+        def start_and_quit(start_screen):
+            start(start_screen)
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        monkeypatch.setattr(screenflow, 'start', start_and_quit)
+        screenflow.run(screen)
+        assert not screenflow._running
+        if idle_mode == ScreenFlow.IDLE_WAIT:
+            assert waits[0] == 10
+        else:
+            assert waits == []
+        screenflow._events.release()
 
 
 def test_register_factory(surface):
@@ -162,6 +447,75 @@ def test_load_from_file_multiple(surface):
     assert isinstance(screenflow.bar, MessageScreen)
 
 
+def test_load_from_file_links(surface):
+    """ Test case for XML file loading with declared successors. """
+    file = join(RESOURCES_PATH, 'test_linked_screenflow.xml')
+    screenflow = check_xml_screenflow(surface, file)
+    assert screenflow.predict(screenflow.foo) == ['bar', 'baz']
+    assert screenflow.predict(screenflow.bar) == ['foo']
+    assert screenflow.predict(screenflow.baz) == []
+
+
+def test_load_from_file_lazy(surface):
+    """ Test case for XML file loading with lazy screen creation. """
+    file = join(RESOURCES_PATH, 'test_linked_screenflow.xml')
+    screenflow = ScreenFlow(surface)
+    screenflow.load_from_file(file, lazy=True)
+    assert len(screenflow._screens) == 0
+    assert screenflow.has_screen('bar')
+    foo = screenflow.foo
+    assert isinstance(foo, MessageScreen)
+    assert screenflow.foo is foo
+    assert list(screenflow._screens.keys()) == ['foo']
+    assert screenflow.predict(foo) == ['bar', 'baz']
+    assert list(screenflow._screens.keys()) == ['foo']
+    screenflow.bar
+    screenflow.baz
+    assert len(screenflow._screens) == 3
+    assert len(screenflow._definitions) == 0
+    with raises(AttributeError) as e:
+        screenflow.ghost
+
+
+def test_load_from_file_lazy_idle():
+    """ Test case for lazy screen creation kept by idle tasks. """
+    file = join(RESOURCES_PATH, 'test_linked_screenflow.xml')
+    screenflow = ScreenFlow(headless=True, resolution=(64, 48))
+    screenflow.load_from_file(file, lazy=True)
+    screenflow.start(screenflow.foo)
+    while screenflow.run_idle_task():
+        pass
+    assert list(screenflow._screens.keys()) == ['foo']
+    screenflow.enable_prefetch()
+    screenflow.activate(screenflow.foo)
+    while screenflow.run_idle_task():
+        pass
+    assert sorted(screenflow._screens.keys()) == ['bar', 'baz', 'foo']
+    screenflow._events.release()
+
+
+def test_release_screens(surface):
+    """ Test case for releasing caches of inactive screens. """
+    screenflow = ScreenFlow(surface)
+    screenflow.release_after = 2
+    foo = MockScreen('foo')
+    bar = MockScreen('bar')
+    baz = MockScreen('baz')
+    for screen in (foo, bar, baz):
+        screenflow.add_screen(screen)
+    screenflow._stack.append(foo)
+    screenflow.navigate_to(bar)
+    assert not screenflow.release_screens()
+    assert baz.caches_cleared == 0
+    screenflow.navigate_back()
+    screenflow.release_screens()
+    assert baz.caches_cleared == 1
+    assert bar.caches_cleared == 0
+    assert foo.caches_cleared == 0
+    screenflow.release_screens()
+    assert baz.caches_cleared == 1
+
+
 def test_load_from_not_existing_file(surface):
     """ Test case for XML file loading error handling (file not exists). """
     screenflow = ScreenFlow(surface)
@@ -185,11 +539,76 @@ def test_load_from_file_without_screen(surface):
         screenflow.load_from_file(file)
 
 
-def test_load_style():
+def test_load_style(surface):
     """ Test case for load style method. """
-    pass
+    screenflow = ScreenFlow(surface)
+    screenflow.load_style(join(RESOURCES_PATH, 'test_style.css'))
+    screenflow.load_from_file(
+        join(RESOURCES_PATH, 'test_multiple_screenflow.xml'))
+    style = screenflow._style_factory.get_style(screenflow.foo)
+    assert style.background_color == (0, 0, 0)
+    assert style.transition_duration == 300
+    assert style.transition_easing == 'linear'
+    style = screenflow._style_factory.get_style(screenflow.bar)
+    assert style.padding == 10
+    assert style.transition_duration == 500
+    fonts = screenflow._style_factory.get_font_styles(screenflow.bar)
+    assert fonts[0].size == 30
+
+
+def test_load_style_configures_screens(surface):
+    """ Test case for existing screens styling on style loading. """
+    screenflow = ScreenFlow(surface)
+    screenflow.load_from_file(
+        join(RESOURCES_PATH, 'test_multiple_screenflow.xml'))
+    bar = screenflow.bar
+    version = bar.version
+    screenflow.load_style(join(RESOURCES_PATH, 'test_style.css'))
+    assert bar.version != version
+    assert bar._style.padding == 10
+    version = bar.version
+    bar.configure_styles(screenflow._style_factory)
+    assert bar.version == version
+
+
+def test_check_styles(surface, tmpdir):
+    """ Test case for watched styles reloading. """
+    css = tmpdir.join('style.css')
+    css.write('#foo { padding: 10; }\n#bar { padding: 10; }\n')
+    screenflow = ScreenFlow(surface)
+    screenflow.load_from_file(
+        join(RESOURCES_PATH, 'test_multiple_screenflow.xml'))
+    screenflow.load_style(str(css), watch=True)
+    screenflow.watch_interval = 0
+    foo = screenflow.foo
+    bar = screenflow.bar
+    versions = (foo.version, bar.version)
+    assert not screenflow.check_styles()
+    css.write('#foo { padding: 10; }\n#bar { padding: 30; }\n')
+    css.setmtime(css.mtime() + 10)
+    assert screenflow.check_styles()
+    assert foo.version == versions[0]
+    assert bar.version != versions[1]
+    assert bar._style.padding == 30
+
+
+def test_load_style_from_not_existing_file(surface):
+    """ Test case for load style method with not existing file. """
+    screenflow = ScreenFlow(surface)
+    with raises(IOError) as e:
+        screenflow.load_style('ghost_file.css')
 
 
-def test_load_style_from_not_existing_file():
-    """ Test case for load style method with not existing file. """
-    pass
+def test_navigate_transition(surface):
+    """ Test case for transition properties used when navigating. """
+    screenflow = ScreenFlow(surface)
+    screenflow.load_style(join(RESOURCES_PATH, 'test_style.css'))
+    foo = MockScreen('foo')
+    bar = MockScreen('bar')
+    screenflow._stack.append(foo)
+    screenflow.navigate_to(bar)
+    assert screenflow._transition._duration == 500
+    screenflow.navigate_back()
+    assert screenflow._transition._duration == 500
+    screenflow.navigate_to(foo)
+    assert screenflow._transition._duration == 300
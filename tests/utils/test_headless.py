@@ -0,0 +1,22 @@
+#!/usr/bin/python
+
+""" Simple test suite for headless rendering helpers. """
+
+from pygame import display
+from screenflow.screenflow import ScreenFlow
+from screenflow.utils.headless import create_headless_surface, HEADLESS_DRIVER
+
+
+def test_create_headless_surface():
+    """ Test case for offscreen surface creation. """
+    surface = create_headless_surface((64, 48))
+    assert surface.get_size() == (64, 48)
+    assert display.get_driver() == HEADLESS_DRIVER
+    surface.fill((255, 0, 0))
+    assert surface.get_at((10, 10))[:3] == (255, 0, 0)
+
+
+def test_headless_screenflow():
+    """ Test case for headless screenflow surface. """
+    screenflow = ScreenFlow(headless=True, resolution=(64, 48))
+    assert screenflow.surface.get_size() == (64, 48)
@@ -0,0 +1,42 @@
+#!/usr/bin/python
+
+""" Simple test suite for HitIndex class. """
+
+from pygame import Rect
+from screenflow.utils.hit_index import HitIndex
+
+
+def test_find():
+    """ Test case for target lookup. """
+    index = HitIndex(cell_size=50)
+    index.add(Rect(0, 0, 100, 40), 'yes')
+    index.add(Rect(0, 60, 100, 40), 'no')
+    index.add(Rect(0, 0, 0, 10), 'empty')
+    assert len(index) == 2
+    assert index.find((10, 10)) == 'yes'
+    assert index.find((99, 39)) == 'yes'
+    assert index.find((50, 70)) == 'no'
+    assert index.find((50, 50)) is None
+    assert index.find((100, 10)) is None
+    assert index.find((-10, -10)) is None
+
+
+def test_find_overlap():
+    """ Test case for overlapping regions lookup. """
+    index = HitIndex()
+    index.add(Rect(0, 0, 200, 200), 'background')
+    index.add(Rect(50, 50, 20, 20), 'button')
+    assert index.find((60, 60)) == 'button'
+    assert index.find((10, 10)) == 'background'
+    index.clear()
+    assert len(index) == 0
+    assert index.find((60, 60)) is None
+
+
+def test_find_many():
+    """ Test case for lookup among many regions. """
+    index = HitIndex()
+    for i in range(500):
+        index.add(Rect(0, i * 10, 300, 10), i)
+    for i in range(0, 500, 7):
+        assert index.find((150, i * 10 + 5)) == i
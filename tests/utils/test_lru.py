@@ -0,0 +1,49 @@
+#!/usr/bin/python
+
+""" Test suite for LRUCache class. """
+
+from screenflow.utils.lru import LRUCache
+
+
+def test_get_put():
+    """ Test case for cache access. """
+    cache = LRUCache(10)
+    assert cache.get('foo') is None
+    cache.put('foo', 1, 4)
+    assert cache.get('foo') == 1
+    assert 'foo' in cache
+    assert cache.cost == 4
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['hit_rate'] == 0.5
+
+
+def test_eviction():
+    """ Test case for least recently used eviction. """
+    cache = LRUCache(10)
+    cache.put('foo', 1, 4)
+    cache.put('bar', 2, 4)
+    cache.get('foo')
+    cache.put('baz', 3, 4)
+    assert 'bar' not in cache
+    assert 'foo' in cache
+    assert cache.evictions == 1
+    assert cache.cost == 8
+    cache.put('huge', 4, 11)
+    assert 'huge' not in cache
+    assert len(cache) == 2
+
+
+def test_pop_clear():
+    """ Test case for entry removal. """
+    cache = LRUCache(10)
+    cache.put('foo', 1, 4)
+    cache.put('foo', 2, 6)
+    assert cache.cost == 6
+    assert cache.pop('foo') == 2
+    assert cache.pop('foo') is None
+    cache.put('bar', 1, 4)
+    cache.clear()
+    assert cache.cost == 0
+    assert len(cache) == 0
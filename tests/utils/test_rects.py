@@ -0,0 +1,45 @@
+#!/usr/bin/python
+
+""" Simple test suite for rectangle helpers. """
+
+from pygame import Rect
+from screenflow.utils.rects import merge_rects
+
+
+def test_merge_disjoint():
+    """ Test case for merging disjoint rectangles. """
+    rects = merge_rects([Rect(0, 0, 10, 10), Rect(20, 20, 10, 10)])
+    assert len(rects) == 2
+
+
+def test_merge_overlapping():
+    """ Test case for merging overlapping rectangles. """
+    rects = merge_rects([
+        Rect(0, 0, 10, 10),
+        Rect(50, 50, 10, 10),
+        Rect(5, 5, 10, 10)])
+    assert len(rects) == 2
+    assert Rect(0, 0, 15, 15) in rects
+
+
+def test_merge_chained():
+    """ Test case for merging rectangles which overlap through a third one. """
+    rects = merge_rects([
+        Rect(0, 0, 10, 10),
+        Rect(20, 0, 10, 10),
+        Rect(5, 0, 20, 5)])
+    assert rects == [Rect(0, 0, 30, 10)]
+
+
+def test_merge_bounds():
+    """ Test case for merging rectangles with clipping bounds. """
+    bounds = Rect(0, 0, 100, 100)
+    rects = merge_rects([Rect(90, 90, 20, 20), Rect(200, 200, 5, 5)], bounds)
+    assert rects == [Rect(90, 90, 10, 10)]
+
+
+def test_merge_full_update():
+    """ Test case for merging rectangles covering most of the bounds. """
+    bounds = Rect(0, 0, 100, 100)
+    rects = merge_rects([Rect(0, 0, 100, 50), Rect(0, 50, 100, 40)], bounds)
+    assert rects == [bounds]
@@ -0,0 +1,51 @@
+#!/usr/bin/python
+
+""" Test suite for SurfacePool class. """
+
+from screenflow.utils.surface_pool import SurfacePool
+
+
+def test_get_bucket():
+    """ Test case for size bucket computation. """
+    pool = SurfacePool(granularity=32)
+    assert pool.get_bucket((1, 1)) == (32, 32)
+    assert pool.get_bucket((32, 33)) == (32, 64)
+    assert pool.get_bucket((0, 100)) == (32, 128)
+
+
+def test_acquire_release():
+    """ Test case for surface reuse within a bucket. """
+    pool = SurfacePool()
+    surface = pool((100, 20))
+    assert surface.get_size() == (100, 20)
+    assert pool.allocations == 1
+    pool.release(surface)
+    assert pool.pooled_bytes == pool.get_cost(pool.get_bucket((100, 20)))
+    other = pool((110, 30))
+    assert other.get_size() == (110, 30)
+    assert pool.allocations == 1
+    assert pool.reuses == 1
+    assert pool.pooled_bytes == 0
+
+
+def test_exact_bucket_size():
+    """ Test case for requests matching a bucket size. """
+    pool = SurfacePool()
+    surface = pool((64, 32))
+    pool.release(surface)
+    assert pool((64, 32)) is surface
+
+
+def test_limit():
+    """ Test case for pool byte limit. """
+    pool = SurfacePool(limit=64 * 64 * 4)
+    first = pool((64, 64))
+    second = pool((64, 64))
+    pool.release(first)
+    pool.release(second)
+    assert pool.releases == 1
+    assert pool.discards == 1
+    assert pool.pooled_bytes == pool.limit
+    pool.clear()
+    assert pool.pooled_bytes == 0
+    assert pool.stats()['allocations'] == 2
@@ -0,0 +1,82 @@
+#!/usr/bin/python
+
+""" Test suite for line wrapping functions. """
+
+from screenflow.utils.wrapping import wrap, break_token, GREEDY, BALANCED
+from pytest import raises
+
+
+def sizer(text):
+    """ Monospace sizer with 10 pixels wide characters. """
+    return (len(text) * 10, 10)
+
+
+class KerningSizer(object):
+    """ Sizer whose character widths underestimate text width. """
+
+    def __call__(self, text):
+        """ Returns an overestimated text size. """
+        return (len(text) * 12, 10)
+
+    def width(self, text):
+        """ Returns exact text width. """
+        return len(text) * 10
+
+    def fits(self, text, surface_width):
+        """ Indicates if the given text fits the given width. """
+        return self(text)[0] < surface_width
+
+
+def test_wrap_fitting_line():
+    """ Test case for line that does not require wrapping. """
+    assert wrap('foo bar', sizer, 100) == ['foo bar']
+    assert wrap('', sizer, 100) == ['']
+
+
+def test_wrap_greedy():
+    """ Test case for greedy wrapping. """
+    lines = wrap('aaa bb cc dddd e', sizer, 80)
+    assert lines == ['aaa bb', 'cc dddd', 'e']
+
+
+def test_wrap_balanced():
+    """ Test case for minimum raggedness wrapping. """
+    text = 'aaa bb cc ddddd eeee ff'
+    greedy = ['aaa bb cc', 'ddddd', 'eeee ff']
+    balanced = ['aaa bb', 'cc ddddd', 'eeee ff']
+    assert wrap(text, sizer, 100, GREEDY) == greedy
+    assert wrap(text, sizer, 100, BALANCED) == balanced
+
+
+def test_wrap_unknown_mode():
+    """ Test case for unsupported wrapping mode. """
+    with raises(ValueError) as e:
+        wrap('aaa bbb', sizer, 50, 'foo')
+
+
+def test_break_token():
+    """ Test case for character breaking of too wide token. """
+    assert break_token('abcdefg', sizer, 35) == ['abc', 'def', 'g']
+    assert break_token('abc', sizer, 5) == ['a', 'b', 'c']
+    lines = wrap('foo http://example.com/path bar', sizer, 100)
+    assert all(sizer(line)[0] < 100 for line in lines)
+    assert ''.join(lines).replace(' ', '') == 'foohttp://example.com/pathbar'
+
+
+def test_break_token_exact_fit():
+    """ Test case for pieces checked against exact text width. """
+    measurer = KerningSizer()
+    pieces = break_token('abcdefgh', measurer, 50)
+    assert ''.join(pieces) == 'abcdefgh'
+    assert all(measurer.fits(piece, 50) for piece in pieces)
+    lines = wrap('ab abc', measurer, 35)
+    assert lines == ['ab', 'ab', 'c']
+
+
+def test_wrap_large_message():
+    """ Test case for multi kilobyte message wrapping. """
+    text = ' '.join(['word%d' % i for i in range(2000)])
+    for mode in (GREEDY, BALANCED):
+        lines = wrap(text, sizer, 300, mode)
+        assert ' '.join(lines) == text
+        assert all(sizer(line)[0] < 300 for line in lines)